@@ -1,15 +1,25 @@
 from . import bsm
 from .trading_session import (
+    SESSION_CODES,
     TradingSession,
     get_closing_time,
+    get_closing_times,
     get_current_session,
+    get_session_codes,
+    get_trade_dates,
     is_trading_hours,
+    is_trading_hours_array,
 )
 
 __all__ = [
+    "SESSION_CODES",
     "TradingSession",
     "get_closing_time",
+    "get_closing_times",
     "get_current_session",
+    "get_session_codes",
+    "get_trade_dates",
     "is_trading_hours",
+    "is_trading_hours_array",
     "bsm",
 ]
@@ -8,6 +8,12 @@ Black-Scholes モデルによるオプション評価モジュール
   - d2(s, k, t, r, sigma): d1 の値から d2 を計算します。
   - price_call(s, k, t, r, sigma): コールオプションの理論価格を計算します。
   - price_put(s, k, t, r, sigma): プットオプションの理論価格を計算します。
+  - price(s, k, t, r, sigma, div): 配列を受け取り、オプション価格をまとめて計算します。
+  - greeks(s, k, t, r, sigma, div): 価格と一次のグリークスを一度にまとめて計算します。
+  - price_from_d1 / greeks_from_d1: 事前に計算した中間値から価格・グリークスを計算する共通の計算部分です。
+  - higher_order_greeks(s, k, t, r, sigma): バンナ・ボルガ・チャーム・スピードをまとめて計算します。
+  - solve_implied_volatility(s, k, t, r, price, div): 価格の配列からインプライド・ボラティリティをまとめて求めます。
+  - price_black76 / greeks_black76 / solve_implied_volatility_black76: 先物価格を原資産とする Black-76 モデルで計算します。
 
 使用例:
     >>> import numpy as np
@@ -21,10 +27,17 @@ Black-Scholes モデルによるオプション評価モジュール
     >>> put_price = price_put(s, k, t, r, sigma)
 """
 
+from enum import IntEnum
+from typing import NamedTuple
+
 import numpy as np
-from scipy.optimize import fsolve
+from scipy.special import ndtr
 from scipy.stats import norm
 
+# インプライド・ボラティリティ探索範囲
+IV_LOWER_BOUND = 1e-6
+IV_UPPER_BOUND = 10.0
+
 
 def d1(s: float, k: float, t: float, r: float, sigma: float) -> float:
     """
@@ -67,6 +80,268 @@ def d2(s: float, k: float, t: float, r: float, sigma: float) -> float:
     return d1_value - sigma * np.sqrt(t)
 
 
+def option_sign(div) -> np.ndarray:
+    """
+    オプションの種類をオプションの符号（コール: 1、プット: -1）に変換します。
+
+    Args:
+        div (array_like): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        np.ndarray: オプションの符号
+    """
+    div = np.asarray(div)
+    if not np.isin(div, (1, 2)).all():
+        raise ValueError("divは1（プット）または2（コール）で指定してください。")
+    return np.where(div == 2, 1.0, -1.0)
+
+
+def _broadcast(
+    s, k, t, r, sigma, div
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    引数をブロードキャストし、float64 の配列とオプションの符号（コール: 1、プット: -1）に変換します。
+
+    Args:
+        s, k, t, r, sigma: スカラーまたは配列
+        div: オプションの種類（1: プット、2: コール）のスカラーまたは配列
+
+    Returns:
+        tuple: ブロードキャスト済みの s, k, t, r, sigma, phi
+    """
+    return np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (s, k, t, r, sigma)),
+        option_sign(div),
+    )
+
+
+def price(s, k, t, r, sigma, div) -> np.ndarray:
+    """
+    Black-Scholes モデルに基づき、オプションの理論価格を配列でまとめて計算します。
+
+    s, k, t, r, sigma, div はブロードキャストされるため、全限月・全行使価格のチェーンを
+    Python のループなしで評価できます。残存期間が 0 以下の要素は本質的価値を返します。
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 無リスク金利
+        sigma (array_like): ボラティリティ
+        div (array_like): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        np.ndarray: オプションの理論価格（全ての引数がスカラーの場合は np.float64）
+    """
+    s, k, t, r, sigma, phi = _broadcast(s, k, t, r, sigma, div)
+    m = _intermediates(s, k, t, r, sigma)
+    value = price_from_d1(
+        s, k, phi, m["d1"], m["sigma_sqrt_t"], m["k_discount"], m["expired"]
+    )
+    return value[()]
+
+
+class Greeks(NamedTuple):
+    """
+    オプション価格と一次のグリークス。配列を渡した場合は各フィールドが配列になります。
+
+    Attributes:
+        price: オプションの理論価格
+        delta: デルタ
+        gamma: ガンマ
+        vega: ベガ
+        theta: シータ（年率）
+    """
+
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+
+
+def _intermediates(s, k, t, r, sigma) -> dict[str, np.ndarray]:
+    """
+    価格・グリークスの計算で共通する中間値を一度だけ計算します。
+
+    残存期間が 0 以下の要素はダミーの残存期間 1 年で計算し、expired で判別できるようにします。
+
+    Returns:
+        dict: expired, t, sqrt_t, sigma_sqrt_t, d1, d2, k_discount をキーとする中間値
+    """
+    expired = t <= 0
+    t_live = np.where(expired, 1.0, t)
+    sqrt_t = np.sqrt(t_live)
+    sigma_sqrt_t = sigma * sqrt_t
+    d1_value = (np.log(s / k) + (r + 0.5 * sigma**2) * t_live) / sigma_sqrt_t
+    return {
+        "expired": expired,
+        "t": t_live,
+        "sqrt_t": sqrt_t,
+        "sigma_sqrt_t": sigma_sqrt_t,
+        "d1": d1_value,
+        "d2": d1_value - sigma_sqrt_t,
+        "k_discount": k * np.exp(-r * t_live),
+    }
+
+
+def price_from_d1(s, k, phi, d1_value, sigma_sqrt_t, k_discount, expired) -> np.ndarray:
+    """
+    d1 と原資産価格に依存しない中間値から、オプションの理論価格を計算します。
+
+    price のほか、原資産価格に依存しない値を事前に計算しておくプライサーやシナリオ評価から呼び出されます。
+    引数はブロードキャストされ、満期済みの要素は本質的価値を返します。
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        phi (array_like): オプションの符号（コール: 1、プット: -1）
+        d1_value (array_like): d1 の値
+        sigma_sqrt_t (array_like): sigma * sqrt(t)
+        k_discount (array_like): k * exp(-r * t)
+        expired (array_like): 残存期間が 0 以下の要素
+
+    Returns:
+        np.ndarray: オプションの理論価格
+    """
+    d2_value = d1_value - sigma_sqrt_t
+    value = phi * (s * ndtr(phi * d1_value) - k_discount * ndtr(phi * d2_value))
+    if np.any(expired):
+        value = np.where(expired, np.maximum(phi * (s - k), 0.0), value)
+    return value
+
+
+def greeks_from_d1(s, k, r, sigma, phi, d1_value, sqrt_t, k_discount, expired) -> Greeks:
+    """
+    d1 と原資産価格に依存しない中間値から、オプション価格とデルタ・ガンマ・ベガ・シータを計算します。
+
+    greeks のほか、原資産価格に依存しない値を事前に計算しておくプライサーから呼び出されます。
+    norm.pdf と累積分布関数 ndtr はそれぞれ一度だけ評価します。
+    満期済みの要素は本質的価値と、そのデルタ（ITM なら ±1、それ以外は 0）を返し、
+    その他のグリークスは 0 とします。
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        r (array_like): 無リスク金利
+        sigma (array_like): ボラティリティ
+        phi (array_like): オプションの符号（コール: 1、プット: -1）
+        d1_value (array_like): d1 の値
+        sqrt_t (array_like): sqrt(t)（満期済みの要素はダミーの残存期間の値）
+        k_discount (array_like): k * exp(-r * t)
+        expired (array_like): 残存期間が 0 以下の要素
+
+    Returns:
+        Greeks: 価格とグリークス
+    """
+    sigma_sqrt_t = sigma * sqrt_t
+    pdf_d1 = norm.pdf(d1_value)
+    cdf_d1, cdf_d2 = ndtr(phi * np.stack((d1_value, d1_value - sigma_sqrt_t)))
+
+    value = phi * (s * cdf_d1 - k_discount * cdf_d2)
+    delta_value = phi * cdf_d1
+    gamma_value = pdf_d1 / (s * sigma_sqrt_t)
+    vega_value = s * pdf_d1 * sqrt_t
+    theta_value = -s * pdf_d1 * sigma / (2 * sqrt_t) - phi * r * k_discount * cdf_d2
+
+    if np.any(expired):
+        intrinsic = phi * (s - k)
+        value = np.where(expired, np.maximum(intrinsic, 0.0), value)
+        delta_value = np.where(expired, np.where(intrinsic > 0, phi, 0.0), delta_value)
+        gamma_value = np.where(expired, 0.0, gamma_value)
+        vega_value = np.where(expired, 0.0, vega_value)
+        theta_value = np.where(expired, 0.0, theta_value)
+    return Greeks(value, delta_value, gamma_value, vega_value, theta_value)
+
+
+def greeks(s, k, t, r, sigma, div) -> Greeks:
+    """
+    オプション価格とデルタ・ガンマ・ベガ・シータを一度にまとめて計算します。
+
+    d1, d2 などの中間値を共有し、計算は greeks_from_d1 で行います。
+    残存期間が 0 以下の要素は本質的価値と、そのデルタ（ITM なら ±1、それ以外は 0）を返し、
+    その他のグリークスは 0 とします。
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 無リスク金利
+        sigma (array_like): ボラティリティ
+        div (array_like): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        Greeks: 価格とグリークス（全ての引数がスカラーの場合は各フィールドが np.float64）
+    """
+    s, k, t, r, sigma, phi = _broadcast(s, k, t, r, sigma, div)
+    m = _intermediates(s, k, t, r, sigma)
+    result = greeks_from_d1(
+        s, k, r, sigma, phi, m["d1"], m["sqrt_t"], m["k_discount"], m["expired"]
+    )
+    return Greeks(*(x[()] for x in result))
+
+
+class HigherOrderGreeks(NamedTuple):
+    """
+    高次のグリークス。配列を渡した場合は各フィールドが配列になります。
+
+    Attributes:
+        vanna: バンナ（デルタのボラティリティ感応度 = ベガの原資産価格感応度）
+        volga: ボルガ（ベガのボラティリティ感応度）
+        charm: チャーム（時間経過によるデルタの変化、年率）
+        speed: スピード（ガンマの原資産価格感応度）
+    """
+
+    vanna: np.ndarray
+    volga: np.ndarray
+    charm: np.ndarray
+    speed: np.ndarray
+
+
+def higher_order_greeks(s, k, t, r, sigma) -> HigherOrderGreeks:
+    """
+    バンナ・ボルガ・チャーム・スピードを解析式でまとめて計算します。
+
+    配当のない Black-Scholes モデルではコールとプットで同じ値になります。
+    charm は theta と同様に時間経過（残存期間の減少）に対する変化として計算します。
+
+    計算式:
+        vanna = -n(d1) * d2 / sigma
+        volga = s * n(d1) * sqrt(t) * d1 * d2 / sigma
+        charm = -n(d1) * (r / (sigma * sqrt(t)) - d2 / (2 * t))
+        speed = -n(d1) / (s^2 * sigma * sqrt(t)) * (d1 / (sigma * sqrt(t)) + 1)
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 無リスク金利
+        sigma (array_like): ボラティリティ
+
+    Returns:
+        HigherOrderGreeks: 高次のグリークス（満期済みの要素は 0）
+    """
+    s, k, t, r, sigma = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (s, k, t, r, sigma))
+    )
+    m = _intermediates(s, k, t, r, sigma)
+    pdf_d1 = norm.pdf(m["d1"])
+    gamma_value = pdf_d1 / (s * m["sigma_sqrt_t"])
+
+    vanna_value = -pdf_d1 * m["d2"] / sigma
+    volga_value = s * pdf_d1 * m["sqrt_t"] * m["d1"] * m["d2"] / sigma
+    charm_value = -pdf_d1 * (r / m["sigma_sqrt_t"] - m["d2"] / (2 * m["t"]))
+    speed_value = -gamma_value / s * (m["d1"] / m["sigma_sqrt_t"] + 1)
+
+    expired = m["expired"]
+    return HigherOrderGreeks(
+        *(
+            np.where(expired, 0.0, x)[()]
+            for x in (vanna_value, volga_value, charm_value, speed_value)
+        )
+    )
+
+
 def price_call(s: float, k: float, t: float, r: float, sigma: float) -> float:
     """
     Black-Scholes モデルに基づき、コールオプションの理論価格を計算します。
@@ -269,10 +544,137 @@ def theta(s: float, k: float, t: float, r: float, sigma: float, div: int) -> flo
     return {1: theta_put, 2: theta_call}[div](s, k, t, r, sigma)
 
 
+class IVStatus(IntEnum):
+    """インプライド・ボラティリティ計算の要素ごとの状態"""
+
+    CONVERGED = 0  # 収束
+    MAX_ITERATIONS = 1  # 最大反復回数に到達
+    BELOW_INTRINSIC = 2  # 価格が裁定下限（本質的価値）未満
+    ABOVE_UPPER_BOUND = 3  # 価格が裁定上限以上
+    EXPIRED = 4  # 残存期間が 0 以下
+    INVALID = 5  # 入力に NaN などの不正な値を含む
+
+
+class ImpliedVolatilityResult(NamedTuple):
+    """
+    インプライド・ボラティリティの一括計算結果。
+
+    Attributes:
+        sigma: インプライド・ボラティリティ（解が得られない要素は NaN）
+        converged: 収束したかどうか
+        status: IVStatus の値
+        iterations: 要した反復回数
+    """
+
+    sigma: np.ndarray
+    converged: np.ndarray
+    status: np.ndarray
+    iterations: np.ndarray
+
+
+def _price_vega(s, k, t, r, sigma, phi) -> tuple[np.ndarray, np.ndarray]:
+    """残存期間が正の要素について価格とベガを計算します。"""
+    m = _intermediates(s, k, t, r, sigma)
+    cdf_d1, cdf_d2 = norm.cdf(phi * np.stack((m["d1"], m["d2"])))
+    value = phi * (s * cdf_d1 - m["k_discount"] * cdf_d2)
+    return value, s * norm.pdf(m["d1"]) * m["sqrt_t"]
+
+
+def solve_implied_volatility(
+    s, k, t, r, price, div, tol: float = 1e-8, max_iter: int = 100
+) -> ImpliedVolatilityResult:
+    """
+    オプションの市場価格の配列からインプライド・ボラティリティをまとめて計算します。
+
+    初期値には Manaster-Koehler の値（ATM 付近では Brenner-Subrahmanyam の近似）を使い、
+    ブラケット [IV_LOWER_BOUND, IV_UPPER_BOUND] を保ったニュートン法で解きます。
+    ニュートンステップがブラケットの外に出る場合は二分法に切り替えます。
+    反復は未収束の要素だけに対して行います。
+
+    Args:
+        s (array_like): 現在の株価
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 無リスク金利
+        price (array_like): オプションの市場価格
+        div (array_like): オプションの種類（1: プット、2: コール）
+        tol (float): 価格差の収束判定値
+        max_iter (int): 最大反復回数
+
+    Returns:
+        ImpliedVolatilityResult: 要素ごとの IV、収束可否、状態、反復回数
+    """
+    s, k, t, r, price, phi = _broadcast(s, k, t, r, price, div)
+    shape = s.shape
+    s, k, t, r, price, phi = (x.ravel() for x in (s, k, t, r, price, phi))
+
+    sigma = np.full(s.size, np.nan)
+    status = np.full(s.size, IVStatus.MAX_ITERATIONS, dtype=np.int8)
+    iterations = np.zeros(s.size, dtype=np.int32)
+
+    # 裁定条件による価格の下限・上限
+    with np.errstate(invalid="ignore"):
+        k_discount = k * np.exp(-r * t)
+        lower = np.maximum(phi * (s - k_discount), 0.0)
+        upper = np.where(phi > 0, s, k_discount)
+        invalid = ~np.isfinite(s + k + t + r + price) | (s <= 0) | (k <= 0)
+        expired = ~invalid & (t <= 0)
+        below = ~invalid & ~expired & (price <= lower)
+        above = ~invalid & ~expired & (price >= upper)
+    status[invalid] = IVStatus.INVALID
+    status[expired] = IVStatus.EXPIRED
+    status[below] = IVStatus.BELOW_INTRINSIC
+    status[above] = IVStatus.ABOVE_UPPER_BOUND
+
+    idx = np.flatnonzero(~(invalid | expired | below | above))
+    s, k, t, r, price, phi = (x[idx] for x in (s, k, t, r, price, phi))
+    lo = np.full(idx.size, IV_LOWER_BOUND)
+    hi = np.full(idx.size, IV_UPPER_BOUND)
+    guess = np.sqrt(np.abs(np.log(s / k) + r * t) * 2 / t)
+    guess = np.where(
+        guess > IV_LOWER_BOUND, guess, np.sqrt(2 * np.pi / t) * price / s
+    )
+    vol = np.clip(guess, IV_LOWER_BOUND, IV_UPPER_BOUND)
+
+    for i in range(1, max_iter + 1):
+        if idx.size == 0:
+            break
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            model, vega_value = _price_vega(s, k, t, r, vol, phi)
+            diff = model - price
+            done = (np.abs(diff) <= tol) | (hi - lo <= tol * 1e-4)
+
+            # 価格は sigma について単調増加なのでブラケットを更新する
+            hi = np.where(diff > 0, vol, hi)
+            lo = np.where(diff < 0, vol, lo)
+            newton = vol - diff / vega_value
+            bisect = 0.5 * (lo + hi)
+            next_vol = np.where((newton > lo) & (newton < hi), newton, bisect)
+
+        sigma[idx[done]] = vol[done]
+        status[idx[done]] = IVStatus.CONVERGED
+        iterations[idx] = i
+
+        keep = ~done
+        idx = idx[keep]
+        s, k, t, r, price, phi = (x[keep] for x in (s, k, t, r, price, phi))
+        lo, hi, vol = lo[keep], hi[keep], next_vol[keep]
+
+    converged = status == IVStatus.CONVERGED
+    return ImpliedVolatilityResult(
+        sigma.reshape(shape)[()],
+        converged.reshape(shape)[()],
+        status.reshape(shape)[()],
+        iterations.reshape(shape)[()],
+    )
+
+
 def implied_volatility(s: float, k: float, t: float, r: float, price: float, div: int) -> float:
     """
     オプションの市場価格から暗示されるボラティリティを計算します。
 
+    solve_implied_volatility の薄いラッパーです。解が得られない場合は NaN を返します。
+
     Args:
         s (float): 現在の株価
         k (float): オプションの行使価格
@@ -284,11 +686,7 @@ def implied_volatility(s: float, k: float, t: float, r: float, price: float, div
     Returns:
         float: インプライド・ボラティリティ
     """
-    def find_volatility(sigma):
-        return {1: price_put, 2: price_call}[div](s, k, t, r, sigma) - price
-
-    sigma0 = np.sqrt(abs(np.log(s / k) + r * t) * 2 / t)
-    return fsolve(find_volatility, sigma0)[0]
+    return float(solve_implied_volatility(s, k, t, r, price, div).sigma)
 
 
 def implied_volatility_call(s: float, k: float, t: float, r: float, price: float) -> float:
@@ -323,3 +721,97 @@ def implied_volatility_put(s: float, k: float, t: float, r: float, price: float)
         float: プットオプションのインプライド・ボラティリティ
     """
     return implied_volatility(s, k, t, r, price, 1)
+
+
+def _discounted_futures(f, t, r) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Black-76 モデルを Black-Scholes モデルに帰着させるため、割引係数と先物価格を割り引いた値を返します。
+
+    Black-76 の d1 = (log(f / k) + 0.5 * sigma^2 * t) / (sigma * sqrt(t)) は、
+    s = f * exp(-r * t) とした Black-Scholes の d1 と一致します。満期済みの要素の割引係数は 1 です。
+
+    Returns:
+        tuple: 割引係数 exp(-r * t) と f * exp(-r * t)
+    """
+    discount = np.exp(-np.asarray(r) * np.maximum(np.asarray(t, dtype=np.float64), 0.0))
+    return discount, np.asarray(f, dtype=np.float64) * discount
+
+
+def price_black76(f, k, t, r, sigma, div) -> np.ndarray:
+    """
+    Black-76 モデルに基づき、先物を原資産とするオプションの理論価格を配列でまとめて計算します。
+
+    計算式:
+        Call Price = exp(-r * t) * (f * N(d1) - k * N(d2))
+        Put Price = exp(-r * t) * (k * N(-d2) - f * N(-d1))
+        d1 = (log(f / k) + 0.5 * sigma^2 * t) / (sigma * sqrt(t))
+
+    Args:
+        f (array_like): 先物価格
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 割引金利（連続複利、interpolate_interest_rate の値）
+        sigma (array_like): ボラティリティ
+        div (array_like): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        np.ndarray: オプションの理論価格（全ての引数がスカラーの場合は np.float64）
+    """
+    _, s = _discounted_futures(f, t, r)
+    return price(s, k, t, r, sigma, div)
+
+
+def greeks_black76(f, k, t, r, sigma, div) -> Greeks:
+    """
+    Black-76 モデルに基づき、オプション価格と先物価格に対するグリークスを一度にまとめて計算します。
+
+    s = f * exp(-r * t) とした greeks の結果を先物価格に対する感応度に変換します。
+        delta = exp(-r * t) * N(d1)（プットは exp(-r * t) * (N(d1) - 1)）
+        gamma = exp(-r * t) * n(d1) / (f * sigma * sqrt(t))
+        theta = greeks の theta + r * s * delta_s
+
+    Args:
+        f (array_like): 先物価格
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 割引金利（連続複利、interpolate_interest_rate の値）
+        sigma (array_like): ボラティリティ
+        div (array_like): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        Greeks: 価格とグリークス（全ての引数がスカラーの場合は各フィールドが np.float64）
+    """
+    t = np.asarray(t, dtype=np.float64)
+    discount, s = _discounted_futures(f, t, r)
+    result = greeks(s, k, t, r, sigma, div)
+    theta_value = np.where(t <= 0, 0.0, result.theta + r * s * result.delta)
+    return Greeks(
+        result.price,
+        (result.delta * discount)[()],
+        (result.gamma * discount**2)[()],
+        result.vega,
+        theta_value[()],
+    )
+
+
+def solve_implied_volatility_black76(
+    f, k, t, r, price, div, tol: float = 1e-8, max_iter: int = 100
+) -> ImpliedVolatilityResult:
+    """
+    Black-76 モデルに基づき、先物オプションの市場価格の配列からインプライド・ボラティリティをまとめて計算します。
+
+    Args:
+        f (array_like): 先物価格
+        k (array_like): オプションの行使価格
+        t (array_like): 残存期間（年単位）
+        r (array_like): 割引金利（連続複利、interpolate_interest_rate の値）
+        price (array_like): オプションの市場価格
+        div (array_like): オプションの種類（1: プット、2: コール）
+        tol (float): 価格差の収束判定値
+        max_iter (int): 最大反復回数
+
+    Returns:
+        ImpliedVolatilityResult: 要素ごとの IV、収束可否、状態、反復回数
+    """
+    _, s = _discounted_futures(f, t, r)
+    return solve_implied_volatility(s, k, t, r, price, div, tol, max_iter)
@@ -0,0 +1,268 @@
+"""
+Black-Scholes モデルのスカラー計算を低レイテンシで行うモジュール
+
+bsm モジュールの関数は scipy.stats.norm を経由するため、1 オプションの計算でも数十マイクロ秒かかります。
+このモジュールでは、正規分布の累積分布関数を math.erfc で計算するスカラー専用のカーネルを提供し、
+Numba がインストールされていればネイティブコードにコンパイルします。
+
+バックエンド:
+  - "numba": Numba の njit でコンパイルしたカーネルを使用します（Numba が必要）。
+  - "python": 同じカーネルを Python のまま実行します。
+  - "auto": Numba が利用可能なら "numba"、なければ "python" を使用します（デフォルト）。
+
+バックエンドは環境変数 JPX_DERIVATIVES_BSM_BACKEND でインポート時に指定するか、
+set_backend() で実行中に切り替えられます。
+Numba は `pip install "jpx-derivatives[jit]"` でインストールできます。
+
+コンパイル結果のキャッシュ:
+  デフォルトではプロセスごとにコンパイルし、ディスクには書き込みません。
+  環境変数 JPX_DERIVATIVES_BSM_JIT_CACHE=1 を設定すると Numba のディスクキャッシュ
+  （保存先は NUMBA_CACHE_DIR、未設定の場合はパッケージの __pycache__）を使用します。
+
+精度:
+  価格とグリークスは bsm の対応する関数と相対誤差 1e-10 以内で一致します。
+  インプライド・ボラティリティは価格差 1e-8 以内で収束し、bsm.solve_implied_volatility と
+  1e-8 以内で一致します。
+
+使用例:
+    >>> from jpx_derivatives import bsm_jit
+    >>> bsm_jit.set_backend("auto")
+    >>> call_price = bsm_jit.price(38790.0, 38750.0, 0.0247, 0.001, 0.2087, 2)
+"""
+
+import math
+import os
+
+from jpx_derivatives.bsm import IV_LOWER_BOUND, IV_UPPER_BOUND, Greeks
+
+BACKEND_ENV = "JPX_DERIVATIVES_BSM_BACKEND"
+JIT_CACHE_ENV = "JPX_DERIVATIVES_BSM_JIT_CACHE"
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+# 各カーネルは Numba でコンパイルできるよう math モジュールのみを使用し、
+# 標準正規分布の累積分布関数は N(x) = 0.5 * erfc(-x / sqrt(2)) で計算する
+
+
+def _price_kernel(
+    s: float, k: float, t: float, r: float, sigma: float, phi: float
+) -> float:
+    if t <= 0:
+        return max(phi * (s - k), 0.0)
+    sigma_sqrt_t = sigma * math.sqrt(t)
+    d1_value = (math.log(s / k) + (r + 0.5 * sigma * sigma) * t) / sigma_sqrt_t
+    d2_value = d1_value - sigma_sqrt_t
+    cdf_d1 = 0.5 * math.erfc(-phi * d1_value / _SQRT_2)
+    cdf_d2 = 0.5 * math.erfc(-phi * d2_value / _SQRT_2)
+    return phi * (s * cdf_d1 - k * math.exp(-r * t) * cdf_d2)
+
+
+def _greeks_kernel(
+    s: float, k: float, t: float, r: float, sigma: float, phi: float
+) -> tuple[float, float, float, float, float]:
+    if t <= 0:
+        intrinsic = phi * (s - k)
+        if intrinsic > 0:
+            return intrinsic, phi, 0.0, 0.0, 0.0
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    sqrt_t = math.sqrt(t)
+    sigma_sqrt_t = sigma * sqrt_t
+    d1_value = (math.log(s / k) + (r + 0.5 * sigma * sigma) * t) / sigma_sqrt_t
+    d2_value = d1_value - sigma_sqrt_t
+    k_discount = k * math.exp(-r * t)
+    pdf_d1 = math.exp(-0.5 * d1_value * d1_value) / _SQRT_2PI
+    cdf_d1 = 0.5 * math.erfc(-phi * d1_value / _SQRT_2)
+    cdf_d2 = 0.5 * math.erfc(-phi * d2_value / _SQRT_2)
+    value = phi * (s * cdf_d1 - k_discount * cdf_d2)
+    delta_value = phi * cdf_d1
+    gamma_value = pdf_d1 / (s * sigma_sqrt_t)
+    vega_value = s * pdf_d1 * sqrt_t
+    theta_value = -s * pdf_d1 * sigma / (2 * sqrt_t) - phi * r * k_discount * cdf_d2
+    return value, delta_value, gamma_value, vega_value, theta_value
+
+
+def _implied_volatility_kernel(
+    s: float,
+    k: float,
+    t: float,
+    r: float,
+    price: float,
+    phi: float,
+    tol: float,
+    max_iter: int,
+) -> float:
+    if not (t > 0 and s > 0 and k > 0):
+        return math.nan
+    k_discount = k * math.exp(-r * t)
+    lower = max(phi * (s - k_discount), 0.0)
+    upper = s if phi > 0 else k_discount
+    if not (lower < price < upper):
+        return math.nan
+
+    lo = IV_LOWER_BOUND
+    hi = IV_UPPER_BOUND
+    vol = math.sqrt(abs(math.log(s / k) + r * t) * 2 / t)
+    if vol <= IV_LOWER_BOUND:
+        vol = math.sqrt(2 * math.pi / t) * price / s
+    vol = min(max(vol, lo), hi)
+
+    sqrt_t = math.sqrt(t)
+    for _ in range(max_iter):
+        sigma_sqrt_t = vol * sqrt_t
+        d1_value = (math.log(s / k) + (r + 0.5 * vol * vol) * t) / sigma_sqrt_t
+        d2_value = d1_value - sigma_sqrt_t
+        cdf_d1 = 0.5 * math.erfc(-phi * d1_value / _SQRT_2)
+        cdf_d2 = 0.5 * math.erfc(-phi * d2_value / _SQRT_2)
+        diff = phi * (s * cdf_d1 - k_discount * cdf_d2) - price
+        if abs(diff) <= tol or hi - lo <= tol * 1e-4:
+            return vol
+        if diff > 0:
+            hi = vol
+        else:
+            lo = vol
+        vega_value = s * math.exp(-0.5 * d1_value * d1_value) / _SQRT_2PI * sqrt_t
+        newton = vol - diff / vega_value if vega_value > 0 else lo
+        vol = newton if lo < newton < hi else 0.5 * (lo + hi)
+    return math.nan
+
+
+def _compile(backend: str) -> tuple:
+    """指定されたバックエンドのカーネルを返します。"""
+    kernels = (_price_kernel, _greeks_kernel, _implied_volatility_kernel)
+    if backend == "python":
+        return kernels
+
+    import numba
+
+    # 読み取り専用の環境にインストールされている場合に備え、ディスクキャッシュは明示的に有効にした場合のみ使う
+    cache = os.environ.get(JIT_CACHE_ENV, "") == "1"
+    return tuple(numba.njit(cache=cache)(kernel) for kernel in kernels)
+
+
+def _numba_available() -> bool:
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def set_backend(backend: str = "auto") -> str:
+    """
+    計算に使用するバックエンドを切り替えます。
+
+    Args:
+        backend (str): "auto" / "numba" / "python"
+
+    Returns:
+        str: 実際に選択されたバックエンド名
+    """
+    global _backend, _price_impl, _greeks_impl, _implied_volatility_impl
+    if backend not in ("auto", "numba", "python"):
+        raise ValueError("backendは'auto' / 'numba' / 'python'のみ指定してください。")
+    if backend == "auto":
+        backend = "numba" if _numba_available() else "python"
+    elif backend == "numba" and not _numba_available():
+        raise ImportError("numbaバックエンドを使用するにはnumbaをインストールしてください。")
+    _price_impl, _greeks_impl, _implied_volatility_impl = _compile(backend)
+    _backend = backend
+    return backend
+
+
+def get_backend() -> str:
+    """
+    現在のバックエンド名を返します。
+
+    Returns:
+        str: "numba" または "python"
+    """
+    return _backend
+
+
+def _phi(div: int) -> float:
+    if div == 2:
+        return 1.0
+    if div == 1:
+        return -1.0
+    raise ValueError("divは1（プット）または2（コール）で指定してください。")
+
+
+def price(s: float, k: float, t: float, r: float, sigma: float, div: int) -> float:
+    """
+    オプションの理論価格を計算します。
+
+    Args:
+        s (float): 現在の株価
+        k (float): オプションの行使価格
+        t (float): 残存期間（年単位）
+        r (float): 無リスク金利
+        sigma (float): ボラティリティ
+        div (int): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        float: オプションの理論価格
+    """
+    return _price_impl(float(s), float(k), float(t), float(r), float(sigma), _phi(div))
+
+
+def greeks(s: float, k: float, t: float, r: float, sigma: float, div: int) -> Greeks:
+    """
+    オプション価格とデルタ・ガンマ・ベガ・シータを計算します。
+
+    Args:
+        s (float): 現在の株価
+        k (float): オプションの行使価格
+        t (float): 残存期間（年単位）
+        r (float): 無リスク金利
+        sigma (float): ボラティリティ
+        div (int): オプションの種類（1: プット、2: コール）
+
+    Returns:
+        Greeks: 価格とグリークス
+    """
+    return Greeks(
+        *_greeks_impl(float(s), float(k), float(t), float(r), float(sigma), _phi(div))
+    )
+
+
+def implied_volatility(
+    s: float,
+    k: float,
+    t: float,
+    r: float,
+    price: float,
+    div: int,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> float:
+    """
+    オプションの市場価格から暗示されるボラティリティを計算します。
+
+    Args:
+        s (float): 現在の株価
+        k (float): オプションの行使価格
+        t (float): 残存期間（年単位）
+        r (float): 無リスク金利
+        price (float): オプションの市場価格
+        div (int): オプションの種類（1: プット、2: コール）
+        tol (float): 価格差の収束判定値
+        max_iter (int): 最大反復回数
+
+    Returns:
+        float: インプライド・ボラティリティ（解が得られない場合は NaN）
+    """
+    return _implied_volatility_impl(
+        float(s),
+        float(k),
+        float(t),
+        float(r),
+        float(price),
+        _phi(div),
+        float(tol),
+        int(max_iter),
+    )
+
+
+_backend = ""
+set_backend(os.environ.get(BACKEND_ENV, "auto"))
@@ -0,0 +1,173 @@
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import requests
+
+from jpx_derivatives.config import setup_logging
+from jpx_derivatives.utils import atomic_write
+
+logger_name = setup_logging(__file__)
+logger = logging.getLogger(logger_name)
+
+# デフォルトのキャッシュディレクトリ
+default_cache_dir = Path.home() / ".cache" / "jpx_derivatives"
+
+
+class ParquetCache:
+    """リモートのparquetファイルをローカルディスクにキャッシュするクラス
+
+    - ttl秒以内に取得したファイルはネットワークにアクセスせずに返す
+    - ttlを過ぎた場合はETag / Last-Modifiedで再検証し、更新されていなければ再ダウンロードしない
+    - キャッシュの合計サイズがmax_bytesを超えた場合は最後に使用した時刻が古いものから削除する
+    - offline=Trueの場合はネットワークにアクセスせず、キャッシュのみを使用する
+    - 取得に失敗した場合、キャッシュがあれば古いキャッシュを返す
+
+    URLにhttp(s)以外（ローカルディレクトリのパス）を指定した場合は、
+    ファイルの更新時刻をLast-Modifiedとして同様にキャッシュする。
+
+    複数のプロセスで同じキャッシュディレクトリを共有できるよう、データとメタデータは
+    プロセスごとに異なる一時ファイルから置き換え、読み込めないメタデータはキャッシュなしとして扱う。
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl: float = 3600,
+        max_bytes: int = 256 * 1024**2,
+        offline: bool = False,
+        timeout: float = 30,
+    ):
+        """
+        Args:
+            cache_dir (str | Path, optional): キャッシュディレクトリ。指定しない場合は ~/.cache/jpx_derivatives
+            ttl (float, optional): 再検証せずにキャッシュを使う秒数
+            max_bytes (int, optional): キャッシュの合計サイズの上限
+            offline (bool, optional): Trueの場合はネットワークにアクセスしない
+            timeout (float, optional): HTTPリクエストのタイムアウト秒数
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.timeout = timeout
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()[:32]
+        name = url.rstrip("/").rsplit("/", 1)[-1]
+        return (
+            self.cache_dir / f"{key}-{name}",
+            self.cache_dir / f"{key}-{name}.json",
+        )
+
+    def fetch(self, url: str) -> Path:
+        """
+        URLのファイルをキャッシュから取得する。必要に応じてダウンロード・再検証する
+
+        Args:
+            url (str): ファイルのURLまたはローカルパス
+
+        Returns:
+            Path: キャッシュされたファイルのパス
+        """
+        data_path, meta_path = self._paths(url)
+        meta = {}
+        if data_path.exists():
+            meta = self._read_meta(meta_path)
+
+        if meta and (self.offline or time.time() - meta["fetched_at"] < self.ttl):
+            os.utime(data_path)
+            return data_path
+        if self.offline:
+            raise FileNotFoundError(f"オフラインモードでキャッシュがありません: {url}")
+
+        try:
+            if url.startswith(("http://", "https://")):
+                meta = self._fetch_http(url, data_path, meta)
+            else:
+                meta = self._fetch_local(url, data_path, meta)
+        except (requests.RequestException, OSError) as e:
+            if not meta:
+                raise
+            logger.warning(f"{url}の取得に失敗したため古いキャッシュを使用します: {e}")
+            os.utime(data_path)
+            return data_path
+
+        meta["url"] = url
+        meta["fetched_at"] = time.time()
+        self._write(meta_path, json.dumps(meta).encode())
+        os.utime(data_path)
+        self._evict(keep=data_path)
+        return data_path
+
+    def _fetch_http(self, url: str, data_path: Path, meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        response = requests.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            logger.debug(f"{url}は更新されていません")
+            return meta
+        response.raise_for_status()
+        self._write(data_path, response.content)
+        return {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    def _fetch_local(self, path: str, data_path: Path, meta: dict) -> dict:
+        last_modified = email.utils.formatdate(os.stat(path).st_mtime, usegmt=True)
+        if meta.get("last_modified") == last_modified:
+            return meta
+        with atomic_write(data_path) as tmp_path:
+            shutil.copyfile(path, tmp_path)
+        return {"etag": None, "last_modified": last_modified}
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> dict:
+        """メタデータを読み込む。ないか壊れている場合は空のdict（キャッシュなし）を返す"""
+        try:
+            meta = json.loads(meta_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"{meta_path}を読み込めないため再取得します: {e}")
+            return {}
+        if not isinstance(meta, dict) or not isinstance(meta.get("fetched_at"), (int, float)):
+            logger.warning(f"{meta_path}の内容が不正なため再取得します")
+            return {}
+        return meta
+
+    def _write(self, path: Path, content: bytes) -> None:
+        with atomic_write(path) as tmp_path:
+            tmp_path.write_bytes(content)
+
+    def _evict(self, keep: Path) -> None:
+        """合計サイズがmax_bytesを超えた場合、最後に使用した時刻が古いファイルから削除する"""
+        files = []
+        for p in self.cache_dir.iterdir():
+            if p.suffix in (".json", ".tmp") or not p.is_file():
+                continue
+            # 他のプロセスが削除したファイルは対象外とする
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((p, stat))
+        total = sum(stat.st_size for _, stat in files)
+        for p, stat in sorted(files, key=lambda item: item[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            total -= stat.st_size
+            p.unlink(missing_ok=True)
+            p.with_name(p.name + ".json").unlink(missing_ok=True)
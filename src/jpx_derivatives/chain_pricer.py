@@ -0,0 +1,141 @@
+import numpy as np
+
+from jpx_derivatives.bsm import Greeks, greeks_from_d1, option_sign
+
+
+class ChainPricer:
+    """オプションチェーンを原資産価格の更新だけで再評価するプライサー
+
+    行使価格・残存期間・金利・ボラティリティの組ごとに、log(k)、exp(-r * t)、sigma * sqrt(t) などの
+    原資産価格に依存しない値を事前に計算して保持する。
+    原資産価格の更新では d1 = log(s) / (sigma * sqrt(t)) + 定数 から価格とグリークスを計算し、
+    ボラティリティ・金利の更新では対象の行の事前計算値のみを再計算する。
+    """
+
+    def __init__(self, k, t, r, sigma, div):
+        """
+        Args:
+            k (array_like): 行使価格
+            t (array_like): 残存期間（年単位）
+            r (array_like): 無リスク金利
+            sigma (array_like): ボラティリティ
+            div (array_like): オプションの種類（1: プット、2: コール）
+        """
+        k, t, r, sigma, phi = (
+            np.array(x, dtype=np.float64).ravel()
+            for x in np.broadcast_arrays(k, t, r, sigma, option_sign(div))
+        )
+        self.k, self.t, self.r, self.sigma, self.phi = k, t, r, sigma, phi
+        self.size = k.size
+        self.s = None
+
+        self._log_k = np.log(k)
+        self._expired = np.empty(self.size, dtype=bool)
+        self._sqrt_t = np.empty(self.size)
+        self._inv_sigma_sqrt_t = np.empty(self.size)
+        self._d1_offset = np.empty(self.size)
+        self._k_discount = np.empty(self.size)
+        self._precompute(slice(None))
+
+        self._price = np.full(self.size, np.nan)
+        self._delta = np.full(self.size, np.nan)
+        self._gamma = np.full(self.size, np.nan)
+        self._vega = np.full(self.size, np.nan)
+        self._theta = np.full(self.size, np.nan)
+
+    def _precompute(self, rows) -> None:
+        """指定した行の原資産価格に依存しない値を計算する"""
+        t, r, sigma = self.t[rows], self.r[rows], self.sigma[rows]
+        expired = t <= 0
+        # 満期済みの行は計算用にダミーの残存期間を入れ、評価時に本質的価値で上書きする
+        t_live = np.where(expired, 1.0, t)
+        sqrt_t = np.sqrt(t_live)
+        sigma_sqrt_t = sigma * sqrt_t
+
+        self._expired[rows] = expired
+        self._sqrt_t[rows] = sqrt_t
+        self._inv_sigma_sqrt_t[rows] = 1.0 / sigma_sqrt_t
+        self._d1_offset[rows] = (
+            (r + 0.5 * sigma**2) * t_live - self._log_k[rows]
+        ) / sigma_sqrt_t
+        self._k_discount[rows] = self.k[rows] * np.exp(-r * t_live)
+
+    def _evaluate(self, rows) -> None:
+        """指定した行の価格とグリークスを現在の原資産価格で計算する"""
+        s = self.s
+        d1_value = np.log(s) * self._inv_sigma_sqrt_t[rows] + self._d1_offset[rows]
+        value, delta_value, gamma_value, vega_value, theta_value = greeks_from_d1(
+            s,
+            self.k[rows],
+            self.r[rows],
+            self.sigma[rows],
+            self.phi[rows],
+            d1_value,
+            self._sqrt_t[rows],
+            self._k_discount[rows],
+            self._expired[rows],
+        )
+
+        self._price[rows] = value
+        self._delta[rows] = delta_value
+        self._gamma[rows] = gamma_value
+        self._vega[rows] = vega_value
+        self._theta[rows] = theta_value
+
+    @property
+    def greeks(self) -> Greeks:
+        """
+        最新の価格とグリークス
+
+        各フィールドは内部の配列そのものであり、次の更新で上書きされる。
+        """
+        return Greeks(self._price, self._delta, self._gamma, self._vega, self._theta)
+
+    def update_spot(self, s: float) -> Greeks:
+        """
+        原資産価格を更新し、チェーン全体の価格とグリークスを再計算する
+
+        Args:
+            s (float): 原資産価格
+
+        Returns:
+            Greeks: 価格とグリークス
+        """
+        self.s = float(s)
+        self._evaluate(slice(None))
+        return self.greeks
+
+    def update_volatility(self, sigma, rows=None) -> Greeks:
+        """
+        ボラティリティを更新し、対象の行のみ再計算する
+
+        Args:
+            sigma (array_like): 新しいボラティリティ
+            rows (array_like, optional): 対象の行（インデックスまたはブール配列）。指定しない場合は全行
+
+        Returns:
+            Greeks: 価格とグリークス
+        """
+        return self._update(self.sigma, sigma, rows)
+
+    def update_rate(self, r, rows=None) -> Greeks:
+        """
+        金利を更新し、対象の行のみ再計算する
+
+        Args:
+            r (array_like): 新しい金利
+            rows (array_like, optional): 対象の行（インデックスまたはブール配列）。指定しない場合は全行
+
+        Returns:
+            Greeks: 価格とグリークス
+        """
+        return self._update(self.r, r, rows)
+
+    def _update(self, target: np.ndarray, values, rows) -> Greeks:
+        if rows is None:
+            rows = slice(None)
+        target[rows] = values
+        self._precompute(rows)
+        if self.s is not None:
+            self._evaluate(rows)
+        return self.greeks
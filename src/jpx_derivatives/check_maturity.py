@@ -1,7 +1,38 @@
 import datetime
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
+from jpx_derivatives.utils import to_datetime64
+
+
+_UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# 日本時間とUTCの差（ナノ秒）
+_JST_OFFSET_NS = 9 * 3600 * 10**9
+
+
+def _to_epoch_ns(dt: datetime.datetime) -> int:
+    """timezone付きのdatetimeをUNIX時間（ナノ秒）に変換する"""
+    return (dt - _UNIX_EPOCH) // datetime.timedelta(microseconds=1) * 1000
+
+
+class ContractDates(NamedTuple):
+    """
+    get_contract_dates_arrayの結果。各配列の形は (len(nth_contract_months),) + dt.shape
+
+    Attributes:
+        last_trading_day: 最終取引日時（日本時間の datetime64[ns]）
+        special_quotation_day: SQ日時（日本時間の datetime64[ns]）
+        contract_month: 限月（"2025-03", "2025-03-W5" など）
+        valid: 限月が存在する場合True。Falseの要素は NaT / None
+    """
+
+    last_trading_day: np.ndarray
+    special_quotation_day: np.ndarray
+    contract_month: np.ndarray
+    valid: np.ndarray
+
 
 class maturity_info_class:
     def __init__(self, sq_data: pd.DataFrame):
@@ -9,25 +40,19 @@ class maturity_info_class:
         sq_data: special_quotation.parquet
         """
         self.sq_data = sq_data.copy()
-        self.sq_data["LastTradingDay"] = pd.to_datetime(self.sq_data["LastTradingDay"])
+        self.sq_data["LastTradingDay"] = pd.to_datetime(
+            self.sq_data["LastTradingDay"]
+        ).dt.normalize()
+        # SQの時刻は9時
         self.sq_data["SpecialQuotationDay"] = pd.to_datetime(
             self.sq_data["SpecialQuotationDay"]
-        )
-        # SQの時刻は9時
-        self.sq_data["SpecialQuotationDay"] = self.sq_data["SpecialQuotationDay"].apply(
-            lambda x: x.replace(hour=9, minute=0, second=0)
-        )
+        ).dt.normalize() + pd.Timedelta(hours=9)
 
         # 取引時刻が2024/11/5に変更
-        self.sq_data["LastTradingDay"] = self.sq_data.apply(
-            lambda row: (
-                datetime.datetime.combine(row["LastTradingDay"], datetime.time(15, 15))
-                if row["LastTradingDay"] < datetime.datetime(2024, 11, 5)
-                else datetime.datetime.combine(
-                    row["LastTradingDay"], datetime.time(15, 45)
-                )
-            ),
-            axis=1,
+        self.sq_data["LastTradingDay"] = self.sq_data["LastTradingDay"] + np.where(
+            self.sq_data["LastTradingDay"] < datetime.datetime(2024, 11, 5),
+            np.timedelta64(15 * 60 + 15, "m"),
+            np.timedelta64(15 * 60 + 45, "m"),
         )
 
         # タイムゾーン情報を追加
@@ -39,7 +64,49 @@ class maturity_info_class:
             jst
         )
 
-        self.sq_data = self.sq_data.sort_values("LastTradingDay")
+        self.sq_data = self.sq_data.sort_values("LastTradingDay", kind="stable")
+        self.max_last_trading_day = self.sq_data["LastTradingDay"].max()
+
+        # monthly / weekly ごとに最終取引日時順の配列を事前に作成しておき、
+        # 検索はnp.searchsortedで行う
+        is_weekly = self.sq_data["ContractMonth"].str.contains("W").to_numpy()
+        # weeklyの場合は全て対象、第２週にWを付ける
+        weekly = self.sq_data.assign(
+            ContractMonth=np.where(
+                is_weekly,
+                self.sq_data["ContractMonth"],
+                self.sq_data["ContractMonth"] + "-W2",
+            )
+        )
+        self._views = {
+            "monthly": self._build_view(self.sq_data[~is_weekly]),
+            "weekly": self._build_view(weekly),
+        }
+
+    @staticmethod
+    def _build_view(sq_data: pd.DataFrame) -> dict:
+        frame = sq_data[
+            ["ContractMonth", "LastTradingDay", "SpecialQuotationDay"]
+        ].reset_index(drop=True)
+        last_trading_ns = pd.DatetimeIndex(frame["LastTradingDay"]).as_unit("ns").asi8
+        special_quotation_ns = (
+            pd.DatetimeIndex(frame["SpecialQuotationDay"]).as_unit("ns").asi8
+        )
+        return {
+            "frame": frame,
+            "last_trading_ns": last_trading_ns,
+            # 配列APIでは日本時間の datetime64[ns] で返す
+            "last_trading_jst": (last_trading_ns + _JST_OFFSET_NS).view(
+                "datetime64[ns]"
+            ),
+            "special_quotation_jst": (special_quotation_ns + _JST_OFFSET_NS).view(
+                "datetime64[ns]"
+            ),
+            "contract_month_array": frame["ContractMonth"].to_numpy(dtype=object),
+            "last_trading_days": frame["LastTradingDay"].tolist(),
+            "special_quotation_days": frame["SpecialQuotationDay"].tolist(),
+            "contract_months": frame["ContractMonth"].tolist(),
+        }
 
     def get_contract_dates(
         self,
@@ -65,38 +132,148 @@ class maturity_info_class:
             )
         # if dt < self.sq_data["LastTradingDay"].min():
         #    raise ValueError(f"dt={self.sq_data['LastTradingDay'].min()}以降のみ対応")
-        if dt > self.sq_data["LastTradingDay"].max():
-            raise ValueError(f"dt={self.sq_data['LastTradingDay'].max()}以前のみ対応")
+        if dt > self.max_last_trading_day:
+            raise ValueError(f"dt={self.max_last_trading_day}以前のみ対応")
         if contract_frequency not in ["monthly", "weekly"]:
             raise ValueError(
                 "contract_frequencyは'monthly' / 'weekly'のみ指定してください。"
             )
 
-        # monthly / weekly のフィルタ
-        if contract_frequency == "monthly":
-            sq_data = self.sq_data[
-                ~self.sq_data["ContractMonth"].str.contains("W")
-            ].copy()
-        else:
-            # weeklyの場合は全て対象
-            sq_data = self.sq_data.copy()
-            # weeklyの場合第２週にWを付ける
-            sq_data["ContractMonth"] = sq_data["ContractMonth"].apply(
-                lambda x: f"{x}-W2" if "W" not in x else x
-            )
-
+        view = self._views[contract_frequency]
+        last_trading_ns = view["last_trading_ns"]
         if 0 < nth_contract_month:
-            sq_data = sq_data[sq_data["LastTradingDay"] > dt]
+            # dtより後の最終取引日時のうちnth_contract_month番目
+            index = (
+                np.searchsorted(last_trading_ns, _to_epoch_ns(dt), side="right")
+                + nth_contract_month
+                - 1
+            )
         else:
-            # マイナス限月の場合逆順にする
-            sq_data = sq_data[sq_data["LastTradingDay"] < dt].sort_values(
-                "LastTradingDay", ascending=False
+            # マイナス限月の場合dtより前の最終取引日時を後ろから数える
+            index = (
+                np.searchsorted(last_trading_ns, _to_epoch_ns(dt), side="left")
+                + nth_contract_month
             )
 
-        if sq_data.shape[0] < abs(nth_contract_month):
+        if not 0 <= index < last_trading_ns.size:
             raise ValueError(f"{dt}の第{nth_contract_month}限月は存在しません")
 
-        lasttradingday = sq_data["LastTradingDay"].iloc[abs(nth_contract_month) - 1]
-        sqdate = sq_data["SpecialQuotationDay"].iloc[abs(nth_contract_month) - 1]
-        contractmonth = sq_data["ContractMonth"].iloc[abs(nth_contract_month) - 1]
+        lasttradingday = view["last_trading_days"][index]
+        sqdate = view["special_quotation_days"][index]
+        contractmonth = view["contract_months"][index]
         return lasttradingday, sqdate, contractmonth
+
+    def get_contract_dates_array(
+        self,
+        dt,
+        nth_contract_months,
+        contract_frequency: str,
+        errors: str = "raise",
+    ) -> ContractDates:
+        """
+        日時の配列と限月番号のリストに対して、get_contract_datesと同じ結果をまとめて返す
+
+        Args:
+            dt (array_like): 基準日時の配列（datetime64 配列など。timezoneがない場合は日本時間とみなす）
+            nth_contract_months (array_like): 限月番号のリスト（[1, 2, -1] など、0以外）
+            contract_frequency (str): "monthly" / "weekly"
+            errors (str): 限月が存在しない場合、"raise" はValueError、"coerce" は NaT / None を返す。
+                dtが NaT の要素は常に NaT / None を返す
+
+        Returns:
+            ContractDates: 最終取引日時・SQ日時・限月・有効フラグ。
+                各配列の形は (len(nth_contract_months),) + dt.shape
+        """
+        nth = np.atleast_1d(np.asarray(nth_contract_months, dtype=np.int64))
+        if nth.ndim != 1:
+            raise ValueError("nth_contract_monthsは1次元で指定してください。")
+        if (nth == 0).any():
+            raise ValueError(
+                "nth_contract_monthは0以外で指定してください。（マイナスも可）"
+            )
+        if contract_frequency not in ["monthly", "weekly"]:
+            raise ValueError(
+                "contract_frequencyは'monthly' / 'weekly'のみ指定してください。"
+            )
+        if errors not in ["raise", "coerce"]:
+            raise ValueError("errorsは'raise' / 'coerce'のみ指定してください。")
+
+        timestamps = to_datetime64(dt)
+        is_nat = np.isnat(timestamps)
+        keys = timestamps.astype(np.int64) - _JST_OFFSET_NS
+
+        view = self._views[contract_frequency]
+        last_trading_ns = view["last_trading_ns"]
+        nth = nth.reshape((-1,) + (1,) * timestamps.ndim)
+        index = np.where(
+            0 < nth,
+            np.searchsorted(last_trading_ns, keys, side="right") + nth - 1,
+            np.searchsorted(last_trading_ns, keys, side="left") + nth,
+        )
+        max_ns = _to_epoch_ns(self.max_last_trading_day.to_pydatetime())
+        valid = (
+            (0 <= index)
+            & (index < last_trading_ns.size)
+            & (keys <= max_ns)
+            & ~is_nat
+        )
+
+        if errors == "raise" and not (valid | is_nat).all():
+            nth_index, *position = np.argwhere(~(valid | is_nat))[0]
+            bad_dt = pd.Timestamp(timestamps[tuple(position)])
+            if bad_dt > self.max_last_trading_day.tz_localize(None):
+                raise ValueError(f"dt={self.max_last_trading_day}以前のみ対応")
+            raise ValueError(
+                f"{bad_dt}の第{nth.ravel()[nth_index]}限月は存在しません"
+            )
+
+        index = np.where(valid, index, 0)
+        last_trading_day = np.where(
+            valid, view["last_trading_jst"][index], np.datetime64("NaT", "ns")
+        )
+        special_quotation_day = np.where(
+            valid, view["special_quotation_jst"][index], np.datetime64("NaT", "ns")
+        )
+        contract_month = np.where(valid, view["contract_month_array"][index], None)
+        return ContractDates(last_trading_day, special_quotation_day, contract_month, valid)
+
+    def get_contract_schedule(
+        self,
+        dt: datetime.datetime,
+        count: int,
+        contract_frequency: str,
+    ) -> pd.DataFrame:
+        """
+        渡されたdtの第1〜第[count]限月の限月・最終取引日時・SQ日・SQまでの日数を一度にまとめて返す。
+        get_contract_datesをcount回呼ぶ代わりに、データの絞り込みを1回で済ませる。
+        dt: 基準日時
+        count: 取得する限月数
+        contract_frequency: "monthly" / "weekly"
+        return: ContractMonth, LastTradingDay, SpecialQuotationDay, RemainingDays列のデータフレーム
+        RemainingDaysはdtからSQ日時までの日数（金利の残存日数）
+        """
+        # timezoneがなければ付与
+        if dt.tzinfo is None:
+            jst = datetime.timezone(datetime.timedelta(hours=9))
+            dt = dt.replace(tzinfo=jst)
+        if count < 1:
+            raise ValueError("countは1以上で指定してください。")
+        if dt > self.max_last_trading_day:
+            raise ValueError(f"dt={self.max_last_trading_day}以前のみ対応")
+        if contract_frequency not in ["monthly", "weekly"]:
+            raise ValueError(
+                "contract_frequencyは'monthly' / 'weekly'のみ指定してください。"
+            )
+
+        view = self._views[contract_frequency]
+        start = np.searchsorted(
+            view["last_trading_ns"], _to_epoch_ns(dt), side="right"
+        )
+        if start + count > view["last_trading_ns"].size:
+            raise ValueError(f"{dt}の第{count}限月は存在しません")
+
+        schedule = view["frame"].iloc[start : start + count].reset_index(drop=True)
+        schedule["RemainingDays"] = (
+            schedule["SpecialQuotationDay"] - dt
+        ).dt.total_seconds() / 86400
+        return schedule
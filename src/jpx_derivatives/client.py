@@ -1,20 +1,41 @@
 import datetime
 import logging
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from pathlib import Path
+from typing import List, NamedTuple
 
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from duckdb import DuckDBPyRelation
 
+from jpx_derivatives.cache import ParquetCache
 from jpx_derivatives.check_maturity import maturity_info_class
-from jpx_derivatives.config import setup_logging
-from jpx_derivatives.get_interest_rate_torf import interpolate_interest_rate
+from jpx_derivatives.config import data_dir, setup_logging
+from jpx_derivatives.get_interest_rate_torf import InterestRatePanel, get_curve
+from jpx_derivatives.reference_bundle import get_bundle
+from jpx_derivatives.utils import atomic_write, to_datetime64
 
 # ロガーの設定
 logger_name = setup_logging(__file__)
 logger = logging.getLogger(logger_name)
 
+# Arrow IPCファイルのスキーマのメタデータに記録する変換元parquetファイルのサイズと更新時刻のキー
+_ARROW_SOURCE_SIZE_KEY = b"jpx_derivatives.source_size"
+_ARROW_SOURCE_MTIME_KEY = b"jpx_derivatives.source_mtime_ns"
+
+
+def _read_parquet(url: str, cache: ParquetCache = None) -> DuckDBPyRelation:
+    """parquetファイルを読み込む。キャッシュが設定されていればキャッシュを経由する"""
+    if cache is None:
+        return duckdb.read_parquet(url)
+    return duckdb.read_parquet(str(cache.fetch(url)))
+
 
 class StaticDataProviderBase(ABC):
     """静的データ（限月情報など）を提供する抽象基底クラス"""
@@ -46,6 +67,39 @@ class StaticDataProviderBase(ABC):
         """
         pass
 
+    def get_contract_schedule(self) -> pd.DataFrame:
+        """限月・取引最終年月日・SQ日・SQまでの日数をまとめて取得する
+
+        デフォルトでは get_contract_months, get_last_trading_days, get_special_quotation_days の結果から作成する。
+        まとめて取得できるプロバイダーはオーバーライドする。
+        RemainingDays は dt 属性（ない場合は現在時刻）からSQ日時までの日数とする。
+
+        Returns:
+            pd.DataFrame: ContractMonth, LastTradingDay, SpecialQuotationDay, RemainingDays列のデータフレーム
+        """
+        jst = datetime.timezone(datetime.timedelta(hours=9))
+        dt = getattr(self, "dt", None) or datetime.datetime.now()
+        # timezoneがなければ付与
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=jst)
+
+        schedule = pd.DataFrame(
+            {
+                "ContractMonth": self.get_contract_months(),
+                "LastTradingDay": pd.to_datetime(self.get_last_trading_days()),
+                "SpecialQuotationDay": pd.to_datetime(
+                    self.get_special_quotation_days()
+                ),
+            }
+        )
+        for column in ("LastTradingDay", "SpecialQuotationDay"):
+            if schedule[column].dt.tz is None:
+                schedule[column] = schedule[column].dt.tz_localize(jst)
+        schedule["RemainingDays"] = (
+            schedule["SpecialQuotationDay"] - dt
+        ).dt.total_seconds() / 86400
+        return schedule
+
     @abstractmethod
     def get_interest_rates(self) -> List[float]:
         """理論価格計算用金利リストを取得する
@@ -64,15 +118,18 @@ class HttpsStaticDataProvider(StaticDataProviderBase):
         product_count: int,
         dt: datetime.datetime = None,
         contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
     ):
         """
         Args:
             product_count (int): 限月数
             dt (datetime.datetime, optional): 日付。指定しない場合は現在の日付を使用
             contract_frequency (str, optional): 限月の取得頻度。デフォルトは "monthly"
+            cache (ParquetCache, optional): parquetファイルのローカルキャッシュ。指定しない場合は毎回取得する
         """
         self.product_count = product_count
         self.contract_frequency = contract_frequency
+        self.cache = cache
         if dt is None:
             self.dt = datetime.datetime.now()
         else:
@@ -83,17 +140,22 @@ class HttpsStaticDataProvider(StaticDataProviderBase):
         self.sq_url = f"{self.base_url}/special_quotation.parquet"
         self.interest_rate_url = f"{self.base_url}/interest_rate_torf.parquet"
         yyyymmdd = f"{self.dt:%Y-%m-%d}"
-        special_quotation = duckdb.read_parquet(self.sq_url)
+        special_quotation = self._read_parquet(self.sq_url)
         self.sq_data = self._fetch_sq_data(
             special_quotation, yyyymmdd, self.contract_frequency
         )
         # 限月関連クラス
         self.maturity_class = maturity_info_class(self.sq_data)
+        self._contract_schedule = None
 
         # 金利
-        interest_rate = duckdb.read_parquet(self.interest_rate_url)
+        interest_rate = self._read_parquet(self.interest_rate_url)
         self.interest_rate = self._fetch_interest_rate(interest_rate, yyyymmdd)
 
+    def _read_parquet(self, url: str) -> DuckDBPyRelation:
+        """parquetファイルを読み込む。キャッシュが設定されていればキャッシュを経由する"""
+        return _read_parquet(url, self.cache)
+
     def _fetch_sq_data(self, special_quotation, yyyymmdd, contract_frequency):
         """限月データを取得する共通メソッド
 
@@ -152,29 +214,22 @@ class HttpsStaticDataProvider(StaticDataProviderBase):
 
         return result_dict
 
+    def get_contract_schedule(self) -> pd.DataFrame:
+        # 初回のみ計算し、以降は同じ結果を返す
+        if self._contract_schedule is None:
+            self._contract_schedule = self.maturity_class.get_contract_schedule(
+                self.dt, self.product_count, self.contract_frequency
+            )
+        return self._contract_schedule
+
     def get_contract_months(self) -> List[str]:
-        return [
-            self.maturity_class.get_contract_dates(self.dt, i, self.contract_frequency)[
-                2
-            ]
-            for i in range(1, self.product_count + 1)
-        ]
+        return self.get_contract_schedule()["ContractMonth"].tolist()
 
     def get_last_trading_days(self) -> List[datetime.datetime]:
-        return [
-            self.maturity_class.get_contract_dates(self.dt, i, self.contract_frequency)[
-                0
-            ]
-            for i in range(1, self.product_count + 1)
-        ]
+        return self.get_contract_schedule()["LastTradingDay"].tolist()
 
     def get_special_quotation_days(self) -> List[datetime.datetime]:
-        return [
-            self.maturity_class.get_contract_dates(self.dt, i, self.contract_frequency)[
-                1
-            ]
-            for i in range(1, self.product_count + 1)
-        ]
+        return self.get_contract_schedule()["SpecialQuotationDay"].tolist()
 
     def get_interest_rates(self, remaining_days: list[float]) -> List[float]:
         """
@@ -183,69 +238,302 @@ class HttpsStaticDataProvider(StaticDataProviderBase):
         if self.product_count != len(remaining_days):
             raise ValueError("remaining_daysはproduct_countと同じ要素数を入れる")
 
-        interest_rates = interpolate_interest_rate(self.interest_rate, remaining_days)
-        return list(interest_rates.values())
+        return get_curve(self.interest_rate).continuous_rate(remaining_days).tolist()
 
 
 class GitHubStaticDataProvider(HttpsStaticDataProvider):
     """GitHubリポジトリから静的データを取得するプロバイダー"""
 
+    BASE_URL = "https://github.com/fin-py/jpx-derivatives/raw/refs/heads/main/data"
+
     def __init__(
         self,
         product_count: int,
         dt: datetime.datetime = None,
         contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
     ):
-        super().__init__(product_count, dt, contract_frequency)
-        self.set_data(
-            "https://github.com/fin-py/jpx-derivatives/raw/refs/heads/main/data"
-        )
+        super().__init__(product_count, dt, contract_frequency, cache)
+        self.set_data(self.BASE_URL)
 
 
 class CloudflareR2StaticDataProvider(HttpsStaticDataProvider):
     """Cloudflare R2(public)から静的データを取得するプロバイダー"""
 
+    BASE_URL = "https://jpx-derivatives-public.quokka.trade"
+
+    def __init__(
+        self,
+        product_count: int,
+        dt: datetime.datetime = None,
+        contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
+    ):
+        super().__init__(product_count, dt, contract_frequency, cache)
+        self.set_data(self.BASE_URL)
+
+
+class LocalStaticDataProvider(HttpsStaticDataProvider):
+    """ローカルディレクトリのparquetファイルから静的データを取得するプロバイダー
+
+    ディレクトリに最新の参照データバンドルがある場合はバンドルから読み込む。
+    memory_map=Trueの場合、parquetファイルを初回のみ非圧縮のArrow IPC（Feather V2）ファイルに変換し、
+    以降はメモリマップで読み込む。複数のプロセスで同じページを共有でき、parquetの展開処理も不要になる。
+    parquetファイルが更新された場合は再変換する。
+    """
+
     def __init__(
         self,
         product_count: int,
         dt: datetime.datetime = None,
         contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
+        directory: str = None,
+        memory_map: bool = False,
+        arrow_dir: str = None,
     ):
+        """
+        Args:
+            product_count (int): 限月数
+            dt (datetime.datetime, optional): 日付。指定しない場合は現在の日付を使用
+            contract_frequency (str, optional): 限月の取得頻度。デフォルトは "monthly"
+            cache (ParquetCache, optional): ローカルのファイルを読むため指定できない（Clientとの互換のための引数）
+            directory (str, optional): parquetファイルのディレクトリ。指定しない場合はパッケージのdataディレクトリ
+            memory_map (bool, optional): Trueの場合はArrow IPCファイルに変換してメモリマップで読み込む
+            arrow_dir (str, optional): Arrow IPCファイルの保存先。指定しない場合は directory / "arrow"
+        """
+        if cache is not None:
+            raise ValueError(
+                "LocalStaticDataProviderはローカルのファイルを読むためcacheは指定できません。"
+            )
         super().__init__(product_count, dt, contract_frequency)
-        self.set_data("https://jpx-derivatives-public.quokka.trade")
+        self.directory = Path(directory) if directory is not None else data_dir
+        self.memory_map = memory_map
+        self.arrow_dir = (
+            Path(arrow_dir) if arrow_dir is not None else self.directory / "arrow"
+        )
+        self.set_data(str(self.directory))
+
+    def _read_parquet(self, url: str) -> DuckDBPyRelation:
+        """parquetファイルを読み込む。memory_map=Trueの場合はArrow IPCファイルをメモリマップで読み込む"""
+        path = Path(url)
+        bundle = get_bundle(self.directory)
+        if bundle is not None and bundle.is_fresh(path.stem, path):
+            return duckdb.from_arrow(bundle.table(path.stem))
+        if not self.memory_map:
+            return duckdb.read_parquet(url)
+        return duckdb.from_arrow(_memory_mapped_table(path, self.arrow_dir))
+
+
+def _memory_mapped_table(parquet_path: Path, arrow_dir: Path) -> pa.Table:
+    """
+    parquetファイルを非圧縮のArrow IPCファイルに変換し（未変換・更新された場合のみ）、メモリマップで読み込む
+
+    変換元のparquetファイルのサイズと更新時刻（ナノ秒）をArrow IPCファイルのスキーマのメタデータに記録し、
+    いずれかが異なる場合（同じ時刻での書き換えや、より古いファイルへの置き換えを含む）は変換し直す。
+
+    Args:
+        parquet_path (Path): parquetファイルのパス
+        arrow_dir (Path): Arrow IPCファイルの保存先
+
+    Returns:
+        pa.Table: メモリマップされたテーブル
+    """
+    arrow_path = arrow_dir / parquet_path.with_suffix(".arrow").name
+    stat = parquet_path.stat()
+    source = {
+        _ARROW_SOURCE_SIZE_KEY: str(stat.st_size).encode(),
+        _ARROW_SOURCE_MTIME_KEY: str(stat.st_mtime_ns).encode(),
+    }
+    if _arrow_source(arrow_path) != source:
+        arrow_dir.mkdir(parents=True, exist_ok=True)
+        table = pq.read_table(parquet_path)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source})
+        with atomic_write(arrow_path) as tmp_path:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        logger.info(f"{parquet_path}を{arrow_path}に変換しました")
+    with pa.memory_map(str(arrow_path), "r") as f:
+        return pa.ipc.open_file(f).read_all()
+
+
+def _arrow_source(arrow_path: Path) -> dict[bytes, bytes] | None:
+    """Arrow IPCファイルに記録された変換元のサイズと更新時刻。ないか読み込めない場合はNone"""
+    try:
+        with pa.memory_map(str(arrow_path), "r") as f:
+            metadata = pa.ipc.open_file(f).schema.metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+    return {
+        key: metadata.get(key)
+        for key in (_ARROW_SOURCE_SIZE_KEY, _ARROW_SOURCE_MTIME_KEY)
+    }
+
+
+class _SourceResult(NamedTuple):
+    """_load_from_sourcesの結果"""
+
+    source: str
+    value: object
+    latencies: dict[str, float]
+    errors: dict[str, Exception]
+
+
+def _default_sources() -> dict[str, str]:
+    """静的データの取得元の名前とベースURL（優先順）"""
+    return {
+        "r2": CloudflareR2StaticDataProvider.BASE_URL,
+        "github": GitHubStaticDataProvider.BASE_URL,
+    }
+
+
+def _load_from_sources(
+    sources: dict[str, str],
+    load,
+    hedge_delay: float = None,
+    timeout: float = None,
+) -> _SourceResult:
+    """
+    取得元を優先順に試し、最初に成功した取得元での load(base_url) の結果を返す
+
+    hedge_delayを指定した場合は、前の取得元の開始からhedge_delay秒経っても完了していなければ
+    次の取得元も並行して開始し、先に成功した方を使用する（0の場合は同時に開始する）。
+
+    Args:
+        sources (dict[str, str]): 取得元の名前とベースURL（優先順）
+        load (Callable[[str], object]): ベースURLからデータを読み込む関数
+        hedge_delay (float, optional): 次の取得元を並行して開始するまでの秒数。
+            指定しない場合は前の取得元が失敗するまで開始しない
+        timeout (float, optional): 取得元ごとのタイムアウト秒数。超えた場合は失敗として扱う
+
+    Returns:
+        _SourceResult: 使用した取得元と読み込んだデータ、取得元ごとの所要時間とエラー
+            （失敗した取得元は失敗までの時間、タイムアウトした取得元はタイムアウトまでの時間）
+
+    Raises:
+        RuntimeError: 全ての取得元で失敗した場合
+    """
+    latencies: dict[str, float] = {}
+    errors: dict[str, Exception] = {}
+    results = queue.Queue()
+
+    def run(name: str, base_url: str, started: float):
+        try:
+            results.put((name, load(base_url), None, time.perf_counter() - started))
+        except Exception as e:
+            results.put((name, None, e, time.perf_counter() - started))
+
+    pending = list(sources.items())
+    running: dict[str, float] = {}
+    last_launch = 0.0
+
+    def launch():
+        nonlocal last_launch
+        name, base_url = pending.pop(0)
+        logger.debug(f"Trying to use {name}: {base_url}")
+        last_launch = time.perf_counter()
+        running[name] = last_launch
+        # 応答しない取得元でプロセスの終了が妨げられないようdaemonスレッドで実行する
+        threading.Thread(
+            target=run,
+            args=(name, base_url, last_launch),
+            name=f"jpx_derivatives-static-{name}",
+            daemon=True,
+        ).start()
+
+    launch()
+    while running:
+        deadlines = []
+        if pending and hedge_delay is not None:
+            deadlines.append(last_launch + hedge_delay)
+        if timeout is not None:
+            deadlines.append(min(running.values()) + timeout)
+        wait = max(min(deadlines) - time.perf_counter(), 0.0) if deadlines else None
+        try:
+            name, value, error, elapsed = results.get(timeout=wait)
+        except queue.Empty:
+            now = time.perf_counter()
+            for name, started in list(running.items()):
+                if timeout is not None and now - started >= timeout:
+                    del running[name]
+                    latencies[name] = now - started
+                    errors[name] = TimeoutError(f"{timeout}秒以内に取得できませんでした")
+                    logger.info(f"Timed out using {name}")
+            if pending and (
+                not running
+                or (hedge_delay is not None and now >= last_launch + hedge_delay)
+            ):
+                launch()
+            continue
+
+        if name not in running:
+            # タイムアウト後に返ってきた結果は使用しない
+            continue
+        del running[name]
+        latencies[name] = elapsed
+        if error is None:
+            logger.info(f"Using {name} ({elapsed:.3f}s)")
+            return _SourceResult(name, value, latencies, errors)
+        errors[name] = error
+        logger.info(f"Failed to use {name}: {error}. Falling back to next source")
+        if pending:
+            launch()
+
+    raise RuntimeError(
+        f"全ての取得元で静的データの取得に失敗しました: {errors}"
+    ) from list(errors.values())[-1]
 
 
 class AutoStaticDataProvider(StaticDataProviderBase):
-    """r2を優先して使用し、例外が発生した場合はgithubにフォールバックするプロバイダー"""
+    """r2を優先して使用し、例外が発生した場合はgithubにフォールバックするプロバイダー
+
+    hedge_delayを指定した場合は、r2の取得開始からhedge_delay秒経っても完了していなければ
+    githubの取得も開始し、先に成功した方を使用する（0の場合は同時に開始する）。
+    各取得元の所要時間はlatencies（失敗した取得元は失敗までの時間、タイムアウトした取得元はタイムアウトまでの時間）、
+    失敗の内容はerrors、使用した取得元はsourceで確認できる。
+    """
 
     def __init__(
         self,
         product_count: int,
         dt: datetime.datetime = None,
         contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
+        hedge_delay: float = None,
+        timeout: float = None,
+        sources: dict[str, str] = None,
     ):
         """
         Args:
             product_count (int): 限月数
             dt (datetime.datetime, optional): 日付。指定しない場合は現在の日付を使用
             contract_frequency (str, optional): 限月の取得頻度。デフォルトは "monthly"
+            cache (ParquetCache, optional): parquetファイルのローカルキャッシュ
+            hedge_delay (float, optional): 次の取得元を並行して開始するまでの秒数。
+                指定しない場合は前の取得元が失敗するまで開始しない
+            timeout (float, optional): 取得元ごとのタイムアウト秒数。超えた場合は失敗として扱う
+            sources (dict[str, str], optional): 取得元の名前とベースURL（優先順）。
+                指定しない場合は r2, github の順
         """
         self.product_count = product_count
+        if dt is None:
+            dt = datetime.datetime.now()
+        if sources is None:
+            sources = _default_sources()
 
-        # まずr2を試す
-        try:
-            logger.debug("Trying to use CloudflareR2StaticDataProvider")
-            self.provider = CloudflareR2StaticDataProvider(
-                product_count, dt, contract_frequency
-            )
-        except Exception as e:
-            # 例外が発生した場合はgithubにフォールバック
-            logger.info(
-                f"Failed to use CloudflareR2StaticDataProvider: {e}. Falling back to GitHubStaticDataProvider"
-            )
-            self.provider = GitHubStaticDataProvider(
-                product_count, dt, contract_frequency
+        def load(base_url: str) -> HttpsStaticDataProvider:
+            provider = HttpsStaticDataProvider(
+                product_count, dt, contract_frequency, cache
             )
+            provider.set_data(base_url)
+            return provider
+
+        result = _load_from_sources(sources, load, hedge_delay, timeout)
+        self.latencies: dict[str, float] = result.latencies
+        self.errors: dict[str, Exception] = result.errors
+        self.source: str = result.source
+        self.provider = result.value
 
     def get_contract_months(self) -> List[str]:
         return self.provider.get_contract_months()
@@ -256,6 +544,9 @@ class AutoStaticDataProvider(StaticDataProviderBase):
     def get_special_quotation_days(self) -> List[datetime.datetime]:
         return self.provider.get_special_quotation_days()
 
+    def get_contract_schedule(self) -> pd.DataFrame:
+        return self.provider.get_contract_schedule()
+
     def get_interest_rates(self, remaining_days: list[float]) -> List[float]:
         """
         remaining_days: 取得したい金利の残存日数 [15.3, 45.3, 75.3]など
@@ -263,6 +554,147 @@ class AutoStaticDataProvider(StaticDataProviderBase):
         return self.provider.get_interest_rates(remaining_days)
 
 
+class BacktestSchedule(NamedTuple):
+    """
+    BacktestClient.get_scheduleの結果。各配列の形は (product_count,) + dt.shape
+
+    Attributes:
+        contract_month: 第1〜第product_count限月（"2025-03", "2025-03-W5" など）
+        last_trading_day: 最終取引日時（日本時間の datetime64[ns]）
+        special_quotation_day: SQ日時（日本時間の datetime64[ns]）
+        remaining_days: 評価日時からSQ日時までの日数（金利の残存日数）
+        interest_rate: 残存日数に合わせて補間した連続複利の金利
+        valid: 限月と金利がある場合True
+    """
+
+    contract_month: np.ndarray
+    last_trading_day: np.ndarray
+    special_quotation_day: np.ndarray
+    remaining_days: np.ndarray
+    interest_rate: np.ndarray
+    valid: np.ndarray
+
+
+class BacktestClient:
+    """複数の評価日時の限月・SQ日・金利をまとめて返すバックテスト用クライアント
+
+    特殊清算指数（SQ）と金利のparquetファイルを初期化時に1回だけ読み込み、
+    評価日時の配列に対する限月・最終取引日時・SQ日時・金利を配列でまとめて計算する。
+    """
+
+    def __init__(
+        self,
+        product_count: int,
+        contract_frequency: str = "monthly",
+        cache: ParquetCache = None,
+        sources: dict[str, str] = None,
+    ):
+        """
+        Args:
+            product_count (int): 限月数
+            contract_frequency (str, optional): 限月の取得頻度。デフォルトは "monthly"
+            cache (ParquetCache, optional): parquetファイルのローカルキャッシュ
+            sources (dict[str, str], optional): 取得元の名前とベースURL（優先順）。
+                失敗した場合は次の取得元を使用する。指定しない場合は r2, github の順
+        """
+        if product_count < 1:
+            raise ValueError("product_countは1以上で指定してください。")
+        if contract_frequency not in ["monthly", "weekly"]:
+            raise ValueError(
+                "contract_frequencyは'monthly' / 'weekly'のみ指定してください。"
+            )
+        if sources is None:
+            sources = _default_sources()
+        self.product_count = product_count
+        self.contract_frequency = contract_frequency
+
+        def load(base_url: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+            special_quotation = _read_parquet(
+                f"{base_url}/special_quotation.parquet", cache
+            ).df()
+            interest_rate = _read_parquet(
+                f"{base_url}/interest_rate_torf.parquet", cache
+            ).df()
+            return special_quotation, interest_rate
+
+        result = _load_from_sources(sources, load)
+        self.latencies: dict[str, float] = result.latencies
+        self.errors: dict[str, Exception] = result.errors
+        self.source: str = result.source
+        special_quotation, interest_rate = result.value
+
+        self.maturity_class = maturity_info_class(special_quotation)
+        self.interest_rate_panel = InterestRatePanel(interest_rate)
+
+    def get_schedule(self, dt, errors: str = "raise") -> BacktestSchedule:
+        """
+        評価日時の配列それぞれの第1〜第product_count限月の限月・最終取引日時・SQ日時・金利を返す
+
+        Args:
+            dt (array_like): 評価日時の配列（timezoneがない場合は日本時間とみなす）
+            errors (str): 限月・金利データがない場合、"raise" はValueError、
+                "coerce" は NaT / None / NaN を返す
+
+        Returns:
+            BacktestSchedule: 各配列の形は (product_count,) + dt.shape
+        """
+        timestamps = to_datetime64(dt)
+        dates = self.maturity_class.get_contract_dates_array(
+            timestamps,
+            np.arange(1, self.product_count + 1),
+            self.contract_frequency,
+            errors=errors,
+        )
+        remaining_days = (dates.special_quotation_day - timestamps) / np.timedelta64(
+            1, "D"
+        )
+        interest_rate = self.interest_rate_panel.continuous_rate(
+            timestamps, remaining_days, errors=errors
+        )
+        valid = dates.valid & ~np.isnan(interest_rate)
+        return BacktestSchedule(
+            dates.contract_month,
+            dates.last_trading_day,
+            dates.special_quotation_day,
+            remaining_days,
+            interest_rate,
+            valid,
+        )
+
+    def get_schedule_table(self, dt, errors: str = "raise") -> pa.Table:
+        """
+        get_scheduleの結果を評価日時×限月の縦持ちのArrowテーブルで返す
+
+        Args:
+            dt (array_like): 評価日時の1次元配列（timezoneがない場合は日本時間とみなす）
+            errors (str): 限月・金利データがない場合、"raise" はValueError、"coerce" は null を返す
+
+        Returns:
+            pa.Table: Datetime, NthContractMonth, ContractMonth, LastTradingDay,
+                SpecialQuotationDay, RemainingDays, InterestRate列のテーブル
+        """
+        timestamps = to_datetime64(dt).ravel()
+        schedule = self.get_schedule(timestamps, errors=errors)
+
+        # 評価日時ごとに第1〜第product_count限月が並ぶ順にし、NaT / None / NaN は null にする
+        def column(values: np.ndarray) -> pa.Array:
+            return pa.array(values.T.ravel(), from_pandas=True)
+
+        return pa.table(
+            {
+                "Datetime": np.repeat(timestamps, self.product_count),
+                "NthContractMonth": np.tile(
+                    np.arange(1, self.product_count + 1), timestamps.size
+                ),
+                "ContractMonth": column(schedule.contract_month).cast(pa.string()),
+                "LastTradingDay": column(schedule.last_trading_day),
+                "SpecialQuotationDay": column(schedule.special_quotation_day),
+                "RemainingDays": column(schedule.remaining_days),
+                "InterestRate": column(schedule.interest_rate),
+            }
+        )
+
+
 class DataProviderBase(ABC):
     """動的データ（価格情報など）を提供する抽象基底クラス"""
 
@@ -292,11 +724,25 @@ class Client:
         contract_frequency: str = "monthly",
         static_data_provider: str = "auto",
         data_provider: str = "public",
+        cache: ParquetCache = None,
+        static_provider_options: dict = None,
     ):
+        """
+        Args:
+            product_count (int): 限月数
+            dt (datetime.datetime, optional): 日付。指定しない場合は現在の日付を使用
+            contract_frequency (str, optional): 限月の取得頻度。デフォルトは "monthly"
+            static_data_provider (str, optional): 静的データの取得元 "github" / "r2" / "auto" / "local"
+            data_provider (str, optional): 動的データの取得元 "public" / "private"
+            cache (ParquetCache, optional): parquetファイルのローカルキャッシュ
+            static_provider_options (dict, optional): 静的データプロバイダーに渡す追加の引数
+                （"auto"のhedge_delay, timeout、"local"のdirectory, memory_mapなど）
+        """
         static_providers = {
             "github": GitHubStaticDataProvider,
             "r2": CloudflareR2StaticDataProvider,
             "auto": AutoStaticDataProvider,
+            "local": LocalStaticDataProvider,
         }
         data_providers = {
             "public": CloudflareR2PublicDataProvider,
@@ -304,7 +750,7 @@ class Client:
         }
 
         self.static_provider = static_providers[static_data_provider](
-            product_count, dt, contract_frequency
+            product_count, dt, contract_frequency, cache, **(static_provider_options or {})
         )
         self.data_provider = data_providers[data_provider]()
 
@@ -317,6 +763,9 @@ class Client:
     def get_special_quotation_days(self) -> List[datetime.datetime]:
         return self.static_provider.get_special_quotation_days()
 
+    def get_contract_schedule(self) -> pd.DataFrame:
+        return self.static_provider.get_contract_schedule()
+
     def get_interest_rates(self, remaining_days: list[float]) -> List[float]:
         """
         remaining_days: 取得したい金利の残存日数 [15.3, 45.3, 75.3]など
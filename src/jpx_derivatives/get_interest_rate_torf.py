@@ -1,19 +1,225 @@
 import asyncio
-import math
 import os
 import time
 from datetime import datetime
+from functools import lru_cache
 
 import duckdb
+import numpy as np
+import pandas as pd
 from playwright.async_api import TimeoutError, async_playwright
 from scipy.interpolate import CubicSpline
 
 from jpx_derivatives.config import data_dir, logging, setup_logging
+from jpx_derivatives.reference_bundle import read_table
+from jpx_derivatives.utils import to_datetime64
 
 logger_name = setup_logging(__file__)
 logger = logging.getLogger(logger_name)
 
 
+# 同時に保持する金利カーブの数
+CURVE_CACHE_SIZE = 256
+
+
+class InterestRateCurve:
+    """TORFの金利（年利）から作成した金利カーブ
+
+    3次スプライン（natural）の係数と、既知の残存日数での連続複利の金利・割引係数を保持し、
+    残存日数の配列に対する金利・割引係数をまとめて計算する。
+    """
+
+    def __init__(self, data_interest_rate: dict[int, float]):
+        """
+        Args:
+            data_interest_rate (dict[int, float]): key=残存日数、value=金利（年利）
+        """
+        self.days = np.array(list(data_interest_rate.keys()), dtype=np.float64)
+        self.annual_rates = np.array(
+            list(data_interest_rate.values()), dtype=np.float64
+        )
+        self._spline = CubicSpline(
+            self.days, self.annual_rates, bc_type="natural", extrapolate=True
+        )
+        self.continuous_rates = np.log1p(self.annual_rates)
+        self.discount_factors = np.exp(-self.continuous_rates * self.days / 365)
+
+    def annual_rate(self, remain_days) -> np.ndarray:
+        """
+        残存日数に合わせて補間した金利（年利）を返す
+
+        Args:
+            remain_days (array_like): 残存日数
+
+        Returns:
+            np.ndarray: 金利（年利）
+        """
+        return self._spline(np.asarray(remain_days, dtype=np.float64))
+
+    def continuous_rate(self, remain_days) -> np.ndarray:
+        """
+        残存日数に合わせて補間した金利を連続複利に変換して返す
+
+        Args:
+            remain_days (array_like): 残存日数
+
+        Returns:
+            np.ndarray: 連続複利の金利
+        """
+        return np.log1p(self.annual_rate(remain_days))
+
+    def discount_factor(self, remain_days) -> np.ndarray:
+        """
+        残存日数までの割引係数 exp(-r * 残存日数 / 365) を返す
+
+        Args:
+            remain_days (array_like): 残存日数
+
+        Returns:
+            np.ndarray: 割引係数
+        """
+        remain_days = np.asarray(remain_days, dtype=np.float64)
+        return np.exp(-self.continuous_rate(remain_days) * remain_days / 365)
+
+
+@lru_cache(maxsize=CURVE_CACHE_SIZE)
+def _cached_curve(points: tuple[tuple[int, float], ...]) -> InterestRateCurve:
+    return InterestRateCurve(dict(points))
+
+
+def get_curve(data_interest_rate: dict[int, float]) -> InterestRateCurve:
+    """
+    金利データから金利カーブを返す。同じ金利データ（同じ適用日付）のカーブは作成済みのものを使う
+
+    Args:
+        data_interest_rate (dict[int, float]): key=残存日数、value=金利（年利）
+
+    Returns:
+        InterestRateCurve: 金利カーブ
+    """
+    return _cached_curve(tuple(data_interest_rate.items()))
+
+
+# interest_rate_torf.parquet の列と残存日数の対応
+TENOR_COLUMNS = {30: "InterestRate1M", 90: "InterestRate3M", 180: "InterestRate6M"}
+
+
+class InterestRatePanel:
+    """全日付のTORF金利（interest_rate_torf.parquet）を保持し、複数の日付の金利をまとめて補間するクラス
+
+    natural 3次スプラインは既知の金利に対して線形なので、単位行列に対するスプラインから
+    各残存日数での重みを求め、金利 = 重み × 適用日付の金利 で全ての組をまとめて計算する。
+    適用日付は評価日以前の最新の日付（as-of）を np.searchsorted で求める。
+    """
+
+    def __init__(self, interest_rate: pd.DataFrame):
+        """
+        Args:
+            interest_rate (pd.DataFrame): date, InterestRate1M, InterestRate3M, InterestRate6M 列の金利データ
+        """
+        interest_rate = interest_rate.sort_values("date", kind="stable")
+        self.dates = pd.to_datetime(interest_rate["date"]).to_numpy(
+            dtype="datetime64[D]"
+        )
+        self.days = np.array(list(TENOR_COLUMNS.keys()), dtype=np.float64)
+        self.annual_rates = interest_rate[list(TENOR_COLUMNS.values())].to_numpy(
+            dtype=np.float64
+        )
+        self._basis = CubicSpline(
+            self.days, np.eye(self.days.size), bc_type="natural", extrapolate=True
+        )
+
+    @classmethod
+    def from_parquet(cls, path=None) -> "InterestRatePanel":
+        """
+        interest_rate_torf.parquet を読み込む
+
+        Args:
+            path (str | Path, optional): parquetファイルのパス。
+                指定しない場合は data_dir の参照データバンドル（なければ interest_rate_torf.parquet）
+
+        Returns:
+            InterestRatePanel: 金利データ
+        """
+        if path is None:
+            return cls(read_table("interest_rate_torf").to_pandas())
+        return cls(pd.read_parquet(path))
+
+    def as_of_index(self, as_of, errors: str = "raise") -> np.ndarray:
+        """
+        各評価日以前の最新の金利データの行番号を返す
+
+        Args:
+            as_of (array_like): 評価日時（timezoneがない場合は日本時間とみなす）
+            errors (str): 金利データがない場合、"raise" はValueError、"coerce" は -1 を返す
+
+        Returns:
+            np.ndarray: 行番号
+        """
+        if errors not in ["raise", "coerce"]:
+            raise ValueError("errorsは'raise' / 'coerce'のみ指定してください。")
+        days = to_datetime64(as_of).astype("datetime64[D]")
+        index = np.where(
+            np.isnat(days), -1, np.searchsorted(self.dates, days, side="right") - 1
+        )
+        if errors == "raise" and (index < 0).any():
+            raise ValueError(f"{self.dates[0]}より前の金利データはありません")
+        return index
+
+    def annual_rate(self, as_of, remain_days, errors: str = "raise") -> np.ndarray:
+        """
+        評価日時と残存日数の組ごとに補間した金利（年利）を返す
+
+        Args:
+            as_of (array_like): 評価日時
+            remain_days (array_like): 残存日数（as_ofとブロードキャストできる形）
+            errors (str): 金利データがない場合、"raise" はValueError、"coerce" は NaN を返す
+
+        Returns:
+            np.ndarray: 金利（年利）
+        """
+        index, remain_days = np.broadcast_arrays(
+            self.as_of_index(as_of, errors=errors),
+            np.asarray(remain_days, dtype=np.float64),
+        )
+        weights = self._basis(remain_days)
+        rates = np.einsum(
+            "...j,...j->...", weights, self.annual_rates[np.maximum(index, 0)]
+        )
+        return np.where(index < 0, np.nan, rates)[()]
+
+    def continuous_rate(self, as_of, remain_days, errors: str = "raise") -> np.ndarray:
+        """
+        評価日時と残存日数の組ごとに補間した金利を連続複利に変換して返す
+        （interpolate_interest_rate の配列版）
+
+        Args:
+            as_of (array_like): 評価日時
+            remain_days (array_like): 残存日数（as_ofとブロードキャストできる形）
+            errors (str): 金利データがない場合、"raise" はValueError、"coerce" は NaN を返す
+
+        Returns:
+            np.ndarray: 連続複利の金利
+        """
+        return np.log1p(self.annual_rate(as_of, remain_days, errors=errors))
+
+    def discount_factor(self, as_of, remain_days, errors: str = "raise") -> np.ndarray:
+        """
+        評価日時と残存日数の組ごとの割引係数 exp(-r * 残存日数 / 365) を返す
+
+        Args:
+            as_of (array_like): 評価日時
+            remain_days (array_like): 残存日数（as_ofとブロードキャストできる形）
+            errors (str): 金利データがない場合、"raise" はValueError、"coerce" は NaN を返す
+
+        Returns:
+            np.ndarray: 割引係数
+        """
+        remain_days = np.asarray(remain_days, dtype=np.float64)
+        rates = self.continuous_rate(as_of, remain_days, errors=errors)
+        return np.exp(-rates * remain_days / 365)
+
+
 def interpolate_interest_rate(
     data_interest_rate: dict[int, float], target_remain_days: list[float]
 ) -> dict[float, float]:
@@ -23,20 +229,9 @@ def interpolate_interest_rate(
     target_remain_days: 推測したい残存日数
     Returns: key=残存日数、value=補間された連続複利の金利
     """
-    remain_days_known = list(data_interest_rate.keys())
-    annual_rates_known = list(data_interest_rate.values())
-    cs = CubicSpline(
-        remain_days_known, annual_rates_known, bc_type="natural", extrapolate=True
-    )
-    # 残存日数に合わせて金利を補間
-    annual_rates = cs(target_remain_days)
-
-    # 年利から連続複利に変換して返す
-    result = {
-        days: math.log(1 + annual_rate)
-        for days, annual_rate in zip(target_remain_days, annual_rates)
-    }
-    return result
+    # 残存日数に合わせて金利を補間し、年利から連続複利に変換して返す
+    rates = get_curve(data_interest_rate).continuous_rate(target_remain_days)
+    return dict(zip(target_remain_days, rates.tolist()))
 
 
 async def get_interest_rate_torf() -> tuple[datetime, dict[int, float]]:
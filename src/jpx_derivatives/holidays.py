@@ -1,9 +1,24 @@
+import logging
 import os
+import threading
+import time
+from collections.abc import Callable
 from datetime import date, datetime
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
-from jpx_derivatives.config import data_dir
+from jpx_derivatives.config import data_dir, setup_logging
+from jpx_derivatives.reference_bundle import has_table, read_table
+from jpx_derivatives.utils import atomic_write, to_datetime64
+
+logger_name = setup_logging(__file__)
+logger = logging.getLogger(logger_name)
+
+REFRESH_MODE_ENV = "JPX_DERIVATIVES_HOLIDAYS_REFRESH"
+# 休業日データの更新に失敗した（または対象の年がまだ公開されていない）場合に再試行するまでの秒数
+REFRESH_RETRY_INTERVAL = 3600
 
 
 def get_data() -> pd.Series:
@@ -60,6 +75,309 @@ def get_data() -> pd.Series:
     )
 
 
+class HolidayCalendar:
+    """JPXの休業日カレンダー
+
+    休業日（祝日、年末年始等）を numpy.busdaycalendar に保持し、
+    営業日の判定・営業日数の計算を datetime64 配列に対してまとめて行う。
+    土日は常に休業日として扱う。休業日データのない年は土日のみを休業日とみなす。
+    """
+
+    def __init__(self, holidays):
+        """
+        Args:
+            holidays (array_like): 休業日（土日以外）の一覧
+        """
+        self.holidays = np.unique(to_datetime64(holidays).astype("datetime64[D]"))
+        self.years = frozenset(
+            (self.holidays.astype("datetime64[Y]").astype(np.int64) + 1970).tolist()
+        )
+        self.busdaycalendar = np.busdaycalendar(holidays=self.holidays)
+        # is_holidayで1日ずつ判定する場合に使う
+        self.holiday_dates = frozenset(self.holidays.tolist())
+
+    @classmethod
+    def from_parquet(cls, path=None) -> "HolidayCalendar":
+        """
+        holidays.parquet からカレンダーを作成する
+
+        Args:
+            path (str | Path, optional): parquetファイルのパス。
+                指定しない場合は data_dir の参照データバンドル（なければ holidays.parquet）
+
+        Returns:
+            HolidayCalendar: 休業日カレンダー
+        """
+        if path is None:
+            holidays = read_table("holidays", data_dir).to_pandas()
+        else:
+            holidays = pd.read_parquet(path)
+        return cls(holidays["Date"].to_numpy(dtype="datetime64[D]"))
+
+    def covers(self, year: int) -> bool:
+        """指定した年の休業日データがあればTrue"""
+        return year in self.years
+
+    def is_business_day(self, dates) -> np.ndarray:
+        """
+        営業日かどうかを判定する
+
+        Args:
+            dates (array_like): 日付・日時の配列（timezoneがない場合は日本時間とみなす）
+
+        Returns:
+            np.ndarray: 営業日の場合True
+        """
+        return np.is_busday(_to_days(dates), busdaycal=self.busdaycalendar)[()]
+
+    def is_holiday(self, dates) -> np.ndarray:
+        """
+        休日（土日・JPX休場日）かどうかを判定する
+
+        Args:
+            dates (array_like): 日付・日時の配列（timezoneがない場合は日本時間とみなす）
+
+        Returns:
+            np.ndarray: 休日の場合True
+        """
+        return ~self.is_business_day(dates)
+
+    def add_business_days(self, dates, n, roll: str = "following") -> np.ndarray:
+        """
+        n営業日後の日付を返す
+
+        Args:
+            dates (array_like): 日付・日時の配列
+            n (array_like): 営業日数（マイナスも可）
+            roll (str): 休日を起点とする場合の扱い（numpy.busday_offset の roll と同じ）
+
+        Returns:
+            np.ndarray: datetime64[D] 配列
+        """
+        return np.busday_offset(
+            _to_days(dates), n, roll=roll, busdaycal=self.busdaycalendar
+        )[()]
+
+    def business_days_between(self, start, end) -> np.ndarray:
+        """
+        start以上end未満の営業日数を返す（end < start の場合はマイナス）
+
+        Args:
+            start (array_like): 開始日
+            end (array_like): 終了日
+
+        Returns:
+            np.ndarray: 営業日数
+        """
+        return np.busday_count(
+            _to_days(start), _to_days(end), busdaycal=self.busdaycalendar
+        )[()]
+
+    def next_business_day(self, dates) -> np.ndarray:
+        """
+        各日付より後の最初の営業日を返す
+
+        Args:
+            dates (array_like): 日付・日時の配列
+
+        Returns:
+            np.ndarray: datetime64[D] 配列
+        """
+        return self.add_business_days(dates, 1, roll="backward")
+
+    def previous_business_day(self, dates) -> np.ndarray:
+        """
+        各日付より前の最後の営業日を返す
+
+        Args:
+            dates (array_like): 日付・日時の配列
+
+        Returns:
+            np.ndarray: datetime64[D] 配列
+        """
+        return self.add_business_days(dates, -1, roll="forward")
+
+
+def _to_days(dates) -> np.ndarray:
+    return to_datetime64(dates).astype("datetime64[D]")
+
+
+_calendar: HolidayCalendar | None = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar() -> HolidayCalendar:
+    """
+    プロセス内で共有する休業日カレンダーを返す。初回のみ holidays.parquet を読み込む
+
+    Returns:
+        HolidayCalendar: 休業日カレンダー
+    """
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                return reload_calendar()
+    return _calendar
+
+
+def reload_calendar() -> HolidayCalendar:
+    """
+    holidays.parquet を読み直し、共有の休業日カレンダーを置き換える
+
+    Returns:
+        HolidayCalendar: 新しい休業日カレンダー
+    """
+    global _calendar
+    # 祝日データがなければ作成
+    if not has_table("holidays", data_dir) and _refresh_mode != "off":
+        save_holidays_to_parquet()
+    _calendar = HolidayCalendar.from_parquet()
+    return _calendar
+
+
+class RefreshStatus(NamedTuple):
+    """
+    休業日データの更新状況
+
+    Attributes:
+        mode: 更新モード（"background" / "sync" / "off"）
+        missing_years: 判定を要求されたが休業日データのない年
+        stale_lookups: 休業日データのない年で判定した回数（土日のみで判定した回数）
+        refreshing: バックグラウンドで更新中の場合True
+        last_refresh: 最後に更新に成功した時刻（UNIX時間）
+        last_error: 最後の更新で発生したエラー
+    """
+
+    mode: str
+    missing_years: tuple[int, ...]
+    stale_lookups: int
+    refreshing: bool
+    last_refresh: float | None
+    last_error: str | None
+
+
+_refresh_mode = "background"
+_data_source: Callable[[], pd.Series] = get_data
+_refresh_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+_last_attempt = float("-inf")
+_last_refresh: float | None = None
+_last_error: str | None = None
+_missing_years: set[int] = set()
+_stale_lookups = 0
+
+
+def set_refresh_mode(mode: str = "background") -> str:
+    """
+    休業日データのない年を判定した場合の動作を切り替える
+
+    - "background": 現在のカレンダーで判定し、休業日データの更新をバックグラウンドで行う
+    - "sync": 休業日データを取得してから判定する（取得が終わるまで待つ）
+    - "off": 休業日データを取得しない（オフライン用）
+
+    Args:
+        mode (str): "background" / "sync" / "off"
+
+    Returns:
+        str: 設定した更新モード
+    """
+    global _refresh_mode
+    if mode not in ("background", "sync", "off"):
+        raise ValueError("modeは'background' / 'sync' / 'off'のみ指定してください。")
+    _refresh_mode = mode
+    return mode
+
+
+def get_refresh_mode() -> str:
+    """現在の更新モードを返す"""
+    return _refresh_mode
+
+
+def set_data_source(source: Callable[[], pd.Series] | None = None) -> None:
+    """
+    休業日データの取得元を切り替える。オフライン環境ではローカルのデータを返す関数を指定する
+
+    Args:
+        source (Callable[[], pd.Series], optional): 休業日の一覧を返す関数。指定しない場合はget_data
+    """
+    global _data_source
+    _data_source = get_data if source is None else source
+
+
+def refresh_in_background() -> threading.Thread:
+    """
+    休業日データの取得とカレンダーの再読み込みをバックグラウンドのスレッドで行う。
+    更新中の場合は実行中のスレッドを返す
+
+    Returns:
+        threading.Thread: 更新を行うスレッド
+    """
+    global _refresh_thread, _last_attempt
+    with _refresh_lock:
+        if _refresh_thread is None or not _refresh_thread.is_alive():
+            _last_attempt = time.monotonic()
+            _refresh_thread = threading.Thread(
+                target=_refresh, name="jpx_derivatives-holidays-refresh", daemon=True
+            )
+            _refresh_thread.start()
+        return _refresh_thread
+
+
+def _refresh() -> None:
+    global _last_refresh, _last_error
+    try:
+        save_holidays_to_parquet()
+        calendar = reload_calendar()
+    except Exception as e:
+        _last_error = repr(e)
+        logger.warning(f"休業日データの更新に失敗しました: {e}")
+        return
+    _last_refresh = time.time()
+    _last_error = None
+    still_missing = sorted(y for y in _missing_years if not calendar.covers(y))
+    if still_missing:
+        logger.warning(f"更新後も{still_missing}年の休業日データがありません")
+
+
+def get_refresh_status() -> RefreshStatus:
+    """
+    休業日データの更新状況を返す
+
+    Returns:
+        RefreshStatus: 更新モード・データのない年・更新状況
+    """
+    calendar = get_calendar()
+    return RefreshStatus(
+        _refresh_mode,
+        tuple(sorted(y for y in _missing_years if not calendar.covers(y))),
+        _stale_lookups,
+        _refresh_thread is not None and _refresh_thread.is_alive(),
+        _last_refresh,
+        _last_error,
+    )
+
+
+def _calendar_for_year(calendar: HolidayCalendar, year: int) -> HolidayCalendar:
+    """休業日データのない年を判定する場合に、更新モードに応じたカレンダーを返す"""
+    global _stale_lookups
+    if _refresh_mode == "sync":
+        save_holidays_to_parquet()
+        calendar = reload_calendar()
+        if calendar.covers(year):
+            return calendar
+
+    _stale_lookups += 1
+    if year not in _missing_years:
+        _missing_years.add(year)
+        logger.warning(f"{year}年の休業日データがないため、土日のみで休日を判定します")
+    if (
+        _refresh_mode == "background"
+        and time.monotonic() - _last_attempt >= REFRESH_RETRY_INTERVAL
+    ):
+        refresh_in_background()
+    return calendar
+
+
 def is_holiday(target_date: date | datetime | str | None = None) -> bool:
     """
     指定された日付が休日かどうかを判定する
@@ -88,26 +406,26 @@ def is_holiday(target_date: date | datetime | str | None = None) -> bool:
     if target_date.weekday() >= 5:  # 5=土曜日, 6=日曜日
         return True
 
-    # 祝日データがなければ読み込み
-    if not os.path.exists(data_dir / "holidays.parquet"):
-        save_holidays_to_parquet()
-
-    holidays_df = pd.read_parquet(data_dir / "holidays.parquet")
+    calendar = get_calendar()
 
-    # 対象の年がなければ祝日データを更新
-    if target_date.year not in holidays_df["Date"].dt.year.unique():
-        save_holidays_to_parquet()
-        # 再度読み込み
-        holidays_df = pd.read_parquet(data_dir / "holidays.parquet")
+    # 対象の年がなければ更新モードに応じて祝日データを更新
+    if not calendar.covers(target_date.year):
+        calendar = _calendar_for_year(calendar, target_date.year)
 
     # 休日一覧と照合
-    return target_date in holidays_df["Date"].dt.date.values
+    return target_date in calendar.holiday_dates
 
 
 def save_holidays_to_parquet():
     """休日の一覧をparquetファイルに保存する"""
-    holidays = pd.DataFrame(get_data(), columns=["Date"])
-    holidays.to_parquet(data_dir / "holidays.parquet")
+    holidays = pd.DataFrame(
+        {"Date": pd.to_datetime(pd.Series(_data_source())).to_numpy()}
+    )
+    with atomic_write(data_dir / "holidays.parquet") as tmp_path:
+        holidays.to_parquet(tmp_path)
+
+
+set_refresh_mode(os.environ.get(REFRESH_MODE_ENV, "background"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from jpx_derivatives.config import data_dir, setup_logging
+from jpx_derivatives.utils import atomic_write
+
+logger_name = setup_logging(__file__)
+logger = logging.getLogger(logger_name)
+
+BUNDLE_ENV = "JPX_DERIVATIVES_BUNDLE"
+BUNDLE_FILE_NAME = "reference.bundle"
+BUNDLE_FORMAT_VERSION = 1
+# バンドルに含めるデータ（data_dir の {名前}.parquet）
+BUNDLE_TABLES = (
+    "holidays",
+    "special_quotation",
+    "interest_rate_torf",
+    "symbolcode_futures",
+)
+
+# ファイルの先頭: マジックナンバー、マニフェスト（JSON）のバイト数
+_HEADER = struct.Struct("<8sQ")
+_MAGIC = b"JPXREF\x00\x00"
+# 各テーブルの開始位置の境界（メモリマップしたまま読めるようにArrowのアライメントに合わせる）
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def build_bundle(path=None, directory=None) -> Path:
+    """
+    data_dir のparquetファイルから参照データバンドルを作成する
+
+    バンドルは1つのファイルに、マニフェスト（バージョン・作成日時・各テーブルの位置とSHA-256）と
+    非圧縮のArrow IPCファイル形式の各テーブルを並べたもので、1回のメモリマップで全テーブルを読み込める。
+
+    Args:
+        path (str | Path, optional): 出力先。指定しない場合は directory / BUNDLE_FILE_NAME
+        directory (str | Path, optional): parquetファイルのディレクトリ。指定しない場合は data_dir
+
+    Returns:
+        Path: 作成したバンドルのパス
+    """
+    directory = Path(directory) if directory is not None else data_dir
+    path = Path(path) if path is not None else directory / BUNDLE_FILE_NAME
+
+    segments = []
+    tables = {}
+    offset = 0
+    for name in BUNDLE_TABLES:
+        source = directory / f"{name}.parquet"
+        if not source.exists():
+            logger.warning(f"{source}がないためバンドルに含めません")
+            continue
+        table = pq.read_table(source)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        segment = sink.getvalue().to_pybytes()
+        stat = source.stat()
+        tables[name] = {
+            "offset": offset,
+            "length": len(segment),
+            "sha256": hashlib.sha256(segment).hexdigest(),
+            "rows": table.num_rows,
+            "source": {
+                "file": source.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
+        }
+        segments.append(segment)
+        offset = _align(offset + len(segment))
+
+    # バージョンは全テーブルのチェックサムから決まる（同じデータからは同じバージョンになる）
+    version = hashlib.sha256(
+        "".join(meta["sha256"] for meta in tables.values()).encode()
+    ).hexdigest()[:16]
+    manifest = json.dumps(
+        {
+            "format_version": BUNDLE_FORMAT_VERSION,
+            "version": version,
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "tables": tables,
+        }
+    ).encode()
+
+    with atomic_write(path) as tmp_path, open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(manifest)))
+        f.write(manifest)
+        data_start = _align(_HEADER.size + len(manifest))
+        for name, segment in zip(tables, segments):
+            f.seek(data_start + tables[name]["offset"])
+            f.write(segment)
+    logger.info(f"{path}を作成しました（version: {version}）")
+    return path
+
+
+class ReferenceBundle:
+    """参照データバンドルをメモリマップで開き、各テーブルをコピーせずに返すクラス"""
+
+    def __init__(self, path, verify: bool = True):
+        """
+        Args:
+            path (str | Path): バンドルのパス
+            verify (bool, optional): Trueの場合は開く時に各テーブルのチェックサムを検証する
+        """
+        self.path = Path(path)
+        self._source = pa.memory_map(str(self.path), "r")
+        buffer = self._source.read_buffer()
+        magic, manifest_length = _HEADER.unpack(buffer[: _HEADER.size].to_pybytes())
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path}は参照データバンドルではありません")
+        self.manifest = json.loads(
+            buffer.slice(_HEADER.size, manifest_length).to_pybytes()
+        )
+        if self.manifest["format_version"] != BUNDLE_FORMAT_VERSION:
+            raise ValueError(
+                f"バンドルの形式のバージョン{self.manifest['format_version']}には対応していません"
+            )
+
+        data_start = _align(_HEADER.size + manifest_length)
+        self._segments = {
+            name: buffer.slice(data_start + meta["offset"], meta["length"])
+            for name, meta in self.manifest["tables"].items()
+        }
+        if verify:
+            for name, segment in self._segments.items():
+                if hashlib.sha256(segment).hexdigest() != self.tables[name]["sha256"]:
+                    raise ValueError(f"{self.path}の{name}のチェックサムが一致しません")
+        self._tables: dict[str, pa.Table] = {}
+
+    @property
+    def version(self) -> str:
+        """データの内容から決まるバンドルのバージョン"""
+        return self.manifest["version"]
+
+    @property
+    def tables(self) -> dict:
+        """テーブル名ごとのマニフェスト"""
+        return self.manifest["tables"]
+
+    def table(self, name: str) -> pa.Table:
+        """
+        テーブルを返す。データはメモリマップされたファイルを参照する
+
+        Args:
+            name (str): テーブル名（"holidays" など）
+
+        Returns:
+            pa.Table: テーブル
+        """
+        if name not in self._tables:
+            if name not in self._segments:
+                raise KeyError(f"バンドルに{name}はありません")
+            self._tables[name] = pa.ipc.open_file(self._segments[name]).read_all()
+        return self._tables[name]
+
+    def is_fresh(self, name: str, source: Path) -> bool:
+        """
+        バンドルのテーブルが元のparquetファイルと同じ内容であればTrue
+
+        元のparquetファイルがない場合はバンドルのみを配置した環境とみなしTrue、
+        サイズか更新時刻がバンドル作成時と異なる場合（休日データの更新など）はFalseを返す。
+        """
+        if name not in self.tables:
+            return False
+        if not source.exists():
+            return True
+        stat = source.stat()
+        recorded = self.tables[name]["source"]
+        return (stat.st_size, stat.st_mtime_ns) == (
+            recorded["size"],
+            recorded["mtime_ns"],
+        )
+
+
+_bundles: dict[tuple, ReferenceBundle | None] = {}
+_bundles_lock = threading.Lock()
+
+
+def get_bundle(directory=None) -> ReferenceBundle | None:
+    """
+    参照データバンドルを返す。プロセス内ではファイルが更新されない限り同じものを使う
+
+    環境変数 JPX_DERIVATIVES_BUNDLE が設定されていればそのパス、
+    なければ directory / BUNDLE_FILE_NAME を使う。
+
+    Args:
+        directory (str | Path, optional): バンドルのディレクトリ。指定しない場合は data_dir
+
+    Returns:
+        ReferenceBundle | None: バンドル。ないか読み込めない場合はNone
+    """
+    directory = Path(directory) if directory is not None else data_dir
+    path = Path(os.environ.get(BUNDLE_ENV) or directory / BUNDLE_FILE_NAME)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    with _bundles_lock:
+        if key not in _bundles:
+            # 更新前のバンドルは使わない
+            for old in [k for k in _bundles if k[0] == path]:
+                del _bundles[old]
+            try:
+                _bundles[key] = ReferenceBundle(path)
+            except (ValueError, OSError) as e:
+                logger.warning(f"{path}を読み込めないためparquetファイルを使用します: {e}")
+                _bundles[key] = None
+        return _bundles[key]
+
+
+def has_table(name: str, directory=None) -> bool:
+    """バンドルかparquetファイルのどちらかにテーブルがあればTrue"""
+    directory = Path(directory) if directory is not None else data_dir
+    bundle = get_bundle(directory)
+    return (directory / f"{name}.parquet").exists() or (
+        bundle is not None and name in bundle.tables
+    )
+
+
+def read_table(name: str, directory=None) -> pa.Table:
+    """
+    参照データを読み込む。最新のバンドルがあればバンドルから、なければparquetファイルから読み込む
+
+    Args:
+        name (str): テーブル名（"holidays", "special_quotation", "interest_rate_torf", "symbolcode_futures"）
+        directory (str | Path, optional): データのディレクトリ。指定しない場合は data_dir
+
+    Returns:
+        pa.Table: テーブル
+    """
+    directory = Path(directory) if directory is not None else data_dir
+    source = directory / f"{name}.parquet"
+    bundle = get_bundle(directory)
+    if bundle is not None and bundle.is_fresh(name, source):
+        return bundle.table(name)
+    return pq.read_table(source)
+
+
+if __name__ == "__main__":
+    build_bundle(*sys.argv[1:2])
@@ -0,0 +1,131 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from jpx_derivatives.bsm import IV_LOWER_BOUND, price, price_from_d1
+
+# 1チャンクで評価する(ポジション数×シナリオ数)の上限
+DEFAULT_MAX_ELEMENTS = 2**18
+
+POSITION_COLUMNS = [
+    "ContractMonth",
+    "Strike",
+    "Div",
+    "Quantity",
+    "TimeToExpiry",
+    "Volatility",
+]
+
+
+class ScenarioResult(NamedTuple):
+    """
+    シナリオ損益の集計結果
+
+    Attributes:
+        pnl: シナリオごとのポートフォリオ損益 (spot, vol, time)
+        pnl_by_expiry: 限月・シナリオごとの損益 (contract_month, spot, vol, time)
+        contract_months: pnl_by_expiry の1軸目に対応する限月
+    """
+
+    pnl: np.ndarray
+    pnl_by_expiry: np.ndarray
+    contract_months: np.ndarray
+
+
+def _shocked_price(spot, k, t, r, sigma, phi) -> np.ndarray:
+    """
+    (position, spot, vol, time) の形にブロードキャストして価格を計算する
+
+    log(s / k) = log(s) - log(k) のように、グリッド全体の大きさになる前に
+    ポジション軸・シナリオ軸ごとの小さな配列で計算できる項を先に計算し、
+    価格は bsm.price_from_d1 で計算する。
+
+    Args:
+        spot: 原資産価格 (1, spot, 1, 1)
+        k, r, phi: ポジションごとの値 (position, 1, 1, 1)
+        t: 残存期間 (position, 1, 1, time)
+        sigma: ボラティリティ (position, 1, vol, 1)
+    """
+    expired = t <= 0
+    t_live = np.where(expired, 1.0, t)
+    sigma_sqrt_t = sigma * np.sqrt(t_live)
+    d1_offset = ((r + 0.5 * sigma**2) * t_live - np.log(k)) / sigma_sqrt_t
+    d1_value = np.log(spot) / sigma_sqrt_t + d1_offset
+    k_discount = k * np.exp(-r * t_live)
+    return price_from_d1(spot, k, phi, d1_value, sigma_sqrt_t, k_discount, expired)
+
+
+def scenario_pnl(
+    positions: pd.DataFrame,
+    s: float,
+    r,
+    spot_shocks,
+    vol_shocks,
+    time_shocks,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+) -> ScenarioResult:
+    """
+    原資産価格×ボラティリティ×時間経過のシナリオグリッドで全ポジションを再評価し、損益を集計する
+
+    ポジションをチャンクに分けてブロードキャストで評価するため、
+    使用メモリは max_elements 要素程度の配列数個分に抑えられる。
+
+    Args:
+        positions (pd.DataFrame): ContractMonth, Strike, Div（1: プット、2: コール）, Quantity,
+            TimeToExpiry（年単位）, Volatility 列を持つポジション表
+        s (float): 原資産価格
+        r (array_like): 無リスク金利（スカラーまたはポジションごとの配列）
+        spot_shocks (array_like): 原資産価格の変化率（0.05 で +5%）
+        vol_shocks (array_like): ボラティリティの変化幅（0.01 で +1%ポイント）
+        time_shocks (array_like): 経過時間（年単位）
+        max_elements (int): 1チャンクで評価する要素数の上限
+
+    Returns:
+        ScenarioResult: シナリオごと・限月ごとの損益
+    """
+    missing = set(POSITION_COLUMNS) - set(positions.columns)
+    if missing:
+        raise ValueError(f"positionsに{sorted(missing)}列がありません")
+
+    spot = float(s) * (1 + np.asarray(spot_shocks, dtype=np.float64))
+    vol_shocks = np.asarray(vol_shocks, dtype=np.float64)
+    time_shocks = np.asarray(time_shocks, dtype=np.float64)
+    grid_shape = (spot.size, vol_shocks.size, time_shocks.size)
+    n_scenarios = spot.size * vol_shocks.size * time_shocks.size
+
+    contract_months, expiry_index = np.unique(
+        positions["ContractMonth"].to_numpy(dtype=object), return_inverse=True
+    )
+    k = positions["Strike"].to_numpy(dtype=np.float64)
+    div = positions["Div"].to_numpy()
+    quantity = positions["Quantity"].to_numpy(dtype=np.float64)
+    t = positions["TimeToExpiry"].to_numpy(dtype=np.float64)
+    sigma = positions["Volatility"].to_numpy(dtype=np.float64)
+    r = np.broadcast_to(np.asarray(r, dtype=np.float64), k.shape)
+
+    base = price(float(s), k, t, r, sigma, div)
+    phi = np.where(div == 2, 1.0, -1.0)
+
+    pnl_by_expiry = np.zeros((contract_months.size, n_scenarios))
+    chunk_size = max(1, max_elements // n_scenarios)
+    for start in range(0, k.size, chunk_size):
+        rows = slice(start, start + chunk_size)
+        # (position, spot, vol, time) の形にブロードキャストして評価する
+        shocked = _shocked_price(
+            spot[None, :, None, None],
+            k[rows, None, None, None],
+            np.maximum(t[rows, None, None, None] - time_shocks[None, None, None, :], 0.0),
+            r[rows, None, None, None],
+            np.maximum(
+                sigma[rows, None, None, None] + vol_shocks[None, None, :, None],
+                IV_LOWER_BOUND,
+            ),
+            phi[rows, None, None, None],
+        )
+        pnl = (shocked - base[rows, None, None, None]) * quantity[rows, None, None, None]
+        one_hot = expiry_index[rows] == np.arange(contract_months.size)[:, None]
+        pnl_by_expiry += one_hot @ pnl.reshape(pnl.shape[0], n_scenarios)
+
+    pnl_by_expiry = pnl_by_expiry.reshape((contract_months.size,) + grid_shape)
+    return ScenarioResult(pnl_by_expiry.sum(axis=0), pnl_by_expiry, contract_months)
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+from jpx_derivatives.holidays import HolidayCalendar, get_calendar
+from jpx_derivatives.trading_session import (
+    SESSION_CODES,
+    TradingSession,
+    _hours_ns,
+)
+from jpx_derivatives.utils import to_datetime64
+
+_NS_PER_DAY = 24 * 60 * 60 * 10**9
+_NAT = np.iinfo(np.int64).min
+# 営業日ごとのセッションの順番と、開始・終了時刻の設定キー（終了が翌日の場合True）
+_SESSIONS = (
+    (TradingSession.DAY, ("day", "start", False), ("day", "end", False)),
+    (
+        TradingSession.DAY_CLOSING,
+        ("day_closing", "start", False),
+        ("day_closing", "end", False),
+    ),
+    (TradingSession.NIGHT, ("night", "start", False), ("night", "end", True)),
+    (
+        TradingSession.NIGHT_CLOSING,
+        ("night_closing", "start", True),
+        ("night_closing", "end", True),
+    ),
+)
+
+
+class SessionSchedule:
+    """期間内の全セッション（日中・日中クロージング・夜間・夜間クロージング）の一覧
+
+    営業日 D ごとに、D の日中取引・日中クロージングオークションと、
+    D の夕方から翌日朝までの夜間取引・夜間クロージングオークションを開始時刻順の配列として保持する。
+    取引日は日中取引が D、夜間取引が D の翌営業日となる。
+    2024/11/5 より前の営業日は変更前の取引時間（日中 15:15 まで、夜間 16:30 から）を使用する。
+
+    次の立会開始・終了時刻や2時点間の立会時間は np.searchsorted で O(log n) で求める。
+    日時はすべて日本時間の datetime64[ns]（timezoneがない場合は日本時間とみなす）で扱う。
+    """
+
+    def __init__(self, start, end, calendar: HolidayCalendar | None = None):
+        """
+        Args:
+            start (date | str | datetime64): 期間の開始日
+            end (date | str | datetime64): 期間の終了日（この日の夜間取引まで含む）
+            calendar (HolidayCalendar, optional): 休業日カレンダー。指定しない場合は共有のカレンダー
+        """
+        if calendar is None:
+            calendar = get_calendar()
+        start_day = to_datetime64(start).astype("datetime64[D]")
+        end_day = to_datetime64(end).astype("datetime64[D]")
+        if end_day < start_day:
+            raise ValueError("endはstart以降の日付を指定してください。")
+
+        # start 0時以降を全てカバーするため、前営業日の夜間取引から含める
+        first_day = calendar.previous_business_day(start_day)
+        days = np.arange(first_day, end_day + 1)
+        days = days[calendar.is_business_day(days)]
+        midnight = days.astype("datetime64[ns]").view(np.int64)
+
+        starts, ends = [], []
+        for _, start_key, end_key in _SESSIONS:
+            for key, values in ((start_key, starts), (end_key, ends)):
+                name, edge, next_day = key
+                values.append(
+                    midnight + _hours_ns(days, name, edge) + next_day * _NS_PER_DAY
+                )
+
+        trade_date = np.stack(
+            [days, days, calendar.next_business_day(days), calendar.next_business_day(days)],
+            axis=1,
+        )
+        self.start = np.stack(starts, axis=1).ravel().view("datetime64[ns]")
+        self.end = np.stack(ends, axis=1).ravel().view("datetime64[ns]")
+        self.session = np.tile(
+            np.array(
+                [SESSION_CODES.index(session) for session, _, _ in _SESSIONS],
+                dtype=np.uint8,
+            ),
+            days.size,
+        )
+        self.trade_date = trade_date.ravel()
+
+        start_ns, end_ns = self.start.view(np.int64), self.end.view(np.int64)
+        self._start_ns, self._end_ns = start_ns, end_ns
+        # 各セッション開始時点までの立会時間の累計
+        self._cumulative = np.concatenate(([0], np.cumsum(end_ns - start_ns)))
+        # 連続するセッション（日中取引と日中クロージングなど）をまとめた立会の開始・終了時刻
+        self._open_ns = start_ns[np.concatenate(([True], start_ns[1:] != end_ns[:-1]))]
+        self._close_ns = end_ns[np.concatenate((end_ns[:-1] != start_ns[1:], [True]))]
+        # end の翌日0時（end の夜間取引がある場合はその終了時刻）までの日時を扱える
+        end_of_period = int((end_day + 1).astype("datetime64[ns]").view(np.int64))
+        self._range_ns = (
+            int(start_day.astype("datetime64[ns]").view(np.int64)),
+            max(end_of_period, int(end_ns[-1])) if end_ns.size else end_of_period,
+        )
+
+    def __len__(self) -> int:
+        return self.start.size
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        セッションの一覧をデータフレームで返す
+
+        Returns:
+            pd.DataFrame: Start, End, Session（TradingSession）, TradeDate列のデータフレーム
+        """
+        return pd.DataFrame(
+            {
+                "Start": self.start,
+                "End": self.end,
+                "Session": [SESSION_CODES[code] for code in self.session],
+                "TradeDate": self.trade_date.astype("datetime64[s]"),
+            }
+        )
+
+    def _to_ns(self, timestamps) -> np.ndarray:
+        jst_ns = to_datetime64(timestamps).view(np.int64)
+        first, last = self._range_ns
+        if ((jst_ns < first) | (jst_ns > last)).any():
+            raise ValueError(
+                f"{np.datetime64(first, 'ns')}から{np.datetime64(last, 'ns')}の日時を指定してください。"
+            )
+        return jst_ns
+
+    def next_open(self, timestamps) -> np.ndarray:
+        """
+        各日時より後の最初の立会開始時刻を返す
+
+        日中取引と日中クロージングオークションのように連続するセッションは1つの立会として扱う。
+
+        Args:
+            timestamps (array_like): 日時の配列
+
+        Returns:
+            np.ndarray: datetime64[ns] 配列。期間内に次の立会がない場合は NaT
+        """
+        index = np.searchsorted(self._open_ns, self._to_ns(timestamps), side="right")
+        return self._take(self._open_ns, index)
+
+    def next_close(self, timestamps) -> np.ndarray:
+        """
+        立会中の場合はその立会の終了時刻（クロージングオークション終了時刻）、
+        立会時間外の場合は次の立会の終了時刻を返す
+
+        Args:
+            timestamps (array_like): 日時の配列
+
+        Returns:
+            np.ndarray: datetime64[ns] 配列。期間内に該当する立会がない場合は NaT
+        """
+        index = np.searchsorted(self._close_ns, self._to_ns(timestamps), side="right")
+        return self._take(self._close_ns, index)
+
+    @staticmethod
+    def _take(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+        inside = index < values.size
+        result = np.where(inside, values[np.where(inside, index, 0)], _NAT)
+        return result.view("datetime64[ns]")[()]
+
+    def _cumulative_ns(self, jst_ns: np.ndarray) -> np.ndarray:
+        """期間の最初のセッション開始時刻から各日時までの立会時間（ナノ秒）"""
+        index = np.searchsorted(self._start_ns, jst_ns, side="right") - 1
+        row = np.maximum(index, 0)
+        elapsed = np.clip(
+            jst_ns - self._start_ns[row], 0, self._end_ns[row] - self._start_ns[row]
+        )
+        return np.where(index < 0, 0, self._cumulative[row] + elapsed)
+
+    def trading_time_between(self, start, end) -> np.ndarray:
+        """
+        2時点間の立会時間（クロージングオークションを含む）を返す。end < start の場合はマイナス
+
+        Args:
+            start (array_like): 開始日時
+            end (array_like): 終了日時（SQ日時など）
+
+        Returns:
+            np.ndarray: timedelta64[ns] 配列
+        """
+        start_ns, end_ns = np.broadcast_arrays(self._to_ns(start), self._to_ns(end))
+        return (self._cumulative_ns(end_ns) - self._cumulative_ns(start_ns)).view(
+            "timedelta64[ns]"
+        )[()]
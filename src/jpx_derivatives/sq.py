@@ -6,13 +6,15 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import requests
-from config import data_dir, setup_logging
 from dateutil.relativedelta import relativedelta
 from lxml import html
 
+from jpx_derivatives.config import data_dir, setup_logging
+from jpx_derivatives.reference_bundle import read_table
+
 logger_name = setup_logging(__file__)
 logger = logging.getLogger(logger_name)
-holidays = pd.read_parquet(data_dir / "holidays.parquet").loc[:, "Date"].to_list()
+holidays = read_table("holidays").to_pandas().loc[:, "Date"].to_list()
 
 
 def drift_trading_date(dt: pd.Timestamp) -> pd.Timestamp:
@@ -0,0 +1,110 @@
+import datetime
+from typing import NamedTuple
+
+import numpy as np
+
+from jpx_derivatives.holidays import get_calendar
+from jpx_derivatives.session_schedule import SessionSchedule
+from jpx_derivatives.trading_session import TRADING_HOURS
+from jpx_derivatives.utils import to_datetime64
+
+# 年間の営業日数
+BUSINESS_DAYS_PER_YEAR = 245
+_NS_PER_MINUTE = 60 * 10**9
+_NS_PER_YEAR = 365 * 24 * 60 * _NS_PER_MINUTE
+
+
+class YearFraction(NamedTuple):
+    """
+    残存期間（年単位）
+
+    Attributes:
+        calendar: 暦日ベース（365日 = 1年）
+        business_days: 営業日ベース（BUSINESS_DAYS_PER_YEAR 営業日 = 1年）
+        trading_minutes: 立会時間ベース（BUSINESS_DAYS_PER_YEAR 営業日分の立会時間 = 1年）
+    """
+
+    calendar: np.ndarray
+    business_days: np.ndarray
+    trading_minutes: np.ndarray
+
+
+def _minutes(value: datetime.time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def year_fraction(
+    valuation,
+    expiry,
+    business_days_per_year: float = BUSINESS_DAYS_PER_YEAR,
+    weekend_weight: float = 0.0,
+    holiday_weight: float = 0.0,
+) -> YearFraction:
+    """
+    評価日時から満期日時（SQ日時など）までの残存期間を暦日・営業日・立会時間ベースでまとめて計算する
+
+    営業日ベースでは評価日から満期日の前日までの各日を、営業日は1、土日は weekend_weight、
+    平日の休日は holiday_weight の重みで数える（分散の重み付け）。
+    立会時間ベースでは SessionSchedule.trading_time_between と同じく、各日の取引時間
+    （2024/11/5 より前は変更前の取引時間）の日中・夜間取引の時間のみを数え、
+    現在の TRADING_HOURS の1営業日分の立会時間 × business_days_per_year を1年とする。
+    評価日時か満期日時が NaT の要素は NaN を返す。
+
+    Args:
+        valuation (array_like): 評価日時（timezoneがない場合は日本時間とみなす）
+        expiry (array_like): 満期日時（get_contract_datesのSQ日時など）
+        business_days_per_year (float): 1年あたりの営業日数
+        weekend_weight (float): 土日の重み
+        holiday_weight (float): 平日の休日の重み
+
+    Returns:
+        YearFraction: 暦日・営業日・立会時間ベースの残存期間
+    """
+    valuation, expiry = np.broadcast_arrays(
+        to_datetime64(valuation), to_datetime64(expiry)
+    )
+    valid = ~(np.isnat(valuation) | np.isnat(expiry))
+    if not valid.all():
+        # NaT の要素は計算用に有効な日時を入れ、最後に NaN で上書きする
+        fill = valuation[valid][0] if valid.any() else np.datetime64(0, "ns")
+        valuation = np.where(valid, valuation, fill)
+        expiry = np.where(valid, expiry, fill)
+    calendar = (expiry - valuation).astype(np.int64) / _NS_PER_YEAR
+
+    holiday_calendar = get_calendar()
+    holidays = holiday_calendar.busdaycalendar
+    valuation_day = valuation.astype("datetime64[D]")
+    expiry_day = expiry.astype("datetime64[D]")
+    business_count = np.busday_count(valuation_day, expiry_day, busdaycal=holidays)
+    weekday_count = np.busday_count(valuation_day, expiry_day)
+    calendar_days = (expiry_day - valuation_day).astype(np.int64)
+    weighted_days = (
+        business_count
+        + holiday_weight * (weekday_count - business_count)
+        + weekend_weight * (calendar_days - weekday_count)
+    )
+
+    schedule = SessionSchedule(
+        min(valuation_day.min(), expiry_day.min()),
+        max(valuation_day.max(), expiry_day.max()),
+        holiday_calendar,
+    )
+    minutes = (
+        np.asarray(schedule.trading_time_between(valuation, expiry)).astype(np.int64)
+        / _NS_PER_MINUTE
+    )
+    day_session = _minutes(TRADING_HOURS["day_closing"]["end"]) - _minutes(
+        TRADING_HOURS["day"]["start"]
+    )
+    night_session = (
+        24 * 60
+        - _minutes(TRADING_HOURS["night"]["start"])
+        + _minutes(TRADING_HOURS["night_closing"]["end"])
+    )
+    minutes_per_year = business_days_per_year * (day_session + night_session)
+
+    return YearFraction(
+        np.where(valid, calendar, np.nan)[()],
+        np.where(valid, weighted_days / business_days_per_year, np.nan)[()],
+        np.where(valid, minutes / minutes_per_year, np.nan)[()],
+    )
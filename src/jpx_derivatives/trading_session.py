@@ -1,8 +1,15 @@
 import os
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from enum import Enum
 
-from jpx_derivatives.holidays import is_holiday
+import numpy as np
+
+from jpx_derivatives.holidays import (
+    _calendar_for_year,
+    get_calendar,
+    is_holiday,
+)
+from jpx_derivatives.utils import to_datetime64
 
 # 取引時間の設定
 TRADING_HOURS = {
@@ -12,6 +19,15 @@ TRADING_HOURS = {
     "night_closing": {"start": time(5, 55), "end": time(6, 0)},
 }
 
+# 取引時間が2024/11/5に変更（日中取引の終了が15:15から15:45に、夜間取引の開始が16:30から17:00に）
+TRADING_HOURS_CHANGE_DATE = date(2024, 11, 5)
+TRADING_HOURS_BEFORE_CHANGE = {
+    "day": {"start": time(8, 45), "end": time(15, 10)},
+    "day_closing": {"start": time(15, 10), "end": time(15, 15)},
+    "night": {"start": time(16, 30), "end": time(5, 55)},
+    "night_closing": {"start": time(5, 55), "end": time(6, 0)},
+}
+
 
 class TradingSession(Enum):
     DAY = "DAY"  # 日中取引
@@ -27,20 +43,46 @@ class TradingSession(Enum):
         return self.value
 
 
+# get_session_codesが返すコードとTradingSessionの対応（SESSION_CODES[code]でTradingSessionに戻せる）
+SESSION_CODES = (
+    TradingSession.OFF_HOURS,
+    TradingSession.DAY,
+    TradingSession.DAY_CLOSING,
+    TradingSession.NIGHT,
+    TradingSession.NIGHT_CLOSING,
+)
+_SESSION_CODE = {session: np.uint8(code) for code, session in enumerate(SESSION_CODES)}
+_NS_PER_SECOND = 10**9
+_NS_PER_DAY = 24 * 60 * 60 * _NS_PER_SECOND
+_NAT = np.iinfo(np.int64).min
+
+
 def load_trading_hours() -> dict:
     """取引時間設定を返す"""
     return TRADING_HOURS
 
 
+def _trading_hours_on(day: date) -> dict:
+    """
+    その日の取引時間設定を返す
+
+    _hours_ns と同じく、2024/11/5より前の日は変更前の取引時間（TRADING_HOURS_BEFORE_CHANGE）を使用する
+    """
+    if day < TRADING_HOURS_CHANGE_DATE:
+        return TRADING_HOURS_BEFORE_CHANGE
+    return load_trading_hours()
+
+
 def get_current_session(current_datetime: datetime = None) -> TradingSession:
     """現在の立会時間を返す
 
     引数 current_datetime が指定されていない場合は、現在時刻 (datetime.now()) を使用して判定します。
+    日時の日付の取引時間で判定します（2024/11/5より前は日中取引が15:15まで、夜間取引が16:30から）。
     """
     if current_datetime is None:
         current_datetime = datetime.now()
     current_time = current_datetime.time()
-    config = load_trading_hours()
+    config = _trading_hours_on(current_datetime.date())
 
     # 日中取引
     if config["day"]["start"] <= current_time < config["day"]["end"]:
@@ -78,10 +120,11 @@ def get_closing_time(current_datetime: datetime = None) -> datetime:
     ・立会時間外の場合は None を返します
 
     引数 current_datetime が None の場合は、現在時刻 (datetime.now()) を使用します。
+    config は get_current_session と同じく日時の日付の取引時間設定です。
     """
     if current_datetime is None:
         current_datetime = datetime.now()
-    config = load_trading_hours()
+    config = _trading_hours_on(current_datetime.date())
     current_session = get_current_session(current_datetime)
 
     if current_session in [TradingSession.DAY, TradingSession.DAY_CLOSING]:
@@ -117,6 +160,8 @@ def is_trading_hours(current_datetime: datetime = None) -> bool:
     """
     指定された日時が取引可能な時間帯かどうかを判定する
 
+    立会時間は get_current_session と同じく日時の日付の取引時間で判定する。
+
     Args:
         current_datetime: 判定対象の日時（Noneの場合は現在時刻を使用）
 
@@ -133,3 +178,189 @@ def is_trading_hours(current_datetime: datetime = None) -> bool:
     # 立会時間判定
     current_session = get_current_session(current_datetime)
     return current_session not in [TradingSession.OFF_HOURS]
+
+
+def _time_ns(value: time) -> int:
+    """時刻を0時からのナノ秒に変換する"""
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * _NS_PER_SECOND + value.microsecond * 1000
+
+
+def _to_jst_ns(timestamps) -> np.ndarray:
+    """
+    日時の配列を日本時間のナノ秒（datetime64[ns] を int64 で見た値）に変換する
+
+    int64 の配列は datetime64[ns] を int64 で見た値（日本時間）とみなす
+    """
+    array = np.asarray(timestamps)
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64)
+    return to_datetime64(array).view(np.int64)
+
+
+def _hours_ns(days: np.ndarray, name: str, edge: str) -> np.ndarray:
+    """
+    日ごとの取引時間設定 [name][edge] の時刻（0時からのナノ秒）を返す
+
+    2024/11/5より前の日は変更前の取引時間（TRADING_HOURS_BEFORE_CHANGE）を使用する
+    """
+    return np.where(
+        days < np.datetime64(TRADING_HOURS_CHANGE_DATE),
+        _time_ns(TRADING_HOURS_BEFORE_CHANGE[name][edge]),
+        _time_ns(load_trading_hours()[name][edge]),
+    )
+
+
+def _session_codes(jst_ns: np.ndarray) -> np.ndarray:
+    current_time = jst_ns % _NS_PER_DAY
+    days = (jst_ns // _NS_PER_DAY).view("datetime64[D]")
+    day = (_hours_ns(days, "day", "start") <= current_time) & (
+        current_time < _hours_ns(days, "day", "end")
+    )
+    day_closing = (_hours_ns(days, "day_closing", "start") <= current_time) & (
+        current_time < _hours_ns(days, "day_closing", "end")
+    )
+    night = (_hours_ns(days, "night", "start") <= current_time) | (
+        current_time < _hours_ns(days, "night", "end")
+    )
+    night_closing = (_hours_ns(days, "night_closing", "start") <= current_time) & (
+        current_time < _hours_ns(days, "night_closing", "end")
+    )
+    # get_current_sessionと同じ優先順位で判定する。NaTは立会時間外とする
+    is_nat = jst_ns == _NAT
+    return np.select(
+        [is_nat, day, day_closing, night, night_closing],
+        [
+            _SESSION_CODE[TradingSession.OFF_HOURS],
+            _SESSION_CODE[TradingSession.DAY],
+            _SESSION_CODE[TradingSession.DAY_CLOSING],
+            _SESSION_CODE[TradingSession.NIGHT],
+            _SESSION_CODE[TradingSession.NIGHT_CLOSING],
+        ],
+        _SESSION_CODE[TradingSession.OFF_HOURS],
+    ).astype(np.uint8)
+
+
+def get_session_codes(timestamps) -> np.ndarray:
+    """
+    日時の配列の立会時間をまとめて判定し、セッションコードを返す（get_current_sessionの配列版）
+
+    各日時の日付の取引時間で判定する（2024/11/5より前は日中取引が15:15まで、夜間取引が16:30から）。
+
+    Args:
+        timestamps (array_like): datetime64 配列、または datetime64[ns] を int64 で見た値の配列。
+            timezoneがない場合は日本時間とみなす
+
+    Returns:
+        np.ndarray: uint8 のセッションコード。SESSION_CODES[code] で TradingSession に対応する
+    """
+    return _session_codes(_to_jst_ns(timestamps))
+
+
+def get_closing_times(timestamps) -> np.ndarray:
+    """
+    日時の配列それぞれのクロージングオークション終了日時を返す（get_closing_timeの配列版）
+
+    get_session_codesと同じく各日時の日付の取引時間を使用する。
+
+    Args:
+        timestamps (array_like): datetime64 配列、または datetime64[ns] を int64 で見た値の配列。
+            timezoneがない場合は日本時間とみなす
+
+    Returns:
+        np.ndarray: 日本時間の datetime64[ns] 配列。立会時間外の場合は NaT
+    """
+    jst_ns = _to_jst_ns(timestamps)
+    codes = _session_codes(jst_ns)
+    current_time = jst_ns % _NS_PER_DAY
+    midnight = jst_ns - current_time
+    days = (jst_ns // _NS_PER_DAY).view("datetime64[D]")
+
+    is_day = (codes == _SESSION_CODE[TradingSession.DAY]) | (
+        codes == _SESSION_CODE[TradingSession.DAY_CLOSING]
+    )
+    closing_time = np.where(
+        is_day,
+        _hours_ns(days, "day_closing", "end"),
+        _hours_ns(days, "night_closing", "end"),
+    )
+    candidate = midnight + closing_time
+    # 夜間取引で夜間クロージングオークションの開始時刻以降（0時になるまで）の場合は翌日
+    next_day = (codes == _SESSION_CODE[TradingSession.NIGHT]) & (
+        current_time >= _hours_ns(days, "night_closing", "start")
+    )
+    candidate = np.where(next_day | (candidate <= jst_ns), candidate + _NS_PER_DAY, candidate)
+
+    closing = candidate.view("datetime64[ns]")
+    return np.where(
+        codes == _SESSION_CODE[TradingSession.OFF_HOURS],
+        np.datetime64("NaT", "ns"),
+        closing,
+    )
+
+
+def is_trading_hours_array(timestamps) -> np.ndarray:
+    """
+    日時の配列が取引可能な時間帯かどうかをまとめて判定する（is_trading_hoursの配列版）
+
+    Args:
+        timestamps (array_like): datetime64 配列、または datetime64[ns] を int64 で見た値の配列。
+            timezoneがない場合は日本時間とみなす
+
+    Returns:
+        np.ndarray: 取引可能な時間の場合はTrue、それ以外（休日・立会時間外）の場合はFalse
+    """
+    jst_ns = _to_jst_ns(timestamps)
+    trading = _session_codes(jst_ns) != _SESSION_CODE[
+        TradingSession.OFF_HOURS
+    ]
+    if not trading.any():
+        return trading
+
+    # 立会時間内の日時のみ休日判定する
+    days = jst_ns[trading].view("datetime64[ns]").astype("datetime64[D]")
+    calendar = _calendar_covering(days)
+    trading[trading] = np.is_busday(days, busdaycal=calendar.busdaycalendar)
+    return trading
+
+
+def _calendar_covering(days: np.ndarray):
+    """
+    daysの全ての年を判定するための休業日カレンダーを返す。
+    休日データのない年はis_holidayと同様に更新モードに応じて扱う
+    """
+    calendar = get_calendar()
+    days = days[~np.isnat(days)]
+    if days.size == 0:
+        return calendar
+    first_year, last_year = (
+        days[[days.argmin(), days.argmax()]].astype("datetime64[Y]").astype(int) + 1970
+    )
+    for year in range(first_year, last_year + 1):
+        if not calendar.covers(year):
+            calendar = _calendar_for_year(calendar, year)
+    return calendar
+
+
+def get_trade_dates(timestamps) -> np.ndarray:
+    """
+    日時の配列それぞれのJPXの取引日を返す
+
+    夜間取引の開始時刻（2024/11/5より前は16:30、以降は17:00）以降の日時は翌日以降の最初の営業日、
+    それ以外の日時はその日以降の最初の営業日を取引日とする。
+    夜間取引の翌朝（土曜の早朝など）や休日の日時も次の営業日の取引日となる。
+
+    Args:
+        timestamps (array_like): datetime64 配列、または datetime64[ns] を int64 で見た値の配列。
+            timezoneがない場合は日本時間とみなす
+
+    Returns:
+        np.ndarray: datetime64[D] の取引日。NaT の場合は NaT
+    """
+    jst_ns = _to_jst_ns(timestamps)
+    is_nat = jst_ns == _NAT
+    days = np.where(is_nat, _NAT, jst_ns // _NS_PER_DAY).view("datetime64[D]")
+    days = days + (jst_ns % _NS_PER_DAY >= _hours_ns(days, "night", "start"))
+    calendar = _calendar_covering(days)
+    return np.busday_offset(days, 0, roll="forward", busdaycal=calendar.busdaycalendar)
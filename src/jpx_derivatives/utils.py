@@ -0,0 +1,52 @@
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def to_datetime64(values) -> np.ndarray:
+    """
+    日時の配列を日本時間の datetime64[ns] に変換する。timezoneがない場合は日本時間とみなす
+
+    Args:
+        values: datetime64 配列、datetime / date / pd.Timestamp / 文字列のリストなど
+
+    Returns:
+        np.ndarray: 日本時間の datetime64[ns] 配列（入力と同じ形）
+    """
+    array = np.asarray(values)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[ns]")
+    index = pd.DatetimeIndex(pd.to_datetime(array.ravel()))
+    if index.tz is not None:
+        index = index.tz_convert("Asia/Tokyo").tz_localize(None)
+    return index.to_numpy(dtype="datetime64[ns]").reshape(array.shape)
+
+
+@contextmanager
+def atomic_write(path) -> Iterator[Path]:
+    """
+    一時ファイルに書き込み、書き込みが完了したらファイルを置き換える
+
+    読み込み中のプロセスが書き込み途中のファイルを読まないよう、同じディレクトリの一時ファイルに書き込んでから
+    os.replace で置き換える。一時ファイル名にはプロセスIDと乱数を含めるため、
+    複数のプロセス・スレッドが同時に書き込んでも一時ファイルは重ならない。
+    書き込み中に例外が発生した場合は一時ファイルを削除し、元のファイルは変更しない。
+
+    Args:
+        path: 書き込み先のファイルのパス
+
+    Yields:
+        Path: 書き込む一時ファイルのパス（拡張子は .tmp）
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,179 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from jpx_derivatives import bsm
+
+# 価格のないセルの status（bsm.IVStatus のいずれの値とも重ならない）
+MISSING_STATUS = -1
+
+
+class VolatilitySurface:
+    """限月×行使価格のインプライド・ボラティリティ・サーフェス
+
+    全限月のオプション価格から一括でインプライド・ボラティリティを計算し、
+    iv[div - 1, 限月, 行使価格] の連続した配列として保持する。
+    価格のないセルの status は MISSING_STATUS（quoted は False）になる。
+    """
+
+    def __init__(
+        self,
+        s: float,
+        contract_months: list[str],
+        time_to_sq: list[float],
+        interest_rates: list[float],
+        contract_month,
+        strike,
+        div,
+        price,
+    ):
+        """
+        Args:
+            s (float): 原資産価格
+            contract_months (list[str]): サーフェスの限月（"2025-03" など）
+            time_to_sq (list[float]): 限月ごとのSQまでの残存期間（年単位）
+            interest_rates (list[float]): 限月ごとの金利
+            contract_month (array_like): 各オプションの限月
+            strike (array_like): 各オプションの行使価格
+            div (array_like): 各オプションの種類（1: プット、2: コール）
+            price (array_like): 各オプションの価格
+        """
+        self.s = float(s)
+        self.contract_months = np.asarray(contract_months, dtype=object)
+        self.time_to_sq = np.asarray(time_to_sq, dtype=np.float64)
+        self.interest_rates = np.asarray(interest_rates, dtype=np.float64)
+        if not (
+            self.contract_months.shape
+            == self.time_to_sq.shape
+            == self.interest_rates.shape
+        ):
+            raise ValueError(
+                "contract_months, time_to_sq, interest_ratesは同じ要素数を入れる"
+            )
+
+        expiry_index = pd.Index(self.contract_months).get_indexer(
+            np.asarray(contract_month, dtype=object)
+        )
+        if (expiry_index < 0).any():
+            raise ValueError("contract_monthsに含まれない限月が指定されています")
+        self.strikes, strike_index = np.unique(
+            np.asarray(strike, dtype=np.float64), return_inverse=True
+        )
+        div = np.asarray(div)
+        price = np.asarray(price, dtype=np.float64)
+        if not np.isin(div, [1, 2]).all():
+            raise ValueError("divは1（プット）または2（コール）で指定してください。")
+
+        shape = (2, self.contract_months.size, self.strikes.size)
+        position = (div - 1, expiry_index, strike_index)
+        cell = np.ravel_multi_index(position, shape)
+        unique_cell, counts = np.unique(cell, return_counts=True)
+        if (counts > 1).any():
+            div_index, i, j = np.unravel_index(unique_cell[counts > 1][0], shape)
+            raise ValueError(
+                f"限月{self.contract_months[i]}、行使価格{self.strikes[j]}、"
+                f"div={div_index + 1}の価格が重複しています"
+            )
+
+        result = bsm.solve_implied_volatility(
+            self.s,
+            self.strikes[strike_index],
+            self.time_to_sq[expiry_index],
+            self.interest_rates[expiry_index],
+            price,
+            div,
+        )
+
+        self.iv = np.full(shape, np.nan)
+        self.price = np.full(shape, np.nan)
+        self.status = np.full(shape, MISSING_STATUS, dtype=np.int8)
+        self.quoted = np.zeros(shape, dtype=bool)
+        self.iv[position] = result.sigma
+        self.price[position] = price
+        self.status[position] = result.status
+        self.quoted[position] = True
+
+    @classmethod
+    def from_client(
+        cls,
+        client,
+        s: float,
+        contract_month,
+        strike,
+        div,
+        price,
+        dt: datetime.datetime = None,
+    ) -> "VolatilitySurface":
+        """
+        Clientの限月・SQ日・金利を使ってサーフェスを作成する
+
+        Args:
+            client (Client): 限月数分の静的データを持つクライアント
+            s (float): 原資産価格
+            contract_month, strike, div, price: 各オプションの限月、行使価格、種類、価格
+            dt (datetime.datetime, optional): 評価日時。指定しない場合は現在時刻を使用
+
+        Returns:
+            VolatilitySurface: 作成したサーフェス
+        """
+        if dt is None:
+            dt = datetime.datetime.now()
+        # timezoneがなければ付与
+        if dt.tzinfo is None:
+            jst = datetime.timezone(datetime.timedelta(hours=9))
+            dt = dt.replace(tzinfo=jst)
+
+        contract_months = client.get_contract_months()
+        remaining_days = [
+            (sq_day - dt).total_seconds() / 86400
+            for sq_day in client.get_special_quotation_days()
+        ]
+        interest_rates = client.get_interest_rates(remaining_days)
+        time_to_sq = np.asarray(remaining_days) / 365
+        return cls(
+            s,
+            contract_months,
+            time_to_sq,
+            interest_rates,
+            contract_month,
+            strike,
+            div,
+            price,
+        )
+
+    def _expiry_index(self, contract_month: str) -> int:
+        index = np.flatnonzero(self.contract_months == contract_month)
+        if index.size == 0:
+            raise KeyError(f"{contract_month}はサーフェスに含まれていません")
+        return int(index[0])
+
+    def smile(self, contract_month: str, div: int) -> np.ndarray:
+        """
+        指定した限月・種類のインプライド・ボラティリティを行使価格順に返す（コピーなしのビュー）
+
+        Args:
+            contract_month (str): 限月
+            div (int): オプションの種類（1: プット、2: コール）
+
+        Returns:
+            np.ndarray: strikesに対応するインプライド・ボラティリティ
+        """
+        return self.iv[div - 1, self._expiry_index(contract_month)]
+
+    def get(self, contract_month: str, strike: float, div: int) -> float:
+        """
+        指定したオプションのインプライド・ボラティリティを返す
+
+        Args:
+            contract_month (str): 限月
+            strike (float): 行使価格
+            div (int): オプションの種類（1: プット、2: コール）
+
+        Returns:
+            float: インプライド・ボラティリティ（価格がない場合はNaN）
+        """
+        j = np.searchsorted(self.strikes, strike)
+        if j == self.strikes.size or self.strikes[j] != strike:
+            raise KeyError(f"行使価格{strike}はサーフェスに含まれていません")
+        return float(self.iv[div - 1, self._expiry_index(contract_month), j])
@@ -0,0 +1,51 @@
+import functools
+import http.server
+import shutil
+import threading
+import time
+
+import pytest
+
+from jpx_derivatives.config import data_dir
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """リモートの代わりに使うローカルディレクトリ"""
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ("special_quotation.parquet", "interest_rate_torf.parquet"):
+        shutil.copyfile(data_dir / name, source / name)
+    return source
+
+
+@pytest.fixture
+def serve_directory():
+    """ディレクトリを配信するローカルHTTPサーバーを起動するファクトリ
+
+    serve_directory(directory, delay=0.0) で (ベースURL, 受信したステータスのリスト) を返す
+    """
+    servers = []
+
+    def start(directory, delay: float = 0.0):
+        statuses = []
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(delay)
+                super().do_GET()
+
+            def log_request(self, code="-", size="-"):
+                statuses.append(int(code))
+
+        handler = functools.partial(Handler, directory=str(directory))
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}", statuses
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -1,16 +1,25 @@
 import numpy as np
 import pytest
+from scipy.stats import norm
 
 from jpx_derivatives.bsm import (
+    IVStatus,
     d1,
     d2,
     delta_call,
     delta_put,
     gamma,
+    greeks,
+    greeks_black76,
+    higher_order_greeks,
     implied_volatility_call,
     implied_volatility_put,
+    price,
+    price_black76,
     price_call,
     price_put,
+    solve_implied_volatility,
+    solve_implied_volatility_black76,
     theta_call,
     theta_put,
     vega,
@@ -124,4 +133,146 @@ def test_zero_time_to_expiry(option_params):
     
     # プットオプション
     put_value = price_put(**params)
-    assert put_value == max(0, params['k'] - params['s']) 
\ No newline at end of file
+    assert put_value == max(0, params['k'] - params['s'])
+
+
+def test_price_array_matches_scalar(option_params):
+    """配列版の価格計算がスカラー版と一致することを確認"""
+    strikes = np.arange(37000.0, 40500.0, 250.0)
+    t = np.array([0.0, 0.024657534246575342, 0.1])[:, None]
+    calls = price(option_params['s'], strikes, t, option_params['r'], option_params['sigma'], 2)
+    puts = price(option_params['s'], strikes, t, option_params['r'], option_params['sigma'], 1)
+    assert calls.shape == (3, strikes.size)
+    for i, ti in enumerate(t[:, 0]):
+        for j, kj in enumerate(strikes):
+            params = dict(option_params, k=kj, t=ti)
+            assert calls[i, j] == pytest.approx(price_call(**params), abs=1e-8)
+            assert puts[i, j] == pytest.approx(price_put(**params), abs=1e-8)
+
+
+def test_price_array_mixed_div(option_params):
+    """div配列でコールとプットを混在させられることを確認"""
+    values = price(**option_params, div=np.array([2, 1]))
+    assert values[0] == pytest.approx(price_call(**option_params))
+    assert values[1] == pytest.approx(price_put(**option_params))
+    with pytest.raises(ValueError):
+        price(**option_params, div=3)
+
+
+def test_greeks_matches_scalar_functions(option_params):
+    """一括計算したグリークスが個別の関数と一致することを確認"""
+    call = greeks(**option_params, div=2)
+    put = greeks(**option_params, div=1)
+    assert call.price == pytest.approx(price_call(**option_params))
+    assert put.price == pytest.approx(price_put(**option_params))
+    assert call.delta == pytest.approx(delta_call(**option_params))
+    assert put.delta == pytest.approx(delta_put(**option_params))
+    assert call.gamma == pytest.approx(gamma(**option_params))
+    assert put.gamma == pytest.approx(gamma(**option_params))
+    assert call.vega == pytest.approx(vega(**option_params))
+    assert call.theta == pytest.approx(theta_call(**option_params))
+    assert put.theta == pytest.approx(theta_put(**option_params))
+
+
+def test_greeks_array_with_expired_rows(option_params):
+    """配列を渡すと配列のグリークスが返り、満期済みの要素が本質的価値になることを確認"""
+    strikes = np.array([38500.0, 38750.0, 39000.0])
+    t = np.array([0.0, 0.0, option_params['t']])
+    result = greeks(option_params['s'], strikes, t, option_params['r'], option_params['sigma'], 2)
+    assert result.price.shape == (3,)
+    assert result.price[0] == pytest.approx(290.0)
+    assert result.delta[0] == 1.0
+    assert result.delta[1] == 1.0
+    assert result.gamma[0] == 0.0
+    assert result.price[2] == pytest.approx(
+        price_call(option_params['s'], 39000.0, option_params['t'], option_params['r'], option_params['sigma'])
+    )
+
+
+def test_solve_implied_volatility_round_trip(option_params):
+    """価格から求めたIVが元のボラティリティに戻ることを確認"""
+    strikes = np.arange(36000.0, 41500.0, 250.0)
+    t = np.array([0.024657534246575342, 0.1, 0.5])[:, None]
+    sigma = np.linspace(0.15, 0.35, strikes.size)
+    for div in (1, 2):
+        prices = price(option_params['s'], strikes, t, option_params['r'], sigma, div)
+        result = solve_implied_volatility(option_params['s'], strikes, t, option_params['r'], prices, div)
+        assert result.converged.all()
+        np.testing.assert_allclose(result.sigma, np.broadcast_to(sigma, result.sigma.shape), atol=1e-6)
+
+
+def test_solve_implied_volatility_status():
+    """解が存在しない要素に状態コードが設定されることを確認"""
+    result = solve_implied_volatility(100.0, 100.0, [0.0, 1.0, 1.0, 1.0], 0.0, [5.0, 150.0, -1.0, np.nan], 2)
+    assert list(result.status) == [
+        IVStatus.EXPIRED,
+        IVStatus.ABOVE_UPPER_BOUND,
+        IVStatus.BELOW_INTRINSIC,
+        IVStatus.INVALID,
+    ]
+    assert np.isnan(result.sigma).all()
+    assert not result.converged.any()
+
+
+def test_black76_price():
+    """Black-76の価格が割引した先物価格のBlack-Scholes価格と一致することを確認"""
+    f, k, t, r, sigma = 38800.0, np.array([38000.0, 38750.0, 39500.0]), 0.1, 0.005, 0.2
+    discount = np.exp(-r * t)
+    d1_value = (np.log(f / k) + 0.5 * sigma**2 * t) / (sigma * np.sqrt(t))
+    d2_value = d1_value - sigma * np.sqrt(t)
+    expected_call = discount * (f * norm.cdf(d1_value) - k * norm.cdf(d2_value))
+    expected_put = discount * (k * norm.cdf(-d2_value) - f * norm.cdf(-d1_value))
+    np.testing.assert_allclose(price_black76(f, k, t, r, sigma, 2), expected_call, rtol=1e-10)
+    np.testing.assert_allclose(price_black76(f, k, t, r, sigma, 1), expected_put, rtol=1e-10)
+    assert price_black76(f, 38000.0, 0.0, r, sigma, 2) == pytest.approx(800.0)
+
+
+@pytest.mark.parametrize("div", [1, 2])
+def test_black76_greeks_finite_difference(div):
+    """Black-76のグリークスが差分近似と一致することを確認"""
+    f, k, t, r, sigma = 38800.0, 38750.0, 0.1, 0.005, 0.2
+    result = greeks_black76(f, k, t, r, sigma, div)
+    h = 1.0
+    up = price_black76(f + h, k, t, r, sigma, div)
+    down = price_black76(f - h, k, t, r, sigma, div)
+    assert result.delta == pytest.approx((up - down) / (2 * h), rel=1e-6)
+    assert result.gamma == pytest.approx((up - 2 * result.price + down) / h**2, rel=1e-4)
+    dv = 1e-5
+    vega_fd = (price_black76(f, k, t, r, sigma + dv, div) - price_black76(f, k, t, r, sigma - dv, div)) / (2 * dv)
+    assert result.vega == pytest.approx(vega_fd, rel=1e-6)
+    dt = 1e-6
+    theta_fd = -(price_black76(f, k, t + dt, r, sigma, div) - price_black76(f, k, t - dt, r, sigma, div)) / (2 * dt)
+    assert result.theta == pytest.approx(theta_fd, rel=1e-5)
+
+
+def test_black76_implied_volatility_round_trip():
+    """Black-76の価格からIVが元に戻ることを確認"""
+    k = np.arange(36000.0, 41500.0, 500.0)
+    prices = price_black76(38800.0, k, 0.1, 0.005, 0.22, 1)
+    result = solve_implied_volatility_black76(38800.0, k, 0.1, 0.005, prices, 1)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.sigma, 0.22, atol=1e-6)
+
+
+def test_higher_order_greeks_finite_difference(option_params):
+    """高次のグリークスが一次のグリークスの差分近似と一致することを確認"""
+    s, k, t, r, sigma = (option_params[key] for key in ['s', 'k', 't', 'r', 'sigma'])
+    result = higher_order_greeks(s, k, t, r, sigma)
+    ds, dv, dt = 1.0, 1e-5, 1e-7
+    for div in (1, 2):
+        vanna_fd = (greeks(s, k, t, r, sigma + dv, div).delta - greeks(s, k, t, r, sigma - dv, div).delta) / (2 * dv)
+        volga_fd = (greeks(s, k, t, r, sigma + dv, div).vega - greeks(s, k, t, r, sigma - dv, div).vega) / (2 * dv)
+        charm_fd = -(greeks(s, k, t + dt, r, sigma, div).delta - greeks(s, k, t - dt, r, sigma, div).delta) / (2 * dt)
+        assert result.vanna == pytest.approx(vanna_fd, rel=1e-5)
+        assert result.volga == pytest.approx(volga_fd, rel=1e-4, abs=1e-3)
+        assert result.charm == pytest.approx(charm_fd, rel=1e-4)
+    speed_fd = (greeks(s + ds, k, t, r, sigma, 2).gamma - greeks(s - ds, k, t, r, sigma, 2).gamma) / (2 * ds)
+    assert result.speed == pytest.approx(speed_fd, rel=1e-4)
+
+
+def test_higher_order_greeks_array():
+    """配列を渡すと配列で返り、満期済みの要素が0になることを確認"""
+    result = higher_order_greeks(38790.0, np.array([38000.0, 39000.0]), np.array([0.0, 0.1]), 0.001, 0.2)
+    assert result.vanna.shape == (2,)
+    assert result.vanna[0] == result.volga[0] == result.charm[0] == result.speed[0] == 0.0
+    assert result.volga[1] != 0.0
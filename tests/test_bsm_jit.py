@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from jpx_derivatives import bsm, bsm_jit
+
+
+@pytest.fixture(params=["python", "numba"])
+def backend(request):
+    """各バックエンドに切り替えるフィクスチャ"""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    previous = bsm_jit.get_backend()
+    bsm_jit.set_backend(request.param)
+    yield request.param
+    bsm_jit.set_backend(previous)
+
+
+@pytest.mark.parametrize("k", [36000.0, 38750.0, 41000.0])
+@pytest.mark.parametrize("t", [0.0, 0.024657534246575342, 0.5])
+@pytest.mark.parametrize("div", [1, 2])
+def test_greeks_match_bsm(backend, k, t, div):
+    """価格とグリークスがbsmの計算と許容誤差内で一致することを確認"""
+    params = {"s": 38790.0, "k": k, "t": t, "r": 0.001, "sigma": 0.2087}
+    expected = bsm.greeks(**params, div=div)
+    result = bsm_jit.greeks(**params, div=div)
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+    assert bsm_jit.price(**params, div=div) == pytest.approx(expected.price, rel=1e-10, abs=1e-12)
+
+
+@pytest.mark.parametrize("div,price", [(1, 487.0), (2, 527.0)])
+def test_implied_volatility_matches_bsm(backend, div, price):
+    """インプライドボラティリティがbsmの計算と一致することを確認"""
+    params = {"s": 38790.0, "k": 38750.0, "t": 0.024657534246575342, "r": 0.001}
+    expected = bsm.implied_volatility(**params, price=price, div=div)
+    assert bsm_jit.implied_volatility(**params, price=price, div=div) == pytest.approx(expected, abs=1e-8)
+
+
+def test_implied_volatility_out_of_bounds(backend):
+    """裁定条件を満たさない価格ではNaNを返すことを確認"""
+    assert np.isnan(bsm_jit.implied_volatility(100.0, 100.0, 1.0, 0.0, 150.0, 2))
+
+
+def test_set_backend_invalid():
+    """不正なバックエンド名でエラーになることを確認"""
+    with pytest.raises(ValueError):
+        bsm_jit.set_backend("cuda")
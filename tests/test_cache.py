@@ -0,0 +1,106 @@
+import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from jpx_derivatives.cache import ParquetCache
+from jpx_derivatives.client import HttpsStaticDataProvider
+from jpx_derivatives.config import data_dir
+
+
+@pytest.fixture
+def http_server(source_dir, serve_directory):
+    return serve_directory(source_dir)
+
+
+def test_fetch_http_revalidation(tmp_path, http_server):
+    """TTL内はアクセスせず、TTL経過後はLast-Modifiedで再検証することを確認"""
+    base_url, statuses = http_server
+    url = f"{base_url}/special_quotation.parquet"
+    cache = ParquetCache(tmp_path / "cache", ttl=3600)
+    path = cache.fetch(url)
+    assert path.read_bytes() == (data_dir / "special_quotation.parquet").read_bytes()
+    assert cache.fetch(url) == path
+    assert statuses == [200]
+
+    cache.ttl = 0
+    assert cache.fetch(url) == path
+    assert statuses == [200, 304]
+
+
+def test_fetch_offline_and_stale(tmp_path, http_server, monkeypatch):
+    """オフラインモードと取得失敗時にキャッシュを使うことを確認"""
+    base_url, _ = http_server
+    url = f"{base_url}/interest_rate_torf.parquet"
+    offline = ParquetCache(tmp_path / "cache", offline=True)
+    with pytest.raises(FileNotFoundError):
+        offline.fetch(url)
+
+    path = ParquetCache(tmp_path / "cache").fetch(url)
+    assert offline.fetch(url) == path
+
+    # 取得に失敗しても古いキャッシュを返す
+    def unreachable(*args, **kwargs):
+        raise requests.ConnectionError("unreachable")
+
+    monkeypatch.setattr("jpx_derivatives.cache.requests.get", unreachable)
+    stale = ParquetCache(tmp_path / "cache", ttl=0)
+    assert stale.fetch(url) == path
+    with pytest.raises(requests.ConnectionError):
+        stale.fetch(f"{base_url}/special_quotation.parquet")
+
+
+def test_fetch_local_directory_and_eviction(tmp_path, source_dir):
+    """ローカルディレクトリのファイルを更新時刻で再検証し、サイズ上限で古いファイルを削除することを確認"""
+    sq_path = str(source_dir / "special_quotation.parquet")
+    rate_path = str(source_dir / "interest_rate_torf.parquet")
+    cache = ParquetCache(tmp_path / "cache", ttl=0, max_bytes=os.path.getsize(rate_path))
+    cached_sq = cache.fetch(sq_path)
+    assert cached_sq.exists()
+
+    cached_rate = cache.fetch(rate_path)
+    assert cached_rate.exists()
+    assert not cached_sq.exists()
+
+
+def test_fetch_corrupted_meta(tmp_path, http_server):
+    """読み込めないメタデータはキャッシュなしとして再取得することを確認"""
+    base_url, statuses = http_server
+    url = f"{base_url}/special_quotation.parquet"
+    cache = ParquetCache(tmp_path / "cache")
+    path = cache.fetch(url)
+    meta_path = path.with_name(path.name + ".json")
+
+    for broken in ('{"etag": null, "fetched_', "[]"):
+        meta_path.write_text(broken)
+        assert cache.fetch(url) == path
+    assert statuses == [200, 200, 200]
+    assert cache.fetch(url) == path
+    assert statuses == [200, 200, 200]
+
+
+def test_fetch_concurrent(tmp_path, source_dir):
+    """同じファイルを同時に取得しても一時ファイルが衝突しないことを確認"""
+    sq_path = str(source_dir / "special_quotation.parquet")
+    caches = [ParquetCache(tmp_path / "cache", ttl=0) for _ in range(16)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        paths = list(executor.map(lambda cache: cache.fetch(sq_path), caches * 4))
+    assert len(set(paths)) == 1
+    assert paths[0].read_bytes() == (source_dir / "special_quotation.parquet").read_bytes()
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_provider_uses_cache(tmp_path, source_dir):
+    """静的データプロバイダーがキャッシュ経由でデータを読み込むことを確認"""
+    cache = ParquetCache(tmp_path / "cache")
+    provider = HttpsStaticDataProvider(3, datetime.datetime(2025, 3, 3), cache=cache)
+    provider.set_data(str(source_dir))
+    assert provider.get_contract_months() == ["2025-03", "2025-04", "2025-05"]
+
+    offline = HttpsStaticDataProvider(
+        3, datetime.datetime(2025, 3, 3), cache=ParquetCache(tmp_path / "cache", offline=True)
+    )
+    offline.set_data(str(source_dir))
+    assert offline.get_contract_months() == ["2025-03", "2025-04", "2025-05"]
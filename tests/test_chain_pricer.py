@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from jpx_derivatives.bsm import greeks
+from jpx_derivatives.chain_pricer import ChainPricer
+
+
+@pytest.fixture
+def chain():
+    """満期済み・2限月の行使価格×コール・プットのチェーン"""
+    strikes = np.arange(37000.0, 41000.0, 250.0)
+    k = np.tile(strikes, 4)
+    t = np.repeat([0.0, 0.024657534246575342, 0.024657534246575342, 0.1], strikes.size)
+    div = np.tile(np.repeat([1, 2], strikes.size // 2), 4)
+    sigma = np.linspace(0.15, 0.3, k.size)
+    return k, t, 0.001, sigma, div
+
+
+def test_update_spot_matches_greeks(chain):
+    """原資産価格の更新結果がbsm.greeksと一致することを確認"""
+    k, t, r, sigma, div = chain
+    pricer = ChainPricer(k, t, r, sigma, div)
+    for s in (38790.0, 39000.0):
+        result = pricer.update_spot(s)
+        np.testing.assert_allclose(result, greeks(s, k, t, r, sigma, div), rtol=1e-10, atol=1e-10)
+
+
+def test_update_volatility_and_rate_rows(chain):
+    """ボラティリティ・金利の更新が対象の行のみに反映されることを確認"""
+    k, t, r, sigma, div = chain
+    pricer = ChainPricer(k, t, r, sigma, div)
+    pricer.update_spot(38790.0)
+    before = np.array(pricer.greeks)
+
+    rows = np.array([3, 20, 40])
+    pricer.update_volatility(0.4, rows)
+    new_sigma = sigma.copy()
+    new_sigma[rows] = 0.4
+    after = np.array(pricer.greeks)
+    np.testing.assert_allclose(after, greeks(38790.0, k, t, r, new_sigma, div), rtol=1e-10, atol=1e-10)
+    untouched = np.setdiff1d(np.arange(k.size), rows)
+    np.testing.assert_array_equal(after[:, untouched], before[:, untouched])
+
+    mask = t > 0.05
+    pricer.update_rate(0.005, mask)
+    new_r = np.where(mask, 0.005, r)
+    np.testing.assert_allclose(pricer.greeks, greeks(38790.0, k, t, new_r, new_sigma, div), rtol=1e-10, atol=1e-10)
+
+
+def test_update_before_spot(chain):
+    """原資産価格の設定前に更新しても価格は未計算のままであることを確認"""
+    k, t, r, sigma, div = chain
+    pricer = ChainPricer(k, t, r, sigma, div)
+    assert np.isnan(pricer.update_volatility(0.2).price).all()
+    np.testing.assert_allclose(
+        pricer.update_spot(38790.0).price, greeks(38790.0, k, t, r, 0.2, div).price, rtol=1e-10
+    )
@@ -1,6 +1,7 @@
 import datetime
 from io import StringIO
 
+import numpy as np
 import pandas as pd
 import pytest
 import pytz
@@ -236,3 +237,96 @@ class TestMaturityInfoClass:
         )
         assert late_contract[0].hour == 15
         assert late_contract[0].minute == 45
+
+    @pytest.mark.parametrize("contract_frequency", ["monthly", "weekly"])
+    def test_get_contract_schedule(self, maturity_info, contract_frequency):
+        """get_contract_scheduleがget_contract_datesをcount回呼んだ結果と一致することをテスト"""
+        dt = datetime.datetime(2024, 10, 1, 12, 0)
+        schedule = maturity_info.get_contract_schedule(dt, 3, contract_frequency)
+        assert list(schedule.columns) == [
+            "ContractMonth",
+            "LastTradingDay",
+            "SpecialQuotationDay",
+            "RemainingDays",
+        ]
+        for i in range(3):
+            ltd, sq, cm = maturity_info.get_contract_dates(dt, i + 1, contract_frequency)
+            assert schedule["ContractMonth"].iloc[i] == cm
+            assert schedule["LastTradingDay"].iloc[i] == ltd
+            assert schedule["SpecialQuotationDay"].iloc[i] == sq
+
+        # 2024-10-11 9:00 まで 9日と21時間
+        if contract_frequency == "monthly":
+            assert schedule["RemainingDays"].iloc[0] == pytest.approx(9 + 21 / 24)
+
+        with pytest.raises(ValueError, match="限月は存在しません"):
+            maturity_info.get_contract_schedule(dt, 100, contract_frequency)
+
+    def test_get_contract_dates_boundary(self, maturity_info):
+        """最終取引日時ちょうどの場合、その限月は次限月にも前限月にも含まれないことをテスト"""
+        jst = datetime.timezone(datetime.timedelta(hours=9))
+        ltd_dt = datetime.datetime(2024, 10, 10, 15, 15, tzinfo=jst)
+
+        _, _, cm = maturity_info.get_contract_dates(ltd_dt, 1, "monthly")
+        assert cm == "2024-11"
+        _, _, cm = maturity_info.get_contract_dates(ltd_dt, -1, "monthly")
+        assert cm == "2024-09"
+
+        # 1マイクロ秒前はまだ取引中
+        just_before = ltd_dt - datetime.timedelta(microseconds=1)
+        _, _, cm = maturity_info.get_contract_dates(just_before, 1, "monthly")
+        assert cm == "2024-10"
+
+        # 他のタイムゾーンの日時も同じ時刻として扱う
+        utc_dt = ltd_dt.astimezone(datetime.timezone.utc)
+        assert maturity_info.get_contract_dates(
+            utc_dt, 1, "monthly"
+        ) == maturity_info.get_contract_dates(ltd_dt, 1, "monthly")
+
+    @pytest.mark.parametrize("contract_frequency", ["monthly", "weekly"])
+    def test_get_contract_dates_array(self, maturity_info, contract_frequency):
+        """get_contract_dates_arrayがget_contract_datesを1件ずつ呼んだ結果と一致することをテスト"""
+        dt = pd.date_range("2024-09-01", "2025-01-31", freq="17h").to_numpy()
+        nth = [1, 2, -1, -2]
+        result = maturity_info.get_contract_dates_array(
+            dt, nth, contract_frequency, errors="coerce"
+        )
+        assert result.contract_month.shape == (len(nth), dt.size)
+
+        for j, n in enumerate(nth):
+            for i, value in enumerate(dt):
+                try:
+                    ltd, sq, cm = maturity_info.get_contract_dates(
+                        pd.Timestamp(value).to_pydatetime(), n, contract_frequency
+                    )
+                except ValueError:
+                    assert not result.valid[j, i]
+                    assert result.contract_month[j, i] is None
+                    assert np.isnat(result.last_trading_day[j, i])
+                    continue
+                assert result.valid[j, i]
+                assert result.contract_month[j, i] == cm
+                assert result.last_trading_day[j, i] == ltd.tz_localize(None)
+                assert result.special_quotation_day[j, i] == sq.tz_localize(None)
+
+    def test_get_contract_dates_array_errors(self, maturity_info):
+        """get_contract_dates_arrayの範囲外・NaT・タイムゾーンの扱いをテスト"""
+        dt = np.array(
+            ["2024-10-01T00:00", "NaT", "2024-12-20T00:00"], dtype="datetime64[ns]"
+        )
+        with pytest.raises(ValueError, match="限月は存在しません"):
+            maturity_info.get_contract_dates_array(dt, [1, 100], "monthly")
+        with pytest.raises(ValueError, match="errorsは"):
+            maturity_info.get_contract_dates_array(dt, [1], "monthly", errors="ignore")
+        with pytest.raises(ValueError, match="nth_contract_monthは0以外"):
+            maturity_info.get_contract_dates_array(dt, [0], "monthly")
+
+        # NaTはエラーにならずNaTを返す
+        result = maturity_info.get_contract_dates_array(dt, [1], "monthly")
+        assert list(result.contract_month[0]) == ["2024-10", None, "2025-01"]
+        assert list(result.valid[0]) == [True, False, True]
+
+        # timezone付きの日時は日本時間に変換して扱う
+        utc = pd.DatetimeIndex(["2024-10-10 06:14", "2024-10-10 06:15"], tz="UTC")
+        result = maturity_info.get_contract_dates_array(utc, [1], "monthly")
+        assert list(result.contract_month[0]) == ["2024-10", "2024-11"]
@@ -0,0 +1,239 @@
+import datetime
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives.cache import ParquetCache
+from jpx_derivatives.client import (
+    AutoStaticDataProvider,
+    BacktestClient,
+    Client,
+    HttpsStaticDataProvider,
+    LocalStaticDataProvider,
+    StaticDataProviderBase,
+)
+
+
+@pytest.fixture
+def mirrors(tmp_path, source_dir, serve_directory):
+    """応答の遅いミラーと速いミラー、存在しないミラーのURL"""
+    slow_url, _ = serve_directory(source_dir, delay=2.0)
+    fast_url, _ = serve_directory(source_dir)
+    broken_url, _ = serve_directory(tmp_path)
+    yield {"slow": slow_url, "fast": fast_url, "broken": broken_url}
+    # 使用されなかった取得元の読み込みが終わるまで待つ
+    for thread in threading.enumerate():
+        if thread.name.startswith("jpx_derivatives-static-"):
+            thread.join()
+
+
+def make_provider(tmp_path, sources, **kwargs):
+    return AutoStaticDataProvider(
+        3,
+        datetime.datetime(2025, 3, 3),
+        cache=ParquetCache(tmp_path / "cache"),
+        sources=sources,
+        **kwargs,
+    )
+
+
+def test_auto_fallback_on_error(tmp_path, mirrors):
+    """最初の取得元が失敗した場合に次の取得元へフォールバックすることを確認"""
+    provider = make_provider(tmp_path, {"r2": mirrors["broken"], "github": mirrors["fast"]})
+    assert provider.source == "github"
+    assert "r2" in provider.errors
+    assert set(provider.latencies) == {"r2", "github"}
+    assert provider.get_contract_months() == ["2025-03", "2025-04", "2025-05"]
+
+
+def test_auto_hedged(tmp_path, mirrors):
+    """hedge_delay経過後に次の取得元を並行して開始し、先に成功した方を使うことを確認"""
+    started = time.perf_counter()
+    provider = make_provider(
+        tmp_path, {"r2": mirrors["slow"], "github": mirrors["fast"]}, hedge_delay=0.1
+    )
+    assert time.perf_counter() - started < 1.5
+    assert provider.source == "github"
+    assert provider.latencies["github"] < 1.5
+    assert provider.get_contract_months() == ["2025-03", "2025-04", "2025-05"]
+
+
+def test_auto_timeout(tmp_path, mirrors):
+    """タイムアウトした取得元を失敗として次の取得元を使うことを確認"""
+    started = time.perf_counter()
+    provider = make_provider(
+        tmp_path, {"r2": mirrors["slow"], "github": mirrors["fast"]}, timeout=0.5
+    )
+    assert time.perf_counter() - started < 1.5
+    assert provider.source == "github"
+    assert isinstance(provider.errors["r2"], TimeoutError)
+    assert 0.5 <= provider.latencies["r2"] < 1.5
+
+
+def test_auto_all_sources_fail(tmp_path, mirrors):
+    """全ての取得元が失敗した場合にエラーになることを確認"""
+    with pytest.raises(RuntimeError):
+        make_provider(tmp_path, {"r2": mirrors["broken"], "github": mirrors["broken"]})
+
+
+def test_backtest_client(tmp_path, mirrors):
+    """評価日時ごとの結果が日付ごとに作成したプロバイダーの結果と一致することを確認"""
+    cache = ParquetCache(tmp_path / "cache")
+    client = BacktestClient(
+        3, cache=cache, sources={"r2": mirrors["broken"], "github": mirrors["fast"]}
+    )
+    assert client.source == "github"
+    assert "r2" in client.errors
+    assert set(client.latencies) == {"r2", "github"}
+
+    dt = np.array(
+        ["2025-03-03T10:00", "2025-03-13T15:45", "2025-06-20T20:00"],
+        dtype="datetime64[ns]",
+    )
+    schedule = client.get_schedule(dt)
+    assert schedule.contract_month.shape == (3, 3)
+    for i, value in enumerate(dt):
+        provider = HttpsStaticDataProvider(
+            3, pd.Timestamp(value).to_pydatetime(), cache=cache
+        )
+        provider.set_data(mirrors["fast"])
+        expected = provider.get_contract_schedule()
+        assert list(schedule.contract_month[:, i]) == expected["ContractMonth"].tolist()
+        np.testing.assert_allclose(
+            schedule.remaining_days[:, i], expected["RemainingDays"]
+        )
+        np.testing.assert_allclose(
+            schedule.interest_rate[:, i],
+            provider.get_interest_rates(expected["RemainingDays"].tolist()),
+            rtol=1e-12,
+        )
+
+    table = client.get_schedule_table(dt)
+    assert table.num_rows == 9
+    assert table.column("ContractMonth").to_pylist()[:3] == ["2025-03", "2025-04", "2025-05"]
+
+
+def test_backtest_client_out_of_range(tmp_path, mirrors):
+    """金利データより前の評価日時の扱いを確認"""
+    client = BacktestClient(
+        2, cache=ParquetCache(tmp_path / "cache"), sources={"github": mirrors["fast"]}
+    )
+    dt = np.array(["2024-01-04", "2025-03-03"], dtype="datetime64[ns]")
+    with pytest.raises(ValueError, match="金利データはありません"):
+        client.get_schedule(dt)
+
+    schedule = client.get_schedule(dt, errors="coerce")
+    assert list(schedule.valid[:, 0]) == [False, False]
+    assert list(schedule.valid[:, 1]) == [True, True]
+    table = client.get_schedule_table(dt, errors="coerce")
+    assert table.column("InterestRate").null_count == 2
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_local_provider(tmp_path, source_dir, memory_map):
+    """ローカルディレクトリから読み込んだ結果がHTTPSプロバイダーと一致することを確認"""
+    dt = datetime.datetime(2025, 3, 3)
+    client = Client(
+        3,
+        dt,
+        static_data_provider="local",
+        static_provider_options={"directory": source_dir, "memory_map": memory_map},
+    )
+    expected = HttpsStaticDataProvider(3, dt)
+    expected.set_data(str(source_dir))
+    pd.testing.assert_frame_equal(
+        client.get_contract_schedule(), expected.get_contract_schedule()
+    )
+    assert client.get_interest_rates([10, 40, 70]) == expected.get_interest_rates(
+        [10, 40, 70]
+    )
+    assert (source_dir / "arrow" / "special_quotation.arrow").exists() is memory_map
+
+
+def test_local_provider_rejects_cache(tmp_path, source_dir):
+    """ローカルのファイルを読むプロバイダーにキャッシュを指定した場合はエラーになることを確認"""
+    with pytest.raises(ValueError):
+        Client(
+            3,
+            datetime.datetime(2025, 3, 3),
+            static_data_provider="local",
+            cache=ParquetCache(tmp_path / "cache"),
+            static_provider_options={"directory": source_dir},
+        )
+
+
+def test_local_provider_reconverts_updated_parquet(tmp_path, source_dir):
+    """Arrow IPCファイルは初回のみ作成し、parquetが更新された場合に再作成することを確認"""
+    options = {"directory": source_dir, "memory_map": True, "arrow_dir": tmp_path / "arrow"}
+    LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    arrow_path = tmp_path / "arrow" / "interest_rate_torf.arrow"
+    converted = arrow_path.stat().st_mtime_ns
+
+    LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    assert arrow_path.stat().st_mtime_ns == converted
+
+    # 2025-03-03の金利を書き換える
+    interest_rate = pd.read_parquet(source_dir / "interest_rate_torf.parquet")
+    interest_rate[["InterestRate1M", "InterestRate3M", "InterestRate6M"]] = 0.0
+    time.sleep(0.01)
+    interest_rate.to_parquet(source_dir / "interest_rate_torf.parquet")
+    provider = LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    assert arrow_path.stat().st_mtime_ns > converted
+    assert provider.get_interest_rates([10, 40, 70]) == [0.0, 0.0, 0.0]
+
+
+def test_local_provider_reconverts_parquet_with_older_mtime(tmp_path, source_dir):
+    """parquetが更新時刻の古いファイルに置き換えられた場合もArrow IPCファイルを再作成することを確認"""
+    options = {"directory": source_dir, "memory_map": True, "arrow_dir": tmp_path / "arrow"}
+    source = source_dir / "interest_rate_torf.parquet"
+    LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    original = source.stat().st_mtime_ns
+
+    # 2025-03-03の金利を書き換え、更新時刻を変換前より古くする
+    interest_rate = pd.read_parquet(source)
+    interest_rate[["InterestRate1M", "InterestRate3M", "InterestRate6M"]] = 0.0
+    interest_rate.to_parquet(source)
+    os.utime(source, ns=(original - 10**9, original - 10**9))
+    provider = LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    assert provider.get_interest_rates([10, 40, 70]) == [0.0, 0.0, 0.0]
+
+    # 壊れたArrow IPCファイルも再作成する
+    (tmp_path / "arrow" / "interest_rate_torf.arrow").write_bytes(b"broken")
+    provider = LocalStaticDataProvider(3, datetime.datetime(2025, 3, 3), **options)
+    assert provider.get_interest_rates([10, 40, 70]) == [0.0, 0.0, 0.0]
+
+
+class ListStaticDataProvider(StaticDataProviderBase):
+    """get_contract_scheduleを実装しない既存のプロバイダーと同じ形のテスト用プロバイダー"""
+
+    def __init__(self, provider: HttpsStaticDataProvider):
+        self.dt = provider.dt
+        self.provider = provider
+
+    def get_contract_months(self):
+        return self.provider.get_contract_months()
+
+    def get_last_trading_days(self):
+        # timezoneのない日時を返すプロバイダーも日本時間として扱う
+        return [day.replace(tzinfo=None) for day in self.provider.get_last_trading_days()]
+
+    def get_special_quotation_days(self):
+        return self.provider.get_special_quotation_days()
+
+    def get_interest_rates(self, remaining_days):
+        return self.provider.get_interest_rates(remaining_days)
+
+
+def test_default_contract_schedule(source_dir):
+    """get_contract_scheduleを実装しないプロバイダーでも同じスケジュールを返すことを確認"""
+    provider = HttpsStaticDataProvider(3, datetime.datetime(2025, 3, 3))
+    provider.set_data(str(source_dir))
+    pd.testing.assert_frame_equal(
+        ListStaticDataProvider(provider).get_contract_schedule(),
+        provider.get_contract_schedule(),
+        check_dtype=False,
+    )
@@ -0,0 +1,96 @@
+import datetime
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.interpolate import CubicSpline
+
+from jpx_derivatives.get_interest_rate_torf import (
+    InterestRateCurve,
+    InterestRatePanel,
+    get_curve,
+    interpolate_interest_rate,
+)
+
+DATA_INTEREST_RATE = {30: 0.0042, 90: 0.0048, 180: 0.0055}
+
+
+def test_interpolate_interest_rate():
+    """スプライン補間した年利を連続複利に変換した値と一致することを確認"""
+    remain_days = [15.3, 45.3, 75.3, 250.0]
+    spline = CubicSpline([30, 90, 180], [0.0042, 0.0048, 0.0055], bc_type="natural")
+    result = interpolate_interest_rate(DATA_INTEREST_RATE, remain_days)
+    assert list(result.keys()) == remain_days
+    for days, rate in result.items():
+        assert rate == pytest.approx(math.log(1 + spline(days)), rel=1e-12)
+
+
+def test_interest_rate_curve():
+    """既知の残存日数での金利・割引係数と配列での計算を確認"""
+    curve = InterestRateCurve(DATA_INTEREST_RATE)
+    np.testing.assert_allclose(curve.annual_rate(curve.days), curve.annual_rates)
+    np.testing.assert_allclose(curve.continuous_rate(curve.days), curve.continuous_rates)
+    np.testing.assert_allclose(curve.discount_factor(curve.days), curve.discount_factors)
+
+    remain_days = np.array([[10.0, 60.0], [120.0, 365.0]])
+    rates = curve.continuous_rate(remain_days)
+    assert rates.shape == remain_days.shape
+    np.testing.assert_allclose(
+        curve.discount_factor(remain_days), np.exp(-rates * remain_days / 365)
+    )
+
+
+def test_get_curve_cached():
+    """同じ金利データのカーブは作成済みのものを使うことを確認"""
+    curve = get_curve(dict(DATA_INTEREST_RATE))
+    assert get_curve(dict(DATA_INTEREST_RATE)) is curve
+    assert get_curve({30: 0.001, 90: 0.002, 180: 0.003}) is not curve
+
+
+@pytest.fixture
+def panel():
+    return InterestRatePanel(
+        pd.DataFrame(
+            {
+                "date": [datetime.date(2025, 3, 3), datetime.date(2025, 3, 5)],
+                "InterestRate1M": [0.0042, 0.0050],
+                "InterestRate3M": [0.0048, 0.0056],
+                "InterestRate6M": [0.0055, 0.0061],
+            }
+        )
+    )
+
+
+def test_interest_rate_panel(panel):
+    """評価日以前の最新の金利で補間した値が interpolate_interest_rate と一致することを確認"""
+    as_of = np.array(
+        ["2025-03-03T10:00", "2025-03-04", "2025-03-05", "2025-03-10"],
+        dtype="datetime64[ns]",
+    )
+    remain_days = np.array([10.0, 45.3, 200.0, 75.3])
+    rates = panel.continuous_rate(as_of, remain_days)
+
+    second = {30: 0.0050, 90: 0.0056, 180: 0.0061}
+    for i, data in enumerate([DATA_INTEREST_RATE, DATA_INTEREST_RATE, second, second]):
+        expected = interpolate_interest_rate(data, [remain_days[i]])[remain_days[i]]
+        assert rates[i] == pytest.approx(expected, rel=1e-12)
+
+    # 評価日×残存日数の格子もブロードキャストで計算できる
+    grid = panel.discount_factor(as_of[:, None], remain_days[None, :])
+    assert grid.shape == (4, 4)
+    np.testing.assert_allclose(
+        np.diag(grid), np.exp(-rates * remain_days / 365), rtol=1e-12
+    )
+
+
+def test_interest_rate_panel_errors(panel):
+    """金利データより前の評価日の扱いを確認"""
+    with pytest.raises(ValueError, match="金利データはありません"):
+        panel.continuous_rate(np.datetime64("2025-03-02"), 30)
+    rates = panel.continuous_rate(
+        np.array(["2025-03-02", "NaT", "2025-03-03"], dtype="datetime64[ns]"),
+        30,
+        errors="coerce",
+    )
+    assert np.isnan(rates[:2]).all() and rates[2] == pytest.approx(math.log1p(0.0042))
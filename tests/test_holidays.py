@@ -1,9 +1,11 @@
 from datetime import date, datetime
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from jpx_derivatives.holidays import is_holiday
+from jpx_derivatives.holidays import HolidayCalendar, get_calendar, is_holiday
 
 
 @pytest.mark.parametrize(
@@ -43,4 +45,121 @@ def test_is_holiday_no_args():
     mock_datetime = datetime(2024, 1, 6, 10, 0)
     with patch('jpx_derivatives.holidays.datetime') as mock_date:
         mock_date.now.return_value = mock_datetime
-        assert is_holiday() is True 
\ No newline at end of file
+        assert is_holiday() is True 
+
+@pytest.fixture
+def calendar():
+    return HolidayCalendar(["2024-01-01", "2024-01-02", "2024-01-08"])
+
+
+def test_holiday_calendar_is_holiday(calendar):
+    """休業日カレンダーの配列での休日判定が is_holiday と一致することを確認"""
+    days = np.arange("2024-01-01", "2024-02-01", dtype="datetime64[D]")
+    expected = [is_holiday(day.item()) for day in days]
+    assert list(get_calendar().is_holiday(days)) == expected
+
+    # 日時は日付部分で判定し、timezone付きの場合は日本時間に変換する
+    assert calendar.is_holiday(np.datetime64("2024-01-02T23:59"))
+    assert not calendar.is_holiday(pd.Timestamp("2024-01-02 15:00", tz="UTC"))
+    assert calendar.covers(2024) and not calendar.covers(2025)
+
+
+def test_holiday_calendar_business_days(calendar):
+    """営業日の加算・営業日数・前後の営業日を確認"""
+    days = np.array(["2023-12-29", "2024-01-01", "2024-01-05"], dtype="datetime64[D]")
+    assert list(calendar.next_business_day(days)) == list(
+        np.array(["2024-01-03", "2024-01-03", "2024-01-09"], dtype="datetime64[D]")
+    )
+    assert list(calendar.previous_business_day(days)) == list(
+        np.array(["2023-12-28", "2023-12-29", "2024-01-04"], dtype="datetime64[D]")
+    )
+    assert calendar.add_business_days("2024-01-03", 3) == np.datetime64("2024-01-09")
+    assert list(calendar.business_days_between(days, "2024-01-10")) == [5, 4, 2]
+
+
+@pytest.fixture
+def offline_holidays(tmp_path, monkeypatch):
+    """休業日データをtmp_pathに置き、取得元をローカルの関数に差し替える"""
+    import jpx_derivatives.holidays as holidays
+
+    source = pd.read_parquet(holidays.data_dir / "holidays.parquet")["Date"]
+    source.to_frame().to_parquet(tmp_path / "holidays.parquet")
+    calls = []
+
+    def fetch():
+        calls.append(datetime.now())
+        return pd.concat(
+            [source, pd.Series(pd.to_datetime(["2030-01-01", "2030-01-02"]))]
+        )
+
+    monkeypatch.setattr(holidays, "data_dir", tmp_path)
+    monkeypatch.setattr(holidays, "_calendar", None)
+    monkeypatch.setattr(holidays, "_missing_years", set())
+    monkeypatch.setattr(holidays, "_stale_lookups", 0)
+    monkeypatch.setattr(holidays, "_last_attempt", float("-inf"))
+    monkeypatch.setattr(holidays, "_last_refresh", None)
+    holidays.set_data_source(fetch)
+    mode = holidays.get_refresh_mode()
+    yield calls
+    if holidays._refresh_thread is not None:
+        holidays._refresh_thread.join()
+    holidays.set_data_source(None)
+    holidays.set_refresh_mode(mode)
+    monkeypatch.undo()
+    holidays._calendar = None
+
+
+def test_is_holiday_background_refresh(offline_holidays):
+    """データのない年は現在のカレンダーで即座に判定し、バックグラウンドで更新することを確認"""
+    import jpx_derivatives.holidays as holidays
+
+    holidays.set_refresh_mode("background")
+    # 更新前は土日のみで判定する
+    assert is_holiday(date(2030, 1, 1)) is False
+    status = holidays.get_refresh_status()
+    assert status.missing_years == (2030,)
+    assert status.stale_lookups == 1
+
+    holidays.refresh_in_background().join()
+    assert len(offline_holidays) == 1
+    assert is_holiday(date(2030, 1, 1)) is True
+    status = holidays.get_refresh_status()
+    assert status.missing_years == ()
+    assert status.last_refresh is not None and status.last_error is None
+
+
+def test_is_holiday_refresh_modes(offline_holidays):
+    """sync は取得してから判定し、off は取得しないことを確認"""
+    import jpx_derivatives.holidays as holidays
+
+    holidays.set_refresh_mode("off")
+    assert is_holiday(date(2030, 1, 2)) is False
+    assert offline_holidays == []
+
+    holidays.set_refresh_mode("sync")
+    assert is_holiday(date(2030, 1, 2)) is True
+    assert len(offline_holidays) == 1
+
+    with pytest.raises(ValueError, match="modeは"):
+        holidays.set_refresh_mode("always")
+
+
+def test_is_holiday_refresh_failure(offline_holidays):
+    """更新に失敗してもエラーにならず、状況に記録されることを確認"""
+    import jpx_derivatives.holidays as holidays
+
+    def fail():
+        raise ConnectionError("offline")
+
+    holidays.set_refresh_mode("background")
+    holidays.set_data_source(fail)
+    assert is_holiday(date(2030, 1, 1)) is False
+    holidays._refresh_thread.join()
+    status = holidays.get_refresh_status()
+    assert "offline" in status.last_error
+    assert status.missing_years == (2030,)
+
+    # 再試行までの間は更新しない
+    thread = holidays._refresh_thread
+    assert is_holiday(date(2030, 1, 1)) is False
+    assert holidays._refresh_thread is thread
@@ -0,0 +1,142 @@
+import datetime
+import shutil
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from jpx_derivatives import holidays, reference_bundle
+from jpx_derivatives.client import HttpsStaticDataProvider, LocalStaticDataProvider
+from jpx_derivatives.config import data_dir
+from jpx_derivatives.reference_bundle import (
+    BUNDLE_ENV,
+    BUNDLE_TABLES,
+    ReferenceBundle,
+    build_bundle,
+    get_bundle,
+    has_table,
+    read_table,
+)
+
+
+@pytest.fixture
+def bundle_dir(tmp_path, monkeypatch):
+    """data_dir のparquetファイルとバンドルを置いたディレクトリ"""
+    monkeypatch.delenv(BUNDLE_ENV, raising=False)
+    for name in BUNDLE_TABLES:
+        shutil.copyfile(data_dir / f"{name}.parquet", tmp_path / f"{name}.parquet")
+    build_bundle(directory=tmp_path)
+    return tmp_path
+
+
+def test_build_and_open(bundle_dir):
+    """バンドルの各テーブルがparquetファイルと一致することを確認"""
+    bundle = ReferenceBundle(bundle_dir / "reference.bundle")
+    assert set(bundle.tables) == set(BUNDLE_TABLES)
+    for name in BUNDLE_TABLES:
+        assert bundle.table(name).equals(pq.read_table(bundle_dir / f"{name}.parquet"))
+        assert bundle.tables[name]["rows"] == bundle.table(name).num_rows
+        assert bundle.is_fresh(name, bundle_dir / f"{name}.parquet")
+
+    # 同じデータからは同じバージョンになる
+    rebuilt = ReferenceBundle(build_bundle(bundle_dir / "rebuilt.bundle", bundle_dir))
+    assert rebuilt.version == bundle.version
+
+
+def test_corrupted_bundle(bundle_dir):
+    """チェックサムが一致しない場合はエラーになり、get_bundleはparquetファイルに戻ることを確認"""
+    path = bundle_dir / "reference.bundle"
+    data = bytearray(path.read_bytes())
+    data[-100] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        ReferenceBundle(path)
+    assert get_bundle(bundle_dir) is None
+    assert read_table("holidays", bundle_dir).equals(
+        pq.read_table(bundle_dir / "holidays.parquet")
+    )
+
+    path.write_bytes(b"not a bundle" * 10)
+    with pytest.raises(ValueError):
+        ReferenceBundle(path)
+
+
+def test_stale_table_falls_back_to_parquet(bundle_dir):
+    """バンドル作成後にparquetファイルが更新された場合はparquetファイルを読み込むことを確認"""
+    source = bundle_dir / "holidays.parquet"
+    updated = pd.read_parquet(source).iloc[:10]
+    updated.to_parquet(source)
+
+    assert not get_bundle(bundle_dir).is_fresh("holidays", source)
+    assert read_table("holidays", bundle_dir).num_rows == 10
+    # 他のテーブルはバンドルから読み込む
+    assert read_table("special_quotation", bundle_dir) is get_bundle(bundle_dir).table(
+        "special_quotation"
+    )
+
+
+def test_bundle_only(bundle_dir, monkeypatch):
+    """parquetファイルがなくてもバンドルから読み込めることを確認"""
+    expected = pq.read_table(bundle_dir / "holidays.parquet")
+    for name in BUNDLE_TABLES:
+        (bundle_dir / f"{name}.parquet").unlink()
+
+    assert has_table("holidays", bundle_dir)
+    assert read_table("holidays", bundle_dir).equals(expected)
+
+    # 休業日カレンダーもバンドルから作成する
+    monkeypatch.setattr(holidays, "data_dir", bundle_dir)
+    monkeypatch.setattr(holidays, "_calendar", None)
+    monkeypatch.setattr(holidays, "_refresh_mode", "off")
+    calendar = holidays.get_calendar()
+    assert calendar.holiday_dates == holidays.HolidayCalendar.from_parquet(
+        data_dir / "holidays.parquet"
+    ).holiday_dates
+    assert not (bundle_dir / "holidays.parquet").exists()
+
+
+def test_bundle_env(bundle_dir, tmp_path_factory, monkeypatch):
+    """環境変数でバンドルのパスを指定できることを確認"""
+    other = tmp_path_factory.mktemp("other")
+    monkeypatch.setenv(BUNDLE_ENV, str(bundle_dir / "reference.bundle"))
+    assert get_bundle(other).path == bundle_dir / "reference.bundle"
+    assert has_table("interest_rate_torf", other)
+
+
+def test_bundle_reloaded_after_rebuild(bundle_dir):
+    """バンドルを作り直した場合は新しいバンドルを読み込むことを確認"""
+    bundle = get_bundle(bundle_dir)
+    assert get_bundle(bundle_dir) is bundle
+
+    source = bundle_dir / "holidays.parquet"
+    pd.read_parquet(source).iloc[:10].to_parquet(source)
+    build_bundle(directory=bundle_dir)
+    rebuilt = get_bundle(bundle_dir)
+    assert rebuilt is not bundle
+    assert rebuilt.version != bundle.version
+    assert rebuilt.table("holidays").num_rows == 10
+    # 更新前のバンドルは保持しない
+    assert [key[0] for key in reference_bundle._bundles].count(bundle.path) == 1
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_local_provider_reads_bundle(bundle_dir, memory_map):
+    """LocalStaticDataProviderがバンドルから読み込んだ結果がparquetファイルと一致することを確認"""
+    dt = datetime.datetime(2025, 3, 3)
+    expected = HttpsStaticDataProvider(3, dt)
+    expected.set_data(str(bundle_dir))
+    for name in BUNDLE_TABLES:
+        (bundle_dir / f"{name}.parquet").unlink()
+
+    provider = LocalStaticDataProvider(
+        3, dt, directory=bundle_dir, memory_map=memory_map
+    )
+    pd.testing.assert_frame_equal(
+        provider.get_contract_schedule(), expected.get_contract_schedule()
+    )
+    assert provider.get_interest_rates([10, 40, 70]) == expected.get_interest_rates(
+        [10, 40, 70]
+    )
+    # バンドルから読み込む場合はArrow IPCファイルを作成しない
+    assert not (bundle_dir / "arrow").exists()
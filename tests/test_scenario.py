@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives.bsm import price
+from jpx_derivatives.scenario import scenario_pnl
+
+
+@pytest.fixture
+def positions():
+    rng = np.random.default_rng(0)
+    n = 200
+    return pd.DataFrame(
+        {
+            "ContractMonth": rng.choice(["2025-03", "2025-04", "2025-06"], n),
+            "Strike": rng.choice(np.arange(35000.0, 42000.0, 250.0), n),
+            "Div": rng.integers(1, 3, n),
+            "Quantity": rng.integers(-10, 11, n),
+            "TimeToExpiry": rng.uniform(0.002, 0.3, n),
+            "Volatility": rng.uniform(0.15, 0.35, n),
+        }
+    )
+
+
+def test_scenario_pnl_matches_repricing(positions):
+    """シナリオ損益が個別の再評価と一致し、チャンクサイズに依存しないことを確認"""
+    s, r = 38790.0, 0.001
+    spot_shocks = np.linspace(-0.1, 0.1, 5)
+    vol_shocks = np.array([-0.05, 0.0, 0.05])
+    time_shocks = np.array([0.0, 1 / 365, 5 / 365])
+    result = scenario_pnl(positions, s, r, spot_shocks, vol_shocks, time_shocks, max_elements=1000)
+    assert result.pnl.shape == (5, 3, 3)
+    assert result.pnl_by_expiry.shape == (3, 5, 3, 3)
+    assert list(result.contract_months) == ["2025-03", "2025-04", "2025-06"]
+
+    k, div, q = positions["Strike"], positions["Div"], positions["Quantity"]
+    t, sigma = positions["TimeToExpiry"], positions["Volatility"]
+    base = price(s, k, t, r, sigma, div)
+    for i, ds in enumerate(spot_shocks):
+        for j, dv in enumerate(vol_shocks):
+            for l, dt in enumerate(time_shocks):
+                shocked = price(s * (1 + ds), k, np.maximum(t - dt, 0.0), r, sigma + dv, div)
+                pnl = q * (shocked - base)
+                assert result.pnl[i, j, l] == pytest.approx(pnl.sum(), rel=1e-9, abs=1e-6)
+                by_expiry = pnl.groupby(positions["ContractMonth"]).sum()
+                np.testing.assert_allclose(result.pnl_by_expiry[:, i, j, l], by_expiry.to_numpy(), rtol=1e-9, atol=1e-6)
+
+    default = scenario_pnl(positions, s, r, spot_shocks, vol_shocks, time_shocks)
+    np.testing.assert_allclose(default.pnl, result.pnl, rtol=1e-12, atol=1e-8)
+    np.testing.assert_allclose(result.pnl[2, 1, 0], 0.0, atol=1e-8)
+
+
+def test_scenario_pnl_missing_columns(positions):
+    """必要な列がない場合にエラーになることを確認"""
+    with pytest.raises(ValueError):
+        scenario_pnl(positions.drop(columns="Volatility"), 38790.0, 0.001, [0.0], [0.0], [0.0])
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives.session_schedule import SessionSchedule
+from jpx_derivatives.time_to_expiry import BUSINESS_DAYS_PER_YEAR, year_fraction
+from jpx_derivatives.trading_session import SESSION_CODES, TradingSession
+
+
+@pytest.fixture
+def schedule():
+    # 2024-11-04は振替休日、2024-11-05に取引時間を変更
+    return SessionSchedule("2024-10-31", "2024-11-06")
+
+
+def test_session_schedule_table(schedule):
+    """取引時間の変更前後のセッションと取引日を確認"""
+    frame = schedule.to_frame().set_index("Start")
+    assert (np.diff(schedule.start) > np.timedelta64(0)).all()
+
+    # 変更前: 日中は15:15まで、夜間は16:30から。金曜の夜間取引の取引日は翌営業日
+    row = frame.loc[pd.Timestamp("2024-11-01 15:10")]
+    assert row["Session"] == TradingSession.DAY_CLOSING
+    assert row["End"] == pd.Timestamp("2024-11-01 15:15")
+    row = frame.loc[pd.Timestamp("2024-11-01 16:30")]
+    assert row["Session"] == TradingSession.NIGHT
+    assert row["TradeDate"] == pd.Timestamp("2024-11-05")
+
+    # 変更後: 日中は15:45まで、夜間は17:00から
+    row = frame.loc[pd.Timestamp("2024-11-05 15:40")]
+    assert row["End"] == pd.Timestamp("2024-11-05 15:45")
+    assert pd.Timestamp("2024-11-05 17:00") in frame.index
+    assert SESSION_CODES[schedule.session[0]] == TradingSession.DAY
+
+
+def test_session_schedule_next_open_close(schedule):
+    """次の立会開始・終了時刻を確認"""
+    timestamps = np.array(
+        [
+            "2024-11-01T10:00",  # 日中取引中
+            "2024-11-01T15:12",  # 日中クロージング中
+            "2024-11-01T16:00",  # 立会時間外
+            "2024-11-02T12:00",  # 休日
+            "2024-11-06T18:00",  # 期間最後の夜間取引
+        ],
+        dtype="datetime64[ns]",
+    )
+    np.testing.assert_array_equal(
+        schedule.next_open(timestamps),
+        np.array(
+            [
+                "2024-11-01T16:30",
+                "2024-11-01T16:30",
+                "2024-11-01T16:30",
+                "2024-11-05T08:45",
+                "NaT",
+            ],
+            dtype="datetime64[ns]",
+        ),
+    )
+    np.testing.assert_array_equal(
+        schedule.next_close(timestamps),
+        np.array(
+            [
+                "2024-11-01T15:15",
+                "2024-11-01T15:15",
+                "2024-11-02T06:00",
+                "2024-11-05T15:45",
+                "2024-11-07T06:00",
+            ],
+            dtype="datetime64[ns]",
+        ),
+    )
+
+    with pytest.raises(ValueError, match="日時を指定してください"):
+        schedule.next_open(np.datetime64("2024-12-01T00:00"))
+
+
+def test_session_schedule_trading_time(schedule):
+    """2時点間の立会時間が立会時間ベースの残存期間と一致することを確認"""
+    start = np.datetime64("2024-11-05T09:00")
+    end = np.array(
+        ["2024-11-05T09:00", "2024-11-05T16:00", "2024-11-06T12:00"],
+        dtype="datetime64[ns]",
+    )
+    elapsed = schedule.trading_time_between(start, end)
+    assert list(elapsed / np.timedelta64(1, "m")) == [0, 405, 405 + 780 + 195]
+
+    minutes = year_fraction(start, end).trading_minutes * BUSINESS_DAYS_PER_YEAR * 1200
+    assert elapsed / np.timedelta64(1, "m") == pytest.approx(minutes)
+    assert schedule.trading_time_between(end[1], start) == -np.timedelta64(405, "m")
+
+    # 変更前の営業日は日中6.5時間、夜間13.5時間
+    day = schedule.trading_time_between(
+        np.datetime64("2024-10-31T06:00"), np.datetime64("2024-11-01T06:00")
+    )
+    assert day == np.timedelta64(20 * 60, "m")
+
+
+def test_session_schedule_non_business_end():
+    """終了日が休業日の場合も終了日の日時を扱えることを確認"""
+    # 2025-01-11は土曜日
+    schedule = SessionSchedule("2025-01-06", "2025-01-11")
+    timestamps = np.array(
+        ["2025-01-10T20:00", "2025-01-11T09:00", "2025-01-11T23:59"],
+        dtype="datetime64[ns]",
+    )
+    np.testing.assert_array_equal(
+        schedule.next_open(timestamps),
+        np.array(["NaT", "NaT", "NaT"], dtype="datetime64[ns]"),
+    )
+    np.testing.assert_array_equal(
+        schedule.next_close(timestamps),
+        np.array(["2025-01-11T06:00", "NaT", "NaT"], dtype="datetime64[ns]"),
+    )
+    # 金曜の夜間取引の残り（20:00から翌6:00まで）
+    elapsed = schedule.trading_time_between(timestamps[0], timestamps[1:])
+    assert list(elapsed / np.timedelta64(1, "m")) == [600, 600]
+
+    with pytest.raises(ValueError, match="日時を指定してください"):
+        schedule.next_open(np.datetime64("2025-01-12T00:01"))
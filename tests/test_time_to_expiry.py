@@ -0,0 +1,94 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives.session_schedule import SessionSchedule
+from jpx_derivatives.time_to_expiry import BUSINESS_DAYS_PER_YEAR, year_fraction
+
+
+def test_year_fraction_weekdays():
+    """平日のみの期間で暦日・営業日・立会時間ベースの残存期間が正しいことを確認"""
+    result = year_fraction(
+        np.datetime64("2025-01-06T09:00"), np.datetime64("2025-01-10T09:00")
+    )
+    assert result.calendar == pytest.approx(4 / 365)
+    assert result.business_days == pytest.approx(4 / BUSINESS_DAYS_PER_YEAR)
+    assert result.trading_minutes == pytest.approx(4 / BUSINESS_DAYS_PER_YEAR)
+
+
+def test_year_fraction_weekend_and_holiday_weights():
+    """土日・休日の重み付けと、休日を挟む立会時間が正しいことを確認"""
+    # 2025-01-13は成人の日
+    valuation = np.datetime64("2025-01-10T09:00")
+    expiry = np.datetime64("2025-01-14T09:00")
+    result = year_fraction(valuation, expiry)
+    assert result.business_days == pytest.approx(1 / BUSINESS_DAYS_PER_YEAR)
+    # 金曜の日中・夜間取引（土曜6時まで）と火曜の8:45-9:00
+    assert result.trading_minutes == pytest.approx(1200 / (1200 * BUSINESS_DAYS_PER_YEAR))
+
+    weighted = year_fraction(valuation, expiry, weekend_weight=0.5, holiday_weight=0.25)
+    assert weighted.business_days == pytest.approx(2.25 / BUSINESS_DAYS_PER_YEAR)
+
+
+def test_year_fraction_arrays_and_timezone():
+    """配列とtimezone付きのSQ日時をまとめて計算できることを確認"""
+    jst = datetime.timezone(datetime.timedelta(hours=9))
+    sq_days = [
+        pd.Timestamp("2025-02-14 09:00", tz=jst),
+        pd.Timestamp("2025-03-14 09:00", tz=jst),
+    ]
+    valuation = np.array(["2025-01-06T09:00", "2025-01-06T20:00"], dtype="datetime64[ns]")
+    result = year_fraction(valuation[:, None], np.array(sq_days, dtype=object)[None, :])
+    assert result.calendar.shape == (2, 2)
+    assert result.calendar[0, 0] == pytest.approx(39 / 365)
+    assert (result.trading_minutes[1] < result.trading_minutes[0]).all()
+    assert (np.diff(result.business_days, axis=1) > 0).all()
+
+
+def test_year_fraction_before_trading_hours_change():
+    """2024/11/5より前は変更前の取引時間で数え、SessionScheduleと一致することを確認"""
+    valuation = np.array(["2024-10-31T15:20", "2024-11-05T15:20"], dtype="datetime64[ns]")
+    expiry = valuation + np.timedelta64(85, "m")
+    minutes = year_fraction(valuation, expiry).trading_minutes * BUSINESS_DAYS_PER_YEAR * 1200
+    # 変更前は夜間取引が16:30から、変更後は15:20-15:45の日中取引のみ
+    assert minutes == pytest.approx([15, 25])
+
+    schedule = SessionSchedule("2024-10-01", "2024-11-30")
+    start = np.datetime64("2024-10-01T00:00") + np.arange(0, 60 * 24 * 50, 37, dtype="timedelta64[m]")
+    end = start + np.timedelta64(9 * 24 * 60 + 13, "m")
+    expected = schedule.trading_time_between(start, end) / np.timedelta64(1, "m")
+    minutes = year_fraction(start, end).trading_minutes * BUSINESS_DAYS_PER_YEAR * 1200
+    np.testing.assert_allclose(minutes, expected)
+
+
+def test_year_fraction_non_business_expiry_and_expired():
+    """満期日時が休業日・評価日時が満期日時より後の場合を確認"""
+    # 2025-01-13は成人の日。金曜10:00から月曜12:00までは金曜の日中・夜間取引のみ
+    result = year_fraction(
+        np.datetime64("2025-01-10T10:00"), np.datetime64("2025-01-13T12:00")
+    )
+    assert result.business_days == pytest.approx(1 / BUSINESS_DAYS_PER_YEAR)
+    assert result.trading_minutes == pytest.approx((345 + 780) / (1200 * BUSINESS_DAYS_PER_YEAR))
+
+    # 2025-03-15（土曜）の評価日時はSQ日時より後のためマイナス
+    valuation = np.array(["2025-03-13T10:00", "2025-03-15T10:00"], dtype="datetime64[ns]")
+    result = year_fraction(valuation, np.datetime64("2025-03-14T09:00"))
+    assert result.calendar == pytest.approx([23 / (365 * 24), -25 / (365 * 24)])
+    minutes = result.trading_minutes * BUSINESS_DAYS_PER_YEAR * 1200
+    # 木曜10:00-15:45、夜間17:00-6:00、金曜8:45-9:00 / 金曜9:00から土曜6:00まで
+    assert minutes == pytest.approx([345 + 780 + 15, -(405 + 780)])
+
+
+def test_year_fraction_nat():
+    """NaT の要素は NaN になることを確認"""
+    valuation = np.array(["2025-01-06T09:00", "NaT"], dtype="datetime64[ns]")
+    result = year_fraction(valuation, np.datetime64("2025-01-10T09:00"))
+    assert result.calendar[0] == pytest.approx(4 / 365)
+    assert result.business_days[0] == pytest.approx(4 / BUSINESS_DAYS_PER_YEAR)
+    assert result.trading_minutes[0] == pytest.approx(4 / BUSINESS_DAYS_PER_YEAR)
+    assert all(np.isnan(values[1]) for values in result)
+
+    result = year_fraction(np.datetime64("NaT"), np.datetime64("2025-01-10T09:00"))
+    assert all(np.isnan(values) for values in result)
@@ -1,13 +1,20 @@
 from datetime import datetime, time, timedelta
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from jpx_derivatives import (
+    SESSION_CODES,
     TradingSession,
     get_closing_time,
+    get_closing_times,
     get_current_session,
+    get_session_codes,
+    get_trade_dates,
     is_trading_hours,
+    is_trading_hours_array,
 )
 
 # テスト用設定
@@ -34,44 +41,44 @@ test_config = {
 def test_get_current_session_day(monkeypatch):
     """現在のセッション日を取得するテスト"""
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
-    dt = datetime(2023, 1, 1, 9, 0)  # 8:45-15:40の間
+    dt = datetime(2025, 1, 1, 9, 0)  # 8:45-15:40の間
     assert get_current_session(dt) == TradingSession.DAY
 
 
 def test_get_current_session_day_closing(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
-    dt = datetime(2023, 1, 1, 15, 42)  # 15:40-15:45の間
+    dt = datetime(2025, 1, 1, 15, 42)  # 15:40-15:45の間
     assert get_current_session(dt) == TradingSession.DAY_CLOSING
 
 
 def test_get_current_session_night(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # 17:00 は 夜間取引 (NIGHT)
-    dt = datetime(2023, 1, 1, 17, 0)
+    dt = datetime(2025, 1, 1, 17, 0)
     assert get_current_session(dt) == TradingSession.NIGHT
 
     # 翌日の 03:00 も NIGHT
-    dt = datetime(2023, 1, 2, 3, 0)
+    dt = datetime(2025, 1, 2, 3, 0)
     assert get_current_session(dt) == TradingSession.NIGHT
 
 
 def test_get_current_session_night_closing(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # 5:57 は 夜間クロージング (NIGHT_CLOSING)
-    dt = datetime(2023, 1, 1, 5, 57)
+    dt = datetime(2025, 1, 1, 5, 57)
     assert get_current_session(dt) == TradingSession.NIGHT_CLOSING
 
 
 def test_get_current_session_off_hours(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
-    dt = datetime(2023, 1, 1, 7, 0)  # 6:00-8:45の間
+    dt = datetime(2025, 1, 1, 7, 0)  # 6:00-8:45の間
     assert get_current_session(dt) == TradingSession.OFF_HOURS
 
 
 def test_get_closing_time_day(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # 日中取引の場合、day_closing.end (15:45) の当日日時
-    dt = datetime(2023, 1, 2, 10, 0)
+    dt = datetime(2025, 1, 2, 10, 0)
     closing = get_closing_time(dt)
     expected = datetime.combine(dt.date(), time(15, 45))
     assert closing == expected
@@ -80,7 +87,7 @@ def test_get_closing_time_day(monkeypatch):
 def test_get_closing_time_night_same_day(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # NIGHT セッションで、まだ夜間クロージング開始前の場合 (03:00)
-    dt = datetime(2023, 1, 3, 3, 0)
+    dt = datetime(2025, 1, 3, 3, 0)
     closing = get_closing_time(dt)
     expected = datetime.combine(dt.date(), time(6, 0))
     assert closing == expected
@@ -90,7 +97,7 @@ def test_get_closing_time_night_tomorrow(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # NIGHT セッションで、現在時刻が夜間クロージング開始後 (17:00)
     # ※この場合、クロージング日時は翌日の 06:00 となる
-    dt = datetime(2023, 1, 3, 17, 0)
+    dt = datetime(2025, 1, 3, 17, 0)
     closing = get_closing_time(dt)
     expected = datetime.combine(dt.date() + timedelta(days=1), time(6, 0))
     assert closing == expected
@@ -99,7 +106,7 @@ def test_get_closing_time_night_tomorrow(monkeypatch):
 def test_get_closing_time_night_closing(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
     # NIGHT_CLOSING の場合、当日の 06:00 を返す
-    dt = datetime(2023, 1, 3, 5, 57)
+    dt = datetime(2025, 1, 3, 5, 57)
     closing = get_closing_time(dt)
     expected = datetime.combine(dt.date(), time(6, 0))
     assert closing == expected
@@ -107,7 +114,7 @@ def test_get_closing_time_night_closing(monkeypatch):
 
 def test_get_closing_time_off_hours(monkeypatch):
     monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
-    dt = datetime(2023, 1, 3, 7, 0)
+    dt = datetime(2025, 1, 3, 7, 0)
     closing = get_closing_time(dt)
     assert closing is None
 
@@ -115,13 +122,13 @@ def test_get_closing_time_off_hours(monkeypatch):
 @pytest.mark.parametrize(
     "test_datetime,expected",
     [
-        (datetime(2024, 1, 4, 9, 0), True),    # 日中取引
-        (datetime(2024, 1, 4, 15, 42), True),  # 日中クロージング
-        (datetime(2024, 1, 4, 17, 30), True),  # 夜間取引
-        (datetime(2024, 1, 5, 5, 57), True),   # 夜間クロージング
-        (datetime(2024, 1, 4, 7, 0), False),   # 立会時間外
-        (datetime(2024, 1, 1, 10, 0), False),  # 休日
-        (datetime(2024, 1, 6, 10, 0), False),  # 土曜日
+        (datetime(2025, 1, 6, 9, 0), True),    # 日中取引
+        (datetime(2025, 1, 6, 15, 42), True),  # 日中クロージング
+        (datetime(2025, 1, 6, 17, 30), True),  # 夜間取引
+        (datetime(2025, 1, 7, 5, 57), True),   # 夜間クロージング
+        (datetime(2025, 1, 6, 7, 0), False),   # 立会時間外
+        (datetime(2025, 1, 1, 10, 0), False),  # 休日
+        (datetime(2025, 1, 11, 10, 0), False),  # 土曜日
     ],
 )
 def test_is_trading_hours(test_datetime, expected, monkeypatch):
@@ -132,13 +139,117 @@ def test_is_trading_hours(test_datetime, expected, monkeypatch):
 
 def test_is_trading_hours_no_args(monkeypatch):
     """引数なしで現在時刻の取引可能時間判定ができることを確認"""
-    mock_datetime = datetime(2024, 1, 4, 9, 0)  # 取引時間内
+    mock_datetime = datetime(2025, 1, 6, 9, 0)  # 取引時間内
     with patch('jpx_derivatives.trading_session.datetime') as mock_date:
         mock_date.now.return_value = mock_datetime
         monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
         assert is_trading_hours() is True
 
-    mock_datetime = datetime(2024, 1, 1, 9, 0)  # 休日
+    mock_datetime = datetime(2025, 1, 1, 9, 0)  # 休日
     with patch('jpx_derivatives.trading_session.datetime') as mock_date:
         mock_date.now.return_value = mock_datetime
         assert is_trading_hours() is False
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        ("2023-12-29", "2024-01-06"),
+        ("2024-10-31", "2024-11-07"),  # 取引時間の変更前後
+    ],
+)
+def test_session_arrays_match_scalar(start, end):
+    """配列版の判定が1件ずつの判定と一致することを確認"""
+    timestamps = pd.date_range(start, end, freq="7min").to_numpy()
+    codes = get_session_codes(timestamps)
+    closing = get_closing_times(timestamps)
+    trading = is_trading_hours_array(timestamps)
+    assert codes.dtype == np.uint8
+
+    for i, value in enumerate(timestamps):
+        dt = pd.Timestamp(value).to_pydatetime()
+        assert SESSION_CODES[codes[i]] == get_current_session(dt)
+        expected = get_closing_time(dt)
+        if expected is None:
+            assert np.isnat(closing[i])
+        else:
+            assert closing[i] == np.datetime64(expected)
+        assert trading[i] == is_trading_hours(dt)
+
+
+def test_session_arrays_input_types(monkeypatch):
+    """int64・timezone付き・NaTの入力と設定の差し替えを確認"""
+    monkeypatch.setattr("jpx_derivatives.trading_session.load_trading_hours", lambda: test_config)
+    timestamps = np.array(
+        ["2025-01-06T09:00", "2025-01-06T17:30", "NaT"], dtype="datetime64[ns]"
+    )
+    expected = [TradingSession.DAY, TradingSession.NIGHT, TradingSession.OFF_HOURS]
+    assert [SESSION_CODES[c] for c in get_session_codes(timestamps)] == expected
+    assert [SESSION_CODES[c] for c in get_session_codes(timestamps.view(np.int64))] == expected
+    assert list(is_trading_hours_array(timestamps)) == [True, True, False]
+
+    # UTC 0:00 は日本時間 9:00
+    utc = pd.DatetimeIndex(["2025-01-06 00:00"], tz="UTC")
+    assert SESSION_CODES[get_session_codes(utc)[0]] == TradingSession.DAY
+    assert get_closing_times(utc)[0] == np.datetime64("2025-01-06T15:45")
+
+
+def test_session_arrays_before_trading_hours_change():
+    """2024/11/5より前の日時は変更前の取引時間で判定することを確認"""
+    timestamps = np.array(
+        [
+            "2024-11-01T15:12",  # 変更前の日中クロージング
+            "2024-11-01T15:20",  # 変更前は立会時間外
+            "2024-11-01T16:45",  # 変更前の夜間取引
+            "2024-11-05T15:20",  # 変更後は日中取引
+            "2024-11-05T16:45",  # 変更後は立会時間外
+        ],
+        dtype="datetime64[ns]",
+    )
+    assert [SESSION_CODES[c] for c in get_session_codes(timestamps)] == [
+        TradingSession.DAY_CLOSING,
+        TradingSession.OFF_HOURS,
+        TradingSession.NIGHT,
+        TradingSession.DAY,
+        TradingSession.OFF_HOURS,
+    ]
+    np.testing.assert_array_equal(
+        get_closing_times(timestamps),
+        np.array(
+            ["2024-11-01T15:15", "NaT", "2024-11-02T06:00", "2024-11-05T15:45", "NaT"],
+            dtype="datetime64[ns]",
+        ),
+    )
+    assert list(is_trading_hours_array(timestamps)) == [True, False, True, True, False]
+    for value, code in zip(timestamps, get_session_codes(timestamps)):
+        assert get_current_session(pd.Timestamp(value).to_pydatetime()) == SESSION_CODES[code]
+
+
+def test_get_trade_dates():
+    """夜間取引の日時が翌営業日の取引日になることを確認"""
+    timestamps = np.array(
+        [
+            "2024-11-01T10:00",  # 日中取引
+            "2024-11-01T16:30",  # 変更前の夜間取引開始（翌営業日は振替休日明けの11/5）
+            "2024-11-02T03:00",  # 土曜早朝の夜間取引
+            "2024-11-05T16:30",  # 変更後は17:00まで当日
+            "2024-11-05T17:00",
+            "2024-11-03T12:00",  # 休日
+            "NaT",
+        ],
+        dtype="datetime64[ns]",
+    )
+    expected = np.array(
+        [
+            "2024-11-01",
+            "2024-11-05",
+            "2024-11-05",
+            "2024-11-05",
+            "2024-11-06",
+            "2024-11-05",
+            "NaT",
+        ],
+        dtype="datetime64[D]",
+    )
+    np.testing.assert_array_equal(get_trade_dates(timestamps), expected)
+    np.testing.assert_array_equal(get_trade_dates(timestamps.view(np.int64)), expected)
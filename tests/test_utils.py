@@ -0,0 +1,52 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives.utils import atomic_write, to_datetime64
+
+
+def test_to_datetime64():
+    """timezoneのない日時は日本時間、timezoneのある日時は日本時間に変換されることを確認"""
+    expected = np.array(
+        ["2025-01-06T09:00", "2025-01-06T17:00"], dtype="datetime64[ns]"
+    )
+    jst = datetime.timezone(datetime.timedelta(hours=9))
+    inputs = [
+        expected,
+        ["2025-01-06 09:00", "2025-01-06 17:00"],
+        [datetime.datetime(2025, 1, 6, 9), datetime.datetime(2025, 1, 6, 17)],
+        [
+            datetime.datetime(2025, 1, 6, 9, tzinfo=jst),
+            datetime.datetime(2025, 1, 6, 17, tzinfo=jst),
+        ],
+        pd.DatetimeIndex(["2025-01-06 00:00", "2025-01-06 08:00"], tz="UTC"),
+    ]
+    for values in inputs:
+        result = to_datetime64(values)
+        assert result.dtype == np.dtype("datetime64[ns]")
+        np.testing.assert_array_equal(result, expected)
+
+    # 入力と同じ形で返す
+    assert to_datetime64(np.array([["2025-01-06"]])).shape == (1, 1)
+
+
+def test_atomic_write(tmp_path):
+    """書き込みが完了した場合のみファイルが置き換わり、一時ファイルが残らないことを確認"""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as tmp:
+            tmp.write_bytes(b"partial")
+            raise RuntimeError
+    assert path.read_bytes() == b"old"
+
+    # 同時に書き込んでも一時ファイルは重ならない
+    with atomic_write(path) as first, atomic_write(path) as second:
+        assert first != second
+        first.write_bytes(b"first")
+        second.write_bytes(b"second")
+    assert path.read_bytes() == b"first"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.bin"]
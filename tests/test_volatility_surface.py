@@ -0,0 +1,106 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jpx_derivatives import bsm
+from jpx_derivatives.volatility_surface import MISSING_STATUS, VolatilitySurface
+
+
+class FakeClient:
+    """限月・SQ日・金利を固定値で返すテスト用クライアント"""
+
+    def __init__(self):
+        jst = datetime.timezone(datetime.timedelta(hours=9))
+        self.sq_days = [
+            pd.Timestamp("2025-03-14 09:00", tz=jst),
+            pd.Timestamp("2025-04-11 09:00", tz=jst),
+        ]
+        self.remaining_days = None
+
+    def get_contract_months(self):
+        return ["2025-03", "2025-04"]
+
+    def get_special_quotation_days(self):
+        return self.sq_days
+
+    def get_interest_rates(self, remaining_days):
+        self.remaining_days = remaining_days
+        return [0.001, 0.002]
+
+
+@pytest.fixture
+def quotes():
+    s = 38790.0
+    strikes = np.array([37500.0, 38750.0, 40000.0])
+    contract_month = np.repeat(["2025-03", "2025-04"], 6)
+    strike = np.tile(np.repeat(strikes, 2), 2)
+    div = np.tile([1, 2], 6)
+    t = np.where(contract_month == "2025-03", 0.05, 0.13)
+    r = np.where(contract_month == "2025-03", 0.001, 0.002)
+    sigma = 0.18 + strike / 1e6
+    price = bsm.price(s, strike, t, r, sigma, div)
+    return s, contract_month, strike, div, price, sigma
+
+
+def test_surface_solves_all_quotes(quotes):
+    """全オプションのIVが限月×行使価格の配列に格納されることを確認"""
+    s, contract_month, strike, div, price, sigma = quotes
+    surface = VolatilitySurface(
+        s, ["2025-03", "2025-04"], [0.05, 0.13], [0.001, 0.002], contract_month, strike, div, price
+    )
+    assert surface.iv.shape == (2, 2, 3)
+    assert surface.iv.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(surface.smile("2025-04", 2), 0.18 + surface.strikes / 1e6, atol=1e-6)
+    assert surface.get("2025-03", 38750.0, 1) == pytest.approx(0.18 + 38750.0 / 1e6, abs=1e-6)
+    assert (surface.status == bsm.IVStatus.CONVERGED).all()
+    with pytest.raises(KeyError):
+        surface.get("2025-05", 38750.0, 1)
+
+
+def test_surface_unknown_contract_month(quotes):
+    """サーフェスにない限月のオプションはエラーになることを確認"""
+    s, contract_month, strike, div, price, _ = quotes
+    with pytest.raises(ValueError):
+        VolatilitySurface(s, ["2025-03"], [0.05], [0.001], contract_month, strike, div, price)
+
+
+def test_surface_missing_and_invalid_quotes(quotes):
+    """価格のないセルと不正な価格を区別できることを確認"""
+    s, contract_month, strike, div, price, _ = quotes
+    price = price.copy()
+    price[0] = np.nan
+    surface = VolatilitySurface(
+        s, ["2025-03", "2025-04"], [0.05, 0.13], [0.001, 0.002],
+        contract_month[:-1], strike[:-1], div[:-1], price[:-1],
+    )
+    # 2025-03 37500 プットは不正な価格、2025-04 40000 コールは価格なし
+    assert surface.status[0, 0, 0] == bsm.IVStatus.INVALID
+    assert surface.quoted[0, 0, 0]
+    assert surface.status[1, 1, 2] == MISSING_STATUS
+    assert not surface.quoted[1, 1, 2]
+    assert surface.quoted.sum() == 11
+
+
+def test_surface_duplicate_quotes(quotes):
+    """同じ限月・行使価格・種類の価格が重複している場合はエラーになることを確認"""
+    s, contract_month, strike, div, price, _ = quotes
+    with pytest.raises(ValueError, match="重複"):
+        VolatilitySurface(
+            s, ["2025-03", "2025-04"], [0.05, 0.13], [0.001, 0.002],
+            np.append(contract_month, "2025-03"), np.append(strike, 38750.0),
+            np.append(div, 2), np.append(price, 500.0),
+        )
+
+
+def test_surface_from_client(quotes):
+    """クライアントからSQまでの残存期間と金利を取得してサーフェスを作成することを確認"""
+    s, contract_month, strike, div, price, _ = quotes
+    client = FakeClient()
+    dt = datetime.datetime(2025, 2, 14, 9, 0)
+    surface = VolatilitySurface.from_client(client, s, contract_month, strike, div, price, dt=dt)
+    assert client.remaining_days == [28.0, 56.0]
+    np.testing.assert_allclose(surface.time_to_sq, [28.0 / 365, 56.0 / 365])
+    np.testing.assert_allclose(surface.interest_rates, [0.001, 0.002])
+    assert np.isfinite(surface.iv).all()